@@ -6,11 +6,16 @@ This script demonstrates:
 1. Converting CSVs to Excel
 2. Unioning multiple CSVs
 3. Joining CSVs on a key
+
+The demos are independent and run concurrently on a small thread pool.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pandas as pd
+
 # Add src to path for development
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
@@ -30,114 +35,144 @@ print("iLoveExcel Demo Script")
 print("=" * 60)
 print()
 
-# ============================================================================
-# Demo 1: Convert multiple CSVs to Excel workbook
-# ============================================================================
-print("Demo 1: Converting CSVs to Excel workbook...")
-print("-" * 60)
+EMPLOYEES_FILE = EXAMPLE_DIR / 'employees.csv'
+PROJECTS_FILE = EXAMPLE_DIR / 'projects.csv'
 
-csv_files = [
+CSV_FILES = [
     EXAMPLE_DIR / 'sample1.csv',
     EXAMPLE_DIR / 'sample2.csv',
 ]
 
-output_excel = OUTPUT_DIR / 'combined.xlsx'
 
-iLoveExcel.csvs_to_excel(
-    csv_files=csv_files,
-    output_path=output_excel,
-    sheet_names=['People_1', 'People_2']
-)
+# ============================================================================
+# Demo 1: Convert multiple CSVs to Excel workbook
+# ============================================================================
+def demo_csvs_to_excel(sample_dfs):
+    output_excel = OUTPUT_DIR / 'combined.xlsx'
+    
+    iLoveExcel.csvs_to_excel(
+        csv_files=CSV_FILES,
+        output_path=output_excel,
+        sheet_names=['People_1', 'People_2'],
+        dataframes=sample_dfs
+    )
+    
+    return [f"✓ Created {output_excel}"]
 
-print(f"✓ Created {output_excel}")
-print()
 
 # ============================================================================
 # Demo 2: Union multiple CSVs
 # ============================================================================
-print("Demo 2: Unioning multiple CSVs...")
-print("-" * 60)
-
-union_output = OUTPUT_DIR / 'all_people.csv'
-
-iLoveExcel.union_multiple_csvs(
-    files=csv_files,
-    output_csv=union_output,
-    dedupe=False,  # Keep all rows including duplicates
-    progress=True
-)
+def demo_union(sample_dfs):
+    union_output = OUTPUT_DIR / 'all_people.csv'
+    
+    iLoveExcel.union_multiple_csvs(
+        files=CSV_FILES,
+        output_csv=union_output,
+        dedupe=False,  # Keep all rows including duplicates
+        progress=False,
+        dataframes=sample_dfs
+    )
+    
+    return [f"✓ Created {union_output}"]
 
-print(f"✓ Created {union_output}")
-print()
 
 # ============================================================================
 # Demo 3: Join two CSVs on a key
 # ============================================================================
-print("Demo 3: Joining CSVs (inner join on 'id')...")
-print("-" * 60)
-
-employees_file = EXAMPLE_DIR / 'employees.csv'
-projects_file = EXAMPLE_DIR / 'projects.csv'
-join_output = OUTPUT_DIR / 'employee_projects.csv'
-
-result_df = iLoveExcel.join_csvs(
-    file_left=employees_file,
-    file_right=projects_file,
-    on='id',
-    how='inner',
-    output_file=join_output
-)
-
-print(f"✓ Created {join_output}")
-print(f"  Result has {len(result_df)} rows and {len(result_df.columns)} columns")
-print(f"  Columns: {list(result_df.columns)}")
-print()
+def demo_inner_join(employees, projects):
+    join_output = OUTPUT_DIR / 'employee_projects.csv'
+    
+    result_df = iLoveExcel.join_csvs(
+        file_left=EMPLOYEES_FILE,
+        file_right=PROJECTS_FILE,
+        on='id',
+        how='inner',
+        output_file=join_output,
+        df_left=employees,
+        df_right=projects
+    )
+    
+    return [
+        f"✓ Created {join_output}",
+        f"  Result has {len(result_df)} rows and {len(result_df.columns)} columns",
+        f"  Columns: {list(result_df.columns)}",
+    ]
+
 
 # ============================================================================
 # Demo 4: Join with 'left' join type
 # ============================================================================
-print("Demo 4: Left join (keep all employees)...")
-print("-" * 60)
+def demo_left_join(employees, projects):
+    left_join_output = OUTPUT_DIR / 'employee_projects_left.csv'
+    
+    result_df = iLoveExcel.join_csvs(
+        file_left=EMPLOYEES_FILE,
+        file_right=PROJECTS_FILE,
+        on='id',
+        how='left',
+        output_file=left_join_output,
+        df_left=employees,
+        df_right=projects
+    )
+    
+    return [
+        f"✓ Created {left_join_output}",
+        f"  Result has {len(result_df)} rows",
+    ]
 
-left_join_output = OUTPUT_DIR / 'employee_projects_left.csv'
 
-result_df = iLoveExcel.join_csvs(
-    file_left=employees_file,
-    file_right=projects_file,
-    on='id',
-    how='left',
-    output_file=left_join_output
-)
+# ============================================================================
+# Demo 5: Union with deduplication
+# ============================================================================
+def demo_union_dedupe():
+    # Create a file with some duplicate rows
+    duplicate_file = OUTPUT_DIR / 'sample_with_dupes.csv'
+    with open(duplicate_file, 'w') as f:
+        f.write("id,name,age,city\n")
+        f.write("1,Alice,28,New York\n")  # Duplicate from sample1
+        f.write("11,Kelly,30,Austin\n")
+        f.write("12,Leo,36,Columbus\n")
+    
+    union_dedupe_output = OUTPUT_DIR / 'all_people_dedupe.csv'
+    
+    iLoveExcel.union_csvs(
+        file_a=CSV_FILES[0],
+        file_b=duplicate_file,
+        output_file=union_dedupe_output,
+        dedupe=True  # Remove duplicates
+    )
+    
+    return [f"✓ Created {union_dedupe_output} (with deduplication)"]
 
-print(f"✓ Created {left_join_output}")
-print(f"  Result has {len(result_df)} rows")
-print()
 
 # ============================================================================
-# Demo 5: Union with deduplication
+# Run the demos
 # ============================================================================
-print("Demo 5: Union with deduplication...")
-print("-" * 60)
-
-# Create a file with some duplicate rows
-duplicate_file = OUTPUT_DIR / 'sample_with_dupes.csv'
-with open(duplicate_file, 'w') as f:
-    f.write("id,name,age,city\n")
-    f.write("1,Alice,28,New York\n")  # Duplicate from sample1
-    f.write("11,Kelly,30,Austin\n")
-    f.write("12,Leo,36,Columbus\n")
-
-union_dedupe_output = OUTPUT_DIR / 'all_people_dedupe.csv'
-
-iLoveExcel.union_csvs(
-    file_a=csv_files[0],
-    file_b=duplicate_file,
-    output_file=union_dedupe_output,
-    dedupe=True  # Remove duplicates
-)
-
-print(f"✓ Created {union_dedupe_output} (with deduplication)")
-print()
+# Load shared inputs once; the demos are independent, so they run concurrently
+# (pandas releases the GIL for most of its CSV parsing and writing)
+sample_dfs = {path: pd.read_csv(path) for path in CSV_FILES}
+employees = pd.read_csv(EMPLOYEES_FILE)
+projects = pd.read_csv(PROJECTS_FILE)
+
+demos = [
+    ("Demo 1: Converting CSVs to Excel workbook...", demo_csvs_to_excel, (sample_dfs,)),
+    ("Demo 2: Unioning multiple CSVs...", demo_union, (sample_dfs,)),
+    ("Demo 3: Joining CSVs (inner join on 'id')...", demo_inner_join, (employees, projects)),
+    ("Demo 4: Left join (keep all employees)...", demo_left_join, (employees, projects)),
+    ("Demo 5: Union with deduplication...", demo_union_dedupe, ()),
+]
+
+with ThreadPoolExecutor(max_workers=4) as executor:
+    futures = [executor.submit(func, *args) for _, func, args in demos]
+    
+    # Report in demo order, regardless of completion order
+    for (title, _, _), future in zip(demos, futures):
+        print(title)
+        print("-" * 60)
+        for line in future.result():
+            print(line)
+        print()
 
 # ============================================================================
 # Summary
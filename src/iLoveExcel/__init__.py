@@ -9,54 +9,69 @@ __version__ = '0.1.0'
 __author__ = 'iLoveExcel Contributors'
 __license__ = 'MIT'
 
-# Import main functionality for easy access
-from .io import (
-    read_csv_chunked,
-    write_csv,
-    read_excel_sheet,
-    get_excel_sheet_names,
-    csvs_to_excel,
-    write_dataframes_to_excel,
-)
+import importlib
 
-from .unions import (
-    union_csvs,
-    union_multiple_csvs,
-    union_csvs_with_validation,
-)
+# Public functions are re-exported lazily (PEP 562) so that importing the
+# package, e.g. for `--help`, does not pull in pandas and openpyxl.
+_LAZY_EXPORTS = {
+    # I/O functions
+    'read_csv_chunked': '.io',
+    'write_csv': '.io',
+    'read_excel_sheet': '.io',
+    'get_excel_sheet_names': '.io',
+    'csvs_to_excel': '.io',
+    'write_dataframes_to_excel': '.io',
+    
+    # Union functions
+    'union_csvs': '.unions',
+    'union_multiple_csvs': '.unions',
+    'union_csvs_with_validation': '.unions',
+    
+    # Join functions
+    'join_csvs': '.joins',
+    'join_excel_sheets': '.joins',
+    'join_excel_sheets_to_file': '.joins',
+    'join_multiple_csvs_sequential': '.joins',
+    
+    # Excel merge functions
+    'merge_excel_files': '.excel_merge',
+    'merge_excel_sheets_by_name': '.excel_merge',
+    'merge_excel_common_sheets_only': '.excel_merge',
+    'get_common_sheets': '.excel_merge',
+    
+    # Utilities
+    'setup_logging': '.utils',
+    'validate_join_type': '.utils',
+    'safe_sheet_name': '.utils',
+    
+    # CSV Diff functions (v0.1.0+)
+    'diff_csv_side_by_side': '.diffs',
+    'diff_dataframes': '.diffs',
+    'export_diff_to_excel': '.diffs',
+    'diff_csv_to_excel_streaming': '.diffs',
+    
+    # Auto-width functions (v0.1.0+)
+    'apply_auto_column_width': '.io_helpers',
+    'apply_auto_width_to_writer': '.io_helpers',
+    'get_optimal_column_widths': '.io_helpers',
+    'get_column_widths_from_dataframe': '.io_helpers',
+}
 
-from .joins import (
-    join_csvs,
-    join_excel_sheets,
-    join_excel_sheets_to_file,
-    join_multiple_csvs_sequential,
-)
 
-from .excel_merge import (
-    merge_excel_files,
-    merge_excel_sheets_by_name,
-    merge_excel_common_sheets_only,
-    get_common_sheets,
-)
+def __getattr__(name):
+    """Import the submodule providing a public function on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-from .utils import (
-    setup_logging,
-    validate_join_type,
-    safe_sheet_name,
-)
 
-# New features (v0.1.0+)
-from .diffs import (
-    diff_csv_side_by_side,
-    export_diff_to_excel,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-from .io_helpers import (
-    apply_auto_column_width,
-    apply_auto_width_to_writer,
-    get_optimal_column_widths,
-    get_column_widths_from_dataframe,
-)
 
 __all__ = [
     # Version info
@@ -96,7 +111,9 @@ __all__ = [
     
     # CSV Diff functions (v0.1.0+)
     'diff_csv_side_by_side',
+    'diff_dataframes',
     'export_diff_to_excel',
+    'diff_csv_to_excel_streaming',
     
     # Auto-width functions (v0.1.0+)
     'apply_auto_column_width',
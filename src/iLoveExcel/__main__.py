@@ -8,8 +8,6 @@ import sys
 import logging
 import os
 
-from .utils import setup_logging
-
 
 def check_tkinter_available():
     """
@@ -33,7 +31,7 @@ def launch_gui_entry_point():
     Falls back to PySimpleGUI if specified via --gui-backend flag or ILOVEEXCEL_GUI env var.
     """
     try:
-        setup_logging(level='INFO')
+        # Logging is configured by main_gui once the GUI actually starts
         logger = logging.getLogger(__name__)
         
         # Check for backend selection
@@ -137,7 +135,7 @@ def main():
     Starts the GUI interface with PySimpleGUI (legacy entry point, backwards compatible).
     """
     try:
-        setup_logging(level='INFO')
+        # Logging is configured by main_gui once the GUI actually starts
         logger = logging.getLogger(__name__)
         logger.info("Starting iLoveExcel GUI (legacy entry point)...")
         
@@ -12,12 +12,11 @@ from typing import List, Optional
 import click
 
 from . import __version__
-from .excel_merge import merge_excel_files, merge_excel_sheets_by_name
-from .io import csvs_to_excel
-from .joins import join_csvs, join_excel_sheets_to_file
-from .unions import union_csvs, union_multiple_csvs
 from .utils import setup_logging, validate_join_type, parse_column_list
 
+# Backends (pandas/openpyxl) are imported inside each command so that
+# `--help` and every single command only load what they actually use.
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,6 +53,8 @@ def csv_to_excel(csv_files: tuple, output: str, sheet_names: Optional[str]):
         if sheet_list and len(sheet_list) != len(csv_list):
             raise click.BadParameter(f"Number of sheet names ({len(sheet_list)}) must match number of CSV files ({len(csv_list)})")
         
+        from .io import csvs_to_excel
+        
         click.echo(f"Converting {len(csv_list)} CSV files to Excel...")
         csvs_to_excel(csv_list, output, sheet_list)
         click.echo(f"✓ Created {output}")
@@ -81,6 +82,8 @@ def union(file_a: str, file_b: str, output: str, dedupe: bool, dedupe_columns: O
     try:
         dedupe_cols = parse_column_list(dedupe_columns) if dedupe_columns else None
         
+        from .unions import union_csvs
+        
         click.echo(f"Unioning {file_a} and {file_b}...")
         union_csvs(file_a, file_b, output, dedupe=dedupe, dedupe_columns=dedupe_cols)
         click.echo(f"✓ Created {output}")
@@ -109,6 +112,8 @@ def union_multiple(csv_files: tuple, output: str, dedupe: bool, dedupe_columns:
         csv_list = list(csv_files)
         dedupe_cols = parse_column_list(dedupe_columns) if dedupe_columns else None
         
+        from .unions import union_multiple_csvs
+        
         click.echo(f"Unioning {len(csv_list)} CSV files...")
         union_multiple_csvs(
             csv_list,
@@ -150,6 +155,8 @@ def join(file_left: str, file_right: str, output: str, on: str, how: str):
         # If only one key, use string instead of list
         join_on = join_keys[0] if len(join_keys) == 1 else join_keys
         
+        from .joins import join_csvs
+        
         click.echo(f"Joining {file_left} and {file_right} on {join_on} ({how} join)...")
         join_csvs(file_left, file_right, on=join_on, how=how, output_file=output)
         click.echo(f"✓ Created {output}")
@@ -195,6 +202,8 @@ def join_excel_sheets(input_file: str, output: str, sheet_left: str, sheet_right
         except ValueError:
             pass  # Keep as string
         
+        from .joins import join_excel_sheets_to_file
+        
         click.echo(f"Joining sheets '{sheet_left}' and '{sheet_right}' from {input_file}...")
         join_excel_sheets_to_file(
             input_file, output, sheet_left, sheet_right,
@@ -212,7 +221,9 @@ def join_excel_sheets(input_file: str, output: str, sheet_left: str, sheet_right
 @click.option('-o', '--output', required=True, type=click.Path(), help='Output Excel file path')
 @click.option('--mode', type=click.Choice(['strict', 'lenient']), default='lenient', 
               help='strict: require identical columns, lenient: union columns (default)')
-def merge_excel(excel_files: tuple, output: str, mode: str):
+@click.option('--workers', type=int, default=None,
+              help='Worker processes for merging sheets (default: one per CPU, 1 = serial)')
+def merge_excel(excel_files: tuple, output: str, mode: str, workers: Optional[int]):
     """
     Merge multiple Excel files by combining sheets with the same name.
     
@@ -223,8 +234,10 @@ def merge_excel(excel_files: tuple, output: str, mode: str):
     try:
         excel_list = list(excel_files)
         
+        from .excel_merge import merge_excel_files
+        
         click.echo(f"Merging {len(excel_list)} Excel files in '{mode}' mode...")
-        merge_excel_files(excel_list, output, mode=mode, progress=True)
+        merge_excel_files(excel_list, output, mode=mode, progress=True, max_workers=workers)
         click.echo(f"✓ Created {output}")
     except Exception as e:
         logger.error(f"Error: {e}")
@@ -247,6 +260,8 @@ def merge_sheet(excel_files: tuple, output: str, sheet: str, mode: str):
     try:
         excel_list = list(excel_files)
         
+        from .excel_merge import merge_excel_sheets_by_name
+        
         click.echo(f"Merging sheet '{sheet}' from {len(excel_list)} Excel files...")
         merge_excel_sheets_by_name(excel_list, sheet, output, mode=mode)
         click.echo(f"✓ Created {output}")
@@ -5,16 +5,26 @@ This module provides functions to compare two CSV/Excel files side-by-side
 and generate diff reports with highlighting.
 """
 
+import gc
+import importlib.util
 import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Font, Alignment
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.styles import PatternFill, Font, NamedStyle
+from openpyxl.utils import get_column_letter
 
-from .io import read_csv_chunked
+from .io import _PANDAS_CALAMINE, _read_xlsx, read_csv_chunked
+from .utils import safe_sheet_name
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +37,53 @@ COLORS = {
     'header': 'D9D9D9',     # Light gray
 }
 
+# Styles are immutable, so one shared instance per color is reused for every cell
+_FILLS = {
+    name: PatternFill(start_color=color, end_color=color, fill_type='solid')
+    for name, color in COLORS.items()
+}
+_STATUS_FILLS = {
+    'MATCH': _FILLS['match'],
+    'DIFF': _FILLS['diff'],
+    'ONLY_A': _FILLS['only_a'],
+    'ONLY_B': _FILLS['only_b'],
+}
+
+# Named styles registered once per exported workbook; header cells refer to
+# them by name so the file stores a single style record for each
+_HEADER_STYLE = 'diff_header'
+_LABEL_STYLE = 'diff_label'
+
+# Row statuses, stored as a categorical 'Status' column in this order
+STATUS_CATEGORIES = ['MATCH', 'DIFF', 'ONLY_A', 'ONLY_B']
+_STATUS_CODES = {status: code for code, status in enumerate(STATUS_CATEGORIES)}
+
+# Use pyarrow's multithreaded CSV parser when it is installed (optional)
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+# Write unhighlighted reports in bulk with PyExcelerate when it is installed (optional)
+_HAS_PYEXCELERATE = importlib.util.find_spec('pyexcelerate') is not None
+
+# Cell count above which the comparison is split into row slabs across threads
+PARALLEL_COMPARE_CELLS = 1_000_000
+
+# Loaded size above which a diff forces a garbage collection once the raw
+# frames are no longer needed
+GC_COLLECT_BYTES = 500_000_000
+
+# "Only in" sheets longer than this are spilled to a separate workbook
+SPILL_SHEET_ROWS = 100_000
+
+# Compression suffixes pandas infers for CSV reads (e.g. data.csv.gz)
+_CSV_COMPRESSION_SUFFIXES = ('.gz', '.bz2', '.zip', '.xz', '.zst')
+
+# Number of parsed input files kept by diff_csv_side_by_side(use_cache=True):
+# the most recent file A and file B
+FILE_CACHE_SIZE = 2
+
+# (resolved path, mtime_ns, size, max_rows) -> parsed DataFrame
+_file_cache: 'OrderedDict[Tuple, pd.DataFrame]' = OrderedDict()
+
 
 def diff_csv_side_by_side(
     file_a: Union[str, Path],
@@ -38,6 +95,7 @@ def diff_csv_side_by_side(
     ignore_column_order: bool = False,
     show_only_diffs: bool = False,
     max_rows: Optional[int] = None,
+    use_cache: bool = False,
 ) -> Tuple[pd.DataFrame, Dict[str, int]]:
     """
     Compare two CSV/Excel files side-by-side.
@@ -52,10 +110,14 @@ def diff_csv_side_by_side(
         ignore_column_order: Match columns by name regardless of order
         show_only_diffs: Return only rows with differences
         max_rows: Maximum number of rows to process (None = unlimited)
+        use_cache: Keep the parsed files (the last FILE_CACHE_SIZE, keyed by
+                   path, modification time and size) so comparing the same
+                   unchanged files again with other options skips parsing
     
     Returns:
         Tuple of (diff_dataframe, stats_dict)
-        - diff_dataframe: DataFrame with columns suffixed _A and _B, plus 'Status' column
+        - diff_dataframe: DataFrame with columns suffixed _A and _B, plus a categorical
+          'Status' column (MATCH, DIFF, ONLY_A or ONLY_B)
         - stats_dict: Dictionary with 'total', 'matching', 'different', 'only_a', 'only_b'
     
     Raises:
@@ -72,21 +134,83 @@ def diff_csv_side_by_side(
     
     logger.info(f"Comparing {file_a} vs {file_b}")
     
-    # Read files
-    df_a = _read_file(file_a, max_rows)
-    df_b = _read_file(file_b, max_rows)
+    # Read files straight into the comparison, which then holds the only
+    # references and can release them before comparing (unless cached)
+    read = _read_file_cached if use_cache else _read_file
+    return _diff_frames(
+        read(file_a, max_rows),
+        read(file_b, max_rows),
+        key_columns=key_columns,
+        compare_by_index=compare_by_index,
+        ignore_whitespace=ignore_whitespace,
+        case_insensitive=case_insensitive,
+        ignore_column_order=ignore_column_order,
+        show_only_diffs=show_only_diffs,
+    )
+
+
+def diff_dataframes(
+    df_a: pd.DataFrame,
+    df_b: pd.DataFrame,
+    key_columns: Optional[List[str]] = None,
+    compare_by_index: bool = True,
+    ignore_whitespace: bool = False,
+    case_insensitive: bool = False,
+    ignore_column_order: bool = False,
+    show_only_diffs: bool = False,
+) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """
+    Compare two already-loaded DataFrames side-by-side.
+    
+    Same comparison as diff_csv_side_by_side(), for callers that already
+    hold the data. df_a and df_b are not modified.
+    
+    Args:
+        df_a: First (left) DataFrame
+        df_b: Second (right) DataFrame
+        key_columns: List of column names to use as key for alignment (if compare_by_index=False)
+        compare_by_index: If True, compare by row index; if False, use key_columns
+        ignore_whitespace: Strip whitespace before comparison
+        case_insensitive: Ignore case when comparing strings
+        ignore_column_order: Match columns by name regardless of order
+        show_only_diffs: Return only rows with differences
     
-    logger.info(f"File A: {len(df_a)} rows, {len(df_a.columns)} columns")
-    logger.info(f"File B: {len(df_b)} rows, {len(df_b.columns)} columns")
+    Returns:
+        Tuple of (diff_dataframe, stats_dict), as for diff_csv_side_by_side()
     
-    # Preprocess data
-    if ignore_whitespace:
-        df_a = _strip_whitespace(df_a)
-        df_b = _strip_whitespace(df_b)
+    Raises:
+        ValueError: If key_columns not found
+    """
+    return _diff_frames(
+        df_a,
+        df_b,
+        key_columns=key_columns,
+        compare_by_index=compare_by_index,
+        ignore_whitespace=ignore_whitespace,
+        case_insensitive=case_insensitive,
+        ignore_column_order=ignore_column_order,
+        show_only_diffs=show_only_diffs,
+    )
+
+
+def _diff_frames(
+    df_a: pd.DataFrame,
+    df_b: pd.DataFrame,
+    key_columns: Optional[List[str]],
+    compare_by_index: bool,
+    ignore_whitespace: bool,
+    case_insensitive: bool,
+    ignore_column_order: bool,
+    show_only_diffs: bool,
+) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """Shared body of diff_csv_side_by_side() and diff_dataframes()."""
+    logger.info(f"A: {len(df_a)} rows, {len(df_a.columns)} columns")
+    logger.info(f"B: {len(df_b)} rows, {len(df_b.columns)} columns")
     
-    if case_insensitive:
-        df_a = _lowercase_strings(df_a)
-        df_b = _lowercase_strings(df_b)
+    # Preprocess data
+    if ignore_whitespace or case_insensitive:
+        df_a = _normalize_strings(df_a, ignore_whitespace, case_insensitive)
+        df_b = _normalize_strings(df_b, ignore_whitespace, case_insensitive)
     
     # Align dataframes
     if compare_by_index:
@@ -96,6 +220,14 @@ def diff_csv_side_by_side(
             raise ValueError("key_columns must be provided when compare_by_index=False")
         df_a_aligned, df_b_aligned = _align_by_key(df_a, df_b, key_columns, ignore_column_order)
     
+    # The raw frames are dead weight from here on; release them before the
+    # comparison allocates its masks and the result frame (unless the caller
+    # still holds them)
+    loaded_bytes = int(df_a.memory_usage(deep=False).sum() + df_b.memory_usage(deep=False).sum())
+    del df_a, df_b
+    if loaded_bytes > GC_COLLECT_BYTES:
+        gc.collect()
+    
     # Perform comparison
     diff_df, stats = _compare_dataframes(df_a_aligned, df_b_aligned, show_only_diffs)
     
@@ -120,6 +252,11 @@ def export_diff_to_excel(
     - Sheet 3: Rows only in A
     - Sheet 4: Rows only in B
     
+    "Only in" sheets longer than SPILL_SHEET_ROWS rows are written to their own
+    workbook next to output_path (``<stem>_only_a.xlsx`` / ``<stem>_only_b.xlsx``)
+    and linked from the sheet instead. Without highlighting, the report is
+    written in bulk with PyExcelerate when it is installed.
+    
     Args:
         diff_df: DataFrame returned by diff_csv_side_by_side()
         stats: Stats dictionary from diff_csv_side_by_side()
@@ -133,11 +270,38 @@ def export_diff_to_excel(
     
     logger.info(f"Exporting diff to Excel: {output_path}")
     
-    wb = Workbook()
+    # Row positions per status in one pass; only the "only in" rows are
+    # copied out (MATCH/DIFF, the bulk of a large diff, are never materialized)
+    positions = diff_df.groupby('Status', observed=True, sort=False).indices
+    
+    # Oversized "only in" sheets go to their own workbook and the report just
+    # links to it; spill_rows holds that link in place of the data
+    only_sheets = []
+    for status, name, suffix in (('ONLY_A', file_a_name, 'only_a'), ('ONLY_B', file_b_name, 'only_b')):
+        title = f"Only in {name}"
+        only_df = diff_df.take(positions.get(status, []))
+        spill_rows = None
+        if len(only_df) > SPILL_SHEET_ROWS:
+            spill_path = output_path.with_name(f"{output_path.stem}_{suffix}.xlsx")
+            _write_spill_workbook(spill_path, title, only_df)
+            spill_rows = [
+                [f"{len(only_df)} rows written to a separate workbook:"],
+                [f'=HYPERLINK("{spill_path.name}", "{spill_path.name}")'],
+            ]
+            only_df = None
+        only_sheets.append((title, only_df, spill_rows))
+    
+    if not highlight and _HAS_PYEXCELERATE:
+        _export_with_pyexcelerate(output_path, diff_df, stats, file_a_name, file_b_name, only_sheets)
+        logger.info(f"Exported diff to {output_path}")
+        return
+    
+    # Write-only workbooks stream rows to disk instead of building a cell DOM
+    wb = Workbook(write_only=True)
+    _register_named_styles(wb)
     
     # Sheet 1: Side-by-side comparison
-    ws_main = wb.active
-    ws_main.title = "Comparison"
+    ws_main = wb.create_sheet("Comparison")
     
     if highlight:
         _write_comparison_sheet_with_highlights(ws_main, diff_df, file_a_name, file_b_name)
@@ -148,18 +312,125 @@ def export_diff_to_excel(
     ws_summary = wb.create_sheet("Summary")
     _write_summary_sheet(ws_summary, stats, file_a_name, file_b_name)
     
-    # Sheet 3: Rows only in A
-    ws_only_a = wb.create_sheet(f"Only in {file_a_name}")
-    only_a_df = diff_df[diff_df['Status'] == 'ONLY_A']
-    _write_dataframe_to_sheet(ws_only_a, only_a_df)
+    # Sheets 3 and 4: Rows only in A / only in B
+    for title, only_df, spill_rows in only_sheets:
+        ws_only = wb.create_sheet(title)
+        if spill_rows is not None:
+            for row in spill_rows:
+                ws_only.append(row)
+        else:
+            _write_dataframe_to_sheet(ws_only, only_df)
+    
+    wb.save(output_path)
+    logger.info(f"Exported diff to {output_path}")
+
+
+def diff_csv_to_excel_streaming(
+    file_a: Union[str, Path],
+    file_b: Union[str, Path],
+    output_path: Union[str, Path],
+    chunksize: int = 65536,
+    ignore_whitespace: bool = False,
+    case_insensitive: bool = False,
+    ignore_column_order: bool = False,
+    show_only_diffs: bool = False,
+    file_a_name: str = "File A",
+    file_b_name: str = "File B",
+    highlight: bool = True,
+) -> Dict[str, int]:
+    """
+    Compare two CSV files by row index and write the Excel report chunk by chunk.
+    
+    Produces the same workbook as diff_csv_side_by_side(compare_by_index=True)
+    followed by export_diff_to_excel(), but only chunksize rows of each file
+    are in memory at a time, so memory use does not grow with file size.
+    
+    Args:
+        file_a: Path to first CSV file (left)
+        file_b: Path to second CSV file (right)
+        output_path: Path to output Excel file
+        chunksize: Number of rows compared and written per chunk
+        ignore_whitespace: Strip whitespace before comparison
+        case_insensitive: Ignore case when comparing strings
+        ignore_column_order: Match columns by name regardless of order
+        show_only_diffs: Write only rows with differences to the comparison sheet
+        file_a_name: Display name for file A
+        file_b_name: Display name for file B
+        highlight: Whether to apply color highlighting
+    
+    Returns:
+        Stats dictionary with 'total', 'matching', 'different', 'only_a', 'only_b'
+    
+    Raises:
+        FileNotFoundError: If either file doesn't exist
+    """
+    file_a = Path(file_a)
+    file_b = Path(file_b)
+    output_path = Path(output_path)
+    
+    if not file_a.exists():
+        raise FileNotFoundError(f"File A not found: {file_a}")
+    if not file_b.exists():
+        raise FileNotFoundError(f"File B not found: {file_b}")
+    
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Streaming comparison of {file_a} vs {file_b} -> {output_path} (chunksize={chunksize})")
+    
+    # The column layout only depends on the headers
+    empty_a = read_csv_chunked(file_a, nrows=0)
+    empty_b = read_csv_chunked(file_b, nrows=0)
+    columns = _aligned_columns(empty_a, empty_b, ignore_column_order)
+    header = ['Row_Index', 'Status'] + [f'{col}_{side}' for col in columns for side in ('A', 'B')]
+    
+    wb = Workbook(write_only=True)
+    _register_named_styles(wb)
+    ws_main = wb.create_sheet("Comparison")
+    ws_summary = wb.create_sheet("Summary")
+    ws_only = {
+        'ONLY_A': wb.create_sheet(f"Only in {file_a_name}"),
+        'ONLY_B': wb.create_sheet(f"Only in {file_b_name}"),
+    }
+    ws_main.append([_styled_cell(ws_main, h, _HEADER_STYLE) for h in header] if highlight else header)
+    for ws in ws_only.values():
+        ws.append([_styled_cell(ws, h, _LABEL_STYLE) for h in header])
+    
+    stats = dict.fromkeys(('total', 'matching', 'different', 'only_a', 'only_b'), 0)
+    written = 0
+    
+    # read_csv keeps counting the index across chunks, so each pair of chunks
+    # aligns on the same row numbers; the shorter file yields empty chunks
+    chunks = zip_longest(
+        read_csv_chunked(file_a, chunksize=chunksize),
+        read_csv_chunked(file_b, chunksize=chunksize),
+    )
+    for chunk_a, chunk_b in chunks:
+        chunk_a = empty_a if chunk_a is None else chunk_a
+        chunk_b = empty_b if chunk_b is None else chunk_b
+        if ignore_whitespace or case_insensitive:
+            chunk_a = _normalize_strings(chunk_a, ignore_whitespace, case_insensitive)
+            chunk_b = _normalize_strings(chunk_b, ignore_whitespace, case_insensitive)
+        
+        aligned_a, aligned_b = _align_by_index(chunk_a, chunk_b, ignore_column_order)
+        chunk_diff, chunk_stats = _compare_dataframes(aligned_a, aligned_b, show_only_diffs)
+        for key, value in chunk_stats.items():
+            stats[key] += value
+        
+        for row in _iter_sheet_rows(chunk_diff):
+            ws_main.append(row)
+        written += len(chunk_diff)
+        
+        for status, ws in ws_only.items():
+            for row in _iter_sheet_rows(chunk_diff[chunk_diff['Status'] == status]):
+                ws.append(row)
     
-    # Sheet 4: Rows only in B
-    ws_only_b = wb.create_sheet(f"Only in {file_b_name}")
-    only_b_df = diff_df[diff_df['Status'] == 'ONLY_B']
-    _write_dataframe_to_sheet(ws_only_b, only_b_df)
+    if highlight:
+        _add_status_highlights(ws_main, header, written)
+    _write_summary_sheet(ws_summary, stats, file_a_name, file_b_name)
     
     wb.save(output_path)
+    logger.info(f"Comparison stats: {stats}")
     logger.info(f"Exported diff to {output_path}")
+    return stats
 
 
 # ============================================================================
@@ -167,34 +438,86 @@ def export_diff_to_excel(
 # ============================================================================
 
 def _read_file(file_path: Path, max_rows: Optional[int] = None) -> pd.DataFrame:
-    """Read CSV or Excel file."""
-    if file_path.suffix.lower() == '.csv':
+    """Read CSV (optionally compressed, e.g. .csv.gz) or Excel file."""
+    if _is_csv_path(file_path):
+        # Uses pyarrow's multithreaded parser when available
         df = read_csv_chunked(file_path, chunksize=None)
-    else:  # Excel
+    elif _PANDAS_CALAMINE:
+        # One extra row, as in _read_xlsx, so truncation is still detected
+        df = pd.read_excel(file_path, engine='calamine', nrows=None if max_rows is None else max_rows + 1)
+    elif file_path.suffix.lower() in ('.xlsx', '.xlsm'):
+        df = _read_xlsx(file_path, max_rows=max_rows)
+    else:  # Legacy Excel formats
         df = pd.read_excel(file_path)
     
     if max_rows is not None and len(df) > max_rows:
-        logger.warning(f"Truncating {file_path} from {len(df)} to {max_rows} rows")
+        logger.warning(f"Truncating {file_path} to the first {max_rows} rows")
         df = df.head(max_rows)
     
     return df
 
 
-def _strip_whitespace(df: pd.DataFrame) -> pd.DataFrame:
-    """Strip whitespace from string columns."""
-    df = df.copy()
-    for col in df.columns:
-        if df[col].dtype == 'object':
-            df[col] = df[col].astype(str).str.strip()
+def _is_csv_path(file_path: Path) -> bool:
+    """True for .csv files and compressed CSVs such as .csv.gz (not e.g. report.csv.xlsx)."""
+    suffixes = [suffix.lower() for suffix in file_path.suffixes[-2:]]
+    return suffixes[-1:] == ['.csv'] or (
+        suffixes[:1] == ['.csv'] and suffixes[-1] in _CSV_COMPRESSION_SUFFIXES
+    )
+
+
+def _read_file_cached(file_path: Path, max_rows: Optional[int] = None) -> pd.DataFrame:
+    """
+    _read_file() with the last FILE_CACHE_SIZE results kept in memory.
+    
+    Entries are keyed by the file's modification time and size, so an edited
+    file is parsed again. Callers must not modify the returned DataFrame.
+    """
+    stat = file_path.stat()
+    key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size, max_rows)
+    
+    df = _file_cache.get(key)
+    if df is not None:
+        _file_cache.move_to_end(key)
+        logger.info(f"Using cached copy of {file_path}")
+        return df
+    
+    df = _read_file(file_path, max_rows)
+    _file_cache[key] = df
+    while len(_file_cache) > FILE_CACHE_SIZE:
+        _file_cache.popitem(last=False)
     return df
 
 
-def _lowercase_strings(df: pd.DataFrame) -> pd.DataFrame:
-    """Convert string columns to lowercase."""
-    df = df.copy()
-    for col in df.columns:
-        if df[col].dtype == 'object':
-            df[col] = df[col].astype(str).str.lower()
+def _normalize_strings(df: pd.DataFrame, strip: bool, lower: bool) -> pd.DataFrame:
+    """
+    Strip and/or lowercase the string columns of df in a single pass.
+    
+    Numeric columns are neither touched nor copied; the string columns are
+    replaced in a single assignment on one shallow copy. Object columns are
+    converted to the string dtype (Arrow-backed when pyarrow is installed)
+    instead of astype(str), so missing values stay missing rather than
+    becoming "nan", and .str.strip()/.str.lower() run as vectorized kernels.
+    """
+    str_cols = [
+        col for col, dtype in df.dtypes.items()
+        if dtype == object or pd.api.types.is_string_dtype(dtype)
+    ]
+    if not str_cols:
+        return df
+    
+    string_dtype = pd.StringDtype('pyarrow' if _HAS_PYARROW else 'python')
+    
+    def normalize(s: pd.Series) -> pd.Series:
+        if s.dtype == object:
+            s = s.astype(string_dtype)
+        if strip:
+            s = s.str.strip()
+        if lower:
+            s = s.str.lower()
+        return s
+    
+    df = df.copy(deep=False)
+    df[str_cols] = df[str_cols].apply(normalize)
     return df
 
 
@@ -204,27 +527,27 @@ def _align_by_index(
     ignore_column_order: bool
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Align dataframes by row index."""
-    # Align columns
+    columns = _aligned_columns(df_a, df_b, ignore_column_order)
+    
+    # One C-level reindex per frame; sort=True keeps the rows sorted even when
+    # both indexes are equal, and two default RangeIndexes union to a range.
+    # copy=False hands back the input's data when nothing needs reindexing
+    index = df_a.index.union(df_b.index, sort=True)
+    return (
+        df_a.reindex(index=index, columns=columns, copy=False),
+        df_b.reindex(index=index, columns=columns, copy=False),
+    )
+
+
+def _aligned_columns(
+    df_a: pd.DataFrame,
+    df_b: pd.DataFrame,
+    ignore_column_order: bool
+) -> pd.Index:
+    """Return the shared column layout: sorted common columns, or A's columns plus B's extras."""
     if ignore_column_order:
-        common_cols = sorted(set(df_a.columns) & set(df_b.columns))
-        df_a = df_a[common_cols]
-        df_b = df_b[common_cols]
-    else:
-        # Use columns from A, fill missing with NaN
-        all_cols = list(df_a.columns)
-        for col in df_b.columns:
-            if col not in all_cols:
-                all_cols.append(col)
-        
-        df_a = df_a.reindex(columns=all_cols)
-        df_b = df_b.reindex(columns=all_cols)
-    
-    # Align rows by index
-    all_indices = sorted(set(df_a.index) | set(df_b.index))
-    df_a = df_a.reindex(all_indices)
-    df_b = df_b.reindex(all_indices)
-    
-    return df_a, df_b
+        return df_a.columns.intersection(df_b.columns).sort_values()
+    return df_a.columns.union(df_b.columns, sort=False)
 
 
 def _align_by_key(
@@ -241,32 +564,140 @@ def _align_by_key(
         if col not in df_b.columns:
             raise ValueError(f"Key column '{col}' not found in file B")
     
-    # Perform outer merge on key columns
-    df_a_keyed = df_a.copy()
-    df_b_keyed = df_b.copy()
-    
-    # Add row number for tracking
-    df_a_keyed['_row_a'] = range(len(df_a))
-    df_b_keyed['_row_b'] = range(len(df_b))
-    
-    merged = pd.merge(
-        df_a_keyed,
-        df_b_keyed,
+    # Align columns the same way as _align_by_index; every non-key column
+    # then exists on both sides, so the merge suffixes all of them
+    columns = _aligned_columns(df_a, df_b, ignore_column_order)
+    df_a = df_a.reindex(columns=columns, copy=False)
+    df_b = df_b.reindex(columns=columns, copy=False)
+    
+    # Unique, non-missing keys (the usual case) are aligned by position: look
+    # each side's keys up in the sorted key union and gather rows with one
+    # reindex per frame, with no merge and no column suffixing
+    key_a = _key_index(df_a, key_columns)
+    key_b = _key_index(df_b, key_columns)
+    if (key_a.is_unique and key_b.is_unique
+            and not df_a[key_columns].isna().to_numpy().any()
+            and not df_b[key_columns].isna().to_numpy().any()):
+        union = key_a.union(key_b)
+        if not union.is_monotonic_increasing:
+            # union() skips sorting when the sides are equal or one is empty;
+            # sort like the outer merge does (unorderable keys stay as they are)
+            try:
+                union = union.sort_values()
+            except TypeError:
+                pass
+        return (
+            _gather_rows(df_a, union.get_indexer(key_a), len(union)),
+            _gather_rows(df_b, union.get_indexer(key_b), len(union)),
+        )
+    
+    # Duplicate or missing keys need merge semantics (many-to-many, NaN
+    # matching NaN): one hashed outer join; the indicator records which side each row came from
+    merged = df_a.merge(
+        df_b,
         on=key_columns,
         how='outer',
-        suffixes=('_a', '_b'),
-        indicator=True
+        suffixes=('_A', '_B'),
+        indicator='_src'
     )
+    in_a = merged['_src'] != 'right_only'
+    in_b = merged['_src'] != 'left_only'
+    
+    # Split back into A and B; keys are blanked on the side missing the row so
+    # the comparison reports it as ONLY_A / ONLY_B
+    key_set = set(key_columns)
+    df_a_aligned = pd.DataFrame({
+        c: merged[c].where(in_a) if c in key_set else merged[f'{c}_A'] for c in columns
+    })
+    df_b_aligned = pd.DataFrame({
+        c: merged[c].where(in_b) if c in key_set else merged[f'{c}_B'] for c in columns
+    })
     
-    # Separate back into A and B
-    df_a_aligned = merged[[c for c in merged.columns if c.endswith('_a') or c in key_columns or c == '_merge']]
-    df_b_aligned = merged[[c for c in merged.columns if c.endswith('_b') or c in key_columns or c == '_merge']]
+    return df_a_aligned, df_b_aligned
+
+
+def _key_index(df: pd.DataFrame, key_columns: List[str]) -> pd.Index:
+    """Return the key values of df as an Index (a MultiIndex for several keys)."""
+    if len(key_columns) == 1:
+        return pd.Index(df[key_columns[0]])
+    return pd.MultiIndex.from_frame(df[key_columns])
+
+
+def _gather_rows(df: pd.DataFrame, positions: np.ndarray, length: int) -> pd.DataFrame:
+    """
+    Place row i of df at positions[i] of a frame with length rows.
     
-    # Clean up column names
-    df_a_aligned.columns = [c.replace('_a', '') for c in df_a_aligned.columns]
-    df_b_aligned.columns = [c.replace('_b', '') for c in df_b_aligned.columns]
+    Rows no entry maps to are left entirely blank (keys included), so the
+    comparison reports them as ONLY_A / ONLY_B.
+    """
+    source = np.full(length, -1, dtype=np.intp)
+    source[positions] = np.arange(len(df))
     
-    return df_a_aligned, df_b_aligned
+    # -1 is not a label of the RangeIndex, so reindex fills those rows with NaN
+    gathered = df.reset_index(drop=True).reindex(source)
+    gathered.index = pd.RangeIndex(length)
+    return gathered
+
+
+def _compare_values(
+    values_a: np.ndarray,
+    values_b: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the cell-difference mask and both missing-value masks."""
+    na_a = pd.isna(values_a)
+    na_b = pd.isna(values_b)
+    
+    # Cells differ unless both are missing or both hold equal values
+    return (values_a != values_b) & ~(na_a & na_b), na_a, na_b
+
+
+def _status_codes(df_a: pd.DataFrame, df_b: pd.DataFrame) -> np.ndarray:
+    """Return the int8 status code of every row of two aligned dataframes."""
+    # Identical frames (e.g. regression outputs) need no cell comparison;
+    # equals() treats NaN in the same position as equal, like the code below
+    if df_a.equals(df_b):
+        return np.full(len(df_a), _STATUS_CODES['MATCH'], dtype=np.int8)
+    
+    # Plain NumPy frames that are all-integer or share one numeric dtype compare
+    # natively (NumPy releases the GIL); anything else falls back to object
+    # arrays for mixed-dtype semantics
+    dtypes = set(df_a.dtypes) | set(df_b.dtypes)
+    native = bool(dtypes) and all(isinstance(dtype, np.dtype) for dtype in dtypes) and (
+        all(dtype.kind == 'i' for dtype in dtypes)
+        or (len(dtypes) == 1 and pd.api.types.is_numeric_dtype(dtypes.pop()))
+    )
+    if native:
+        values_a = df_a.to_numpy()
+        values_b = df_b.to_numpy()
+    else:
+        # pd.NA from nullable/Arrow columns has no truth value; use NaN instead
+        values_a = df_a.to_numpy(dtype=object, na_value=np.nan)
+        values_b = df_b.to_numpy(dtype=object, na_value=np.nan)
+    
+    workers = min(os.cpu_count() or 1, len(values_a))
+    if values_a.size > PARALLEL_COMPARE_CELLS and workers > 1:
+        # Compare row slabs concurrently and stitch the masks back together
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            slabs = list(executor.map(
+                _compare_values,
+                np.array_split(values_a, workers),
+                np.array_split(values_b, workers),
+            ))
+        cell_diff, na_a, na_b = (np.concatenate(parts) for parts in zip(*slabs))
+    else:
+        cell_diff, na_a, na_b = _compare_values(values_a, values_b)
+    
+    # Determine row status
+    is_only_a = ~na_a.all(axis=1) & na_b.all(axis=1)
+    is_only_b = na_a.all(axis=1) & ~na_b.all(axis=1)
+    has_diff = cell_diff.any(axis=1)
+    
+    # One pass picks each row's status code; earlier conditions take priority
+    return np.select(
+        [is_only_a, is_only_b, has_diff],
+        [_STATUS_CODES['ONLY_A'], _STATUS_CODES['ONLY_B'], _STATUS_CODES['DIFF']],
+        default=_STATUS_CODES['MATCH'],
+    ).astype(np.int8)
 
 
 def _compare_dataframes(
@@ -275,69 +706,30 @@ def _compare_dataframes(
     show_only_diffs: bool
 ) -> Tuple[pd.DataFrame, Dict[str, int]]:
     """Compare two aligned dataframes and return diff results."""
-    # Create result dataframe
-    result_rows = []
+    codes = _status_codes(df_a, df_b)
+    counts = np.bincount(codes, minlength=len(STATUS_CATEGORIES))
     
     stats = {
-        'total': 0,
-        'matching': 0,
-        'different': 0,
-        'only_a': 0,
-        'only_b': 0,
+        'total': len(codes),
+        'matching': int(counts[_STATUS_CODES['MATCH']]),
+        'different': int(counts[_STATUS_CODES['DIFF']]),
+        'only_a': int(counts[_STATUS_CODES['ONLY_A']]),
+        'only_b': int(counts[_STATUS_CODES['ONLY_B']]),
     }
     
-    for idx in df_a.index:
-        row_a = df_a.loc[idx]
-        row_b = df_b.loc[idx]
-        
-        # Determine row status
-        is_only_a = row_a.notna().any() and row_b.isna().all()
-        is_only_b = row_a.isna().all() and row_b.notna().any()
-        
-        if is_only_a:
-            status = 'ONLY_A'
-            stats['only_a'] += 1
-        elif is_only_b:
-            status = 'ONLY_B'
-            stats['only_b'] += 1
-        else:
-            # Compare values
-            has_diff = False
-            for col in df_a.columns:
-                val_a = row_a.get(col)
-                val_b = row_b.get(col)
-                
-                # Handle NaN comparison
-                if pd.isna(val_a) and pd.isna(val_b):
-                    continue
-                elif val_a != val_b:
-                    has_diff = True
-                    break
-            
-            if has_diff:
-                status = 'DIFF'
-                stats['different'] += 1
-            else:
-                status = 'MATCH'
-                stats['matching'] += 1
-        
-        stats['total'] += 1
-        
-        # Add to results if not filtering or if has difference
-        if not show_only_diffs or status != 'MATCH':
-            result_row = {
-                'Row_Index': idx,
-                'Status': status,
-            }
-            
-            # Add A and B columns
-            for col in df_a.columns:
-                result_row[f'{col}_A'] = row_a.get(col)
-                result_row[f'{col}_B'] = row_b.get(col)
-            
-            result_rows.append(result_row)
-    
-    result_df = pd.DataFrame(result_rows)
+    # Add to results if not filtering or if has difference
+    keep = codes != _STATUS_CODES['MATCH'] if show_only_diffs else slice(None)
+    
+    # Build the result column by column (A and B interleaved), keeping dtypes
+    result = {
+        'Row_Index': df_a.index.to_numpy()[keep],
+        'Status': pd.Categorical.from_codes(codes[keep], categories=STATUS_CATEGORIES),
+    }
+    for col in df_a.columns:
+        result[f'{col}_A'] = df_a[col].to_numpy()[keep]
+        result[f'{col}_B'] = df_b[col].to_numpy()[keep]
+    
+    result_df = pd.DataFrame(result)
     return result_df, stats
 
 
@@ -348,49 +740,53 @@ def _write_comparison_sheet_with_highlights(
     file_b_name: str
 ) -> None:
     """Write comparison sheet with color highlighting."""
-    # Define fills
-    fill_match = PatternFill(start_color=COLORS['match'], end_color=COLORS['match'], fill_type='solid')
-    fill_diff = PatternFill(start_color=COLORS['diff'], end_color=COLORS['diff'], fill_type='solid')
-    fill_only_a = PatternFill(start_color=COLORS['only_a'], end_color=COLORS['only_a'], fill_type='solid')
-    fill_only_b = PatternFill(start_color=COLORS['only_b'], end_color=COLORS['only_b'], fill_type='solid')
-    fill_header = PatternFill(start_color=COLORS['header'], end_color=COLORS['header'], fill_type='solid')
+    # Write headers
+    ws.append([_styled_cell(ws, header, _HEADER_STYLE) for header in diff_df.columns])
     
-    font_header = Font(bold=True)
+    # Write values only; Excel colors each row from its Status cell when the
+    # file is opened, so no per-cell fills are stored
+    for row in _iter_sheet_rows(diff_df):
+        ws.append(row)
     
-    # Write headers
-    headers = list(diff_df.columns)
-    for col_idx, header in enumerate(headers, start=1):
-        cell = ws.cell(row=1, column=col_idx, value=header)
-        cell.fill = fill_header
-        cell.font = font_header
-    
-    # Write data with highlighting
-    for row_idx, row in enumerate(diff_df.itertuples(index=False), start=2):
-        status = row.Status
-        
-        # Determine fill based on status
-        if status == 'MATCH':
-            fill = fill_match
-        elif status == 'DIFF':
-            fill = fill_diff
-        elif status == 'ONLY_A':
-            fill = fill_only_a
-        elif status == 'ONLY_B':
-            fill = fill_only_b
-        else:
-            fill = None
-        
-        for col_idx, value in enumerate(row, start=1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=value)
-            if fill:
-                cell.fill = fill
+    _add_status_highlights(ws, list(diff_df.columns), len(diff_df))
+
+
+def _add_status_highlights(ws, columns: List[str], n_rows: int) -> None:
+    """Add one conditional formatting rule per status over the data rows."""
+    if not n_rows:
+        return
+    
+    status_col = get_column_letter(columns.index('Status') + 1)
+    data_range = f"A2:{get_column_letter(len(columns))}{n_rows + 1}"
+    for status, fill in _STATUS_FILLS.items():
+        ws.conditional_formatting.add(
+            data_range,
+            FormulaRule(formula=[f'${status_col}2="{status}"'], fill=fill),
+        )
 
 
 def _write_comparison_sheet_plain(ws, diff_df: pd.DataFrame) -> None:
     """Write comparison sheet without highlighting."""
-    for r_idx, row in enumerate(dataframe_to_rows(diff_df, index=False, header=True), start=1):
-        for c_idx, value in enumerate(row, start=1):
-            ws.cell(row=r_idx, column=c_idx, value=value)
+    ws.append(list(diff_df.columns))
+    for row in _iter_sheet_rows(diff_df):
+        ws.append(row)
+
+
+def _summary_rows(stats: Dict[str, int], file_a_name: str, file_b_name: str) -> List[list]:
+    """Return the rows of the summary sheet."""
+    return [
+        ['Comparison Summary'],
+        [],
+        [f'File A: {file_a_name}'],
+        [f'File B: {file_b_name}'],
+        [],
+        ['Statistic', 'Count'],
+        ['Total Rows Compared', stats['total']],
+        ['Matching Rows', stats['matching']],
+        ['Different Rows', stats['different']],
+        [f'Rows Only in {file_a_name}', stats['only_a']],
+        [f'Rows Only in {file_b_name}', stats['only_b']],
+    ]
 
 
 def _write_summary_sheet(
@@ -400,30 +796,85 @@ def _write_summary_sheet(
     file_b_name: str
 ) -> None:
     """Write summary statistics sheet."""
-    ws.append(['Comparison Summary'])
-    ws.append([])
-    ws.append([f'File A: {file_a_name}'])
-    ws.append([f'File B: {file_b_name}'])
-    ws.append([])
-    ws.append(['Statistic', 'Count'])
-    ws.append(['Total Rows Compared', stats['total']])
-    ws.append(['Matching Rows', stats['matching']])
-    ws.append(['Different Rows', stats['different']])
-    ws.append([f'Rows Only in {file_a_name}', stats['only_a']])
-    ws.append([f'Rows Only in {file_b_name}', stats['only_b']])
+    rows = _summary_rows(stats, file_a_name, file_b_name)
     
     # Bold first column
-    for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=1, max_col=1):
-        for cell in row:
-            cell.font = Font(bold=True)
+    for row in rows:
+        if row:
+            row = [_styled_cell(ws, row[0], _LABEL_STYLE)] + row[1:]
+        ws.append(row)
 
 
 def _write_dataframe_to_sheet(ws, df: pd.DataFrame) -> None:
     """Write a DataFrame to a worksheet."""
-    for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=True), start=1):
-        for c_idx, value in enumerate(row, start=1):
-            ws.cell(row=r_idx, column=c_idx, value=value)
-    
     # Bold header
-    for cell in ws[1]:
-        cell.font = Font(bold=True)
+    ws.append([_styled_cell(ws, col, _LABEL_STYLE) for col in df.columns])
+    
+    for row in _iter_sheet_rows(df):
+        ws.append(row)
+
+
+def _write_spill_workbook(path: Path, sheet_name: str, df: pd.DataFrame) -> None:
+    """Write df to its own workbook with xlsxwriter in constant-memory mode."""
+    import xlsxwriter
+    
+    logger.info(f"Writing {len(df)} rows to {path}")
+    wb = xlsxwriter.Workbook(str(path), {'constant_memory': True, 'use_zip64': True})
+    try:
+        ws = wb.add_worksheet(safe_sheet_name(sheet_name))
+        ws.write_row(0, 0, list(df.columns), wb.add_format({'bold': True}))
+        for row_num, row in enumerate(_iter_sheet_rows(df), start=1):
+            ws.write_row(row_num, 0, row)
+    finally:
+        wb.close()
+
+
+def _export_with_pyexcelerate(
+    output_path: Path,
+    diff_df: pd.DataFrame,
+    stats: Dict[str, int],
+    file_a_name: str,
+    file_b_name: str,
+    only_sheets: List[tuple]
+) -> None:
+    """Write the unhighlighted diff report in bulk with PyExcelerate."""
+    from pyexcelerate import Workbook as FastWorkbook, Style, Font as FastFont
+    
+    wb = FastWorkbook()
+    bold = Style(font=FastFont(bold=True))
+    
+    def add_frame_sheet(title: str, df: pd.DataFrame) -> None:
+        ws = wb.new_sheet(title, data=[list(df.columns), *map(list, _iter_sheet_rows(df))])
+        ws.set_row_style(1, bold)
+    
+    add_frame_sheet("Comparison", diff_df)
+    wb.new_sheet("Summary", data=_summary_rows(stats, file_a_name, file_b_name)).set_col_style(1, bold)
+    for title, only_df, spill_rows in only_sheets:
+        if spill_rows is not None:
+            wb.new_sheet(title, data=spill_rows)
+        else:
+            add_frame_sheet(title, only_df)
+    
+    wb.save(str(output_path))
+
+
+def _register_named_styles(wb: Workbook) -> None:
+    """Add the header and label named styles used by the diff sheets to wb."""
+    wb.add_named_style(NamedStyle(name=_HEADER_STYLE, font=Font(bold=True), fill=_FILLS['header']))
+    wb.add_named_style(NamedStyle(name=_LABEL_STYLE, font=Font(bold=True)))
+
+
+def _styled_cell(ws, value, style: str) -> WriteOnlyCell:
+    """Create a write-only cell using one of the registered named styles."""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
+
+
+def _iter_sheet_rows(df: pd.DataFrame):
+    """Yield DataFrame rows as plain tuples, with missing values as empty cells."""
+    missing = df.isna()
+    if missing.to_numpy().any():
+        # Blank out missing values column-wise once instead of cell by cell
+        df = df.astype(object).where(~missing, None)
+    return df.itertuples(index=False, name=None)
@@ -6,13 +6,20 @@ combining sheets with the same name across workbooks.
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from tqdm import tqdm
 
-from .io import get_excel_sheet_names, read_excel_sheet, write_dataframes_to_excel, validate_file_exists
+from .io import (
+    _read_excel_sheets,
+    get_excel_sheet_names,
+    read_excel_sheet,
+    write_dataframes_to_excel,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,16 +28,23 @@ def merge_excel_files(
     excel_files: List[Union[str, Path]],
     output_file: Union[str, Path],
     mode: str = 'lenient',
-    progress: bool = True
+    progress: bool = True,
+    max_workers: Optional[int] = 1
 ) -> None:
     """
     Merge multiple Excel files by combining sheets with the same name.
     
+    Sheets are independent, so with max_workers other than 1 they are read
+    and merged in parallel worker processes (sheet parsing is CPU-bound).
+    Parallel merging starts a process pool, so scripts using it need an
+    ``if __name__ == '__main__':`` guard on spawn platforms (Windows, macOS).
+    
     Args:
         excel_files: List of Excel file paths to merge
         output_file: Path to output merged Excel file
         mode: Merge mode - 'strict' (require identical columns) or 'lenient' (union of columns)
         progress: Whether to show progress bar
+        max_workers: Maximum worker processes (1 = merge serially, None = one per CPU)
     
     Raises:
         ValueError: If excel_files is empty or mode is invalid
@@ -42,10 +56,6 @@ def merge_excel_files(
     if mode not in ['strict', 'lenient']:
         raise ValueError(f"mode must be 'strict' or 'lenient', got '{mode}'")
     
-    # Validate all files exist
-    for file_path in excel_files:
-        validate_file_exists(file_path)
-    
     logger.info(f"Merging {len(excel_files)} Excel files in '{mode}' mode -> {output_file}")
     
     # Step 1: Collect all unique sheet names across all workbooks
@@ -60,36 +70,35 @@ def merge_excel_files(
     logger.info(f"Found {len(all_sheet_names)} unique sheet names: {sorted(all_sheet_names)}")
     
     # Step 2: For each sheet name, merge data from all files that have it
-    merged_sheets = {}
-    
-    iterator = tqdm(sorted(all_sheet_names), desc="Merging sheets") if progress else sorted(all_sheet_names)
+    sheet_names = sorted(all_sheet_names)
+    results = {}
+    
+    workers = min(max_workers or os.cpu_count() or 1, len(sheet_names))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_merge_one_sheet, sheet_name, excel_files, file_sheets_map, mode)
+                for sheet_name in sheet_names
+            ]
+            completed = as_completed(futures)
+            if progress:
+                completed = tqdm(completed, total=len(futures), desc="Merging sheets")
+            for future in completed:
+                sheet_name, merged_df = future.result()
+                results[sheet_name] = merged_df
+    else:
+        iterator = tqdm(sheet_names, desc="Merging sheets") if progress else sheet_names
+        for sheet_name in iterator:
+            sheet_name, merged_df = _merge_one_sheet(sheet_name, excel_files, file_sheets_map, mode)
+            results[sheet_name] = merged_df
     
-    for sheet_name in iterator:
-        logger.info(f"Processing sheet: '{sheet_name}'")
-        
-        # Collect all DataFrames for this sheet across files
-        sheet_dfs = []
-        
-        for file_path in excel_files:
-            if sheet_name in file_sheets_map[file_path]:
-                try:
-                    df = read_excel_sheet(file_path, sheet_name)
-                    sheet_dfs.append((file_path, df))
-                    logger.debug(f"  {Path(file_path).name}: {len(df)} rows, {len(df.columns)} columns")
-                except Exception as e:
-                    logger.error(f"  Error reading sheet '{sheet_name}' from {file_path}: {e}")
-                    raise
-        
-        if not sheet_dfs:
+    # Keep the output sheet order independent of completion order
+    merged_sheets = {}
+    for sheet_name in sheet_names:
+        merged_df = results.get(sheet_name)
+        if merged_df is None:
             logger.warning(f"  No data found for sheet '{sheet_name}' - skipping")
             continue
-        
-        # Merge the DataFrames for this sheet
-        if mode == 'strict':
-            merged_df = _merge_sheets_strict(sheet_dfs, sheet_name)
-        else:  # lenient
-            merged_df = _merge_sheets_lenient(sheet_dfs, sheet_name)
-        
         merged_sheets[sheet_name] = merged_df
         logger.info(f"  Merged '{sheet_name}': {len(merged_df)} rows, {len(merged_df.columns)} columns")
     
@@ -101,6 +110,44 @@ def merge_excel_files(
     logger.info(f"Successfully merged {len(excel_files)} files into {output_file} ({len(merged_sheets)} sheets)")
 
 
+def _merge_one_sheet(
+    sheet_name: str,
+    excel_files: List[Union[str, Path]],
+    file_sheets_map: Dict,
+    mode: str
+) -> Tuple[str, Optional[pd.DataFrame]]:
+    """
+    Read one sheet from every file that has it and merge the results.
+    
+    Module-level so it can run in a worker process.
+    
+    Returns:
+        Tuple of (sheet_name, merged DataFrame or None if no file had data)
+    """
+    logger.info(f"Processing sheet: '{sheet_name}'")
+    
+    # Collect all DataFrames for this sheet across files
+    sheet_dfs = []
+    
+    for file_path in excel_files:
+        if sheet_name in file_sheets_map[file_path]:
+            try:
+                df = read_excel_sheet(file_path, sheet_name)
+                sheet_dfs.append((file_path, df))
+                logger.debug(f"  {Path(file_path).name}: {len(df)} rows, {len(df.columns)} columns")
+            except Exception as e:
+                logger.error(f"  Error reading sheet '{sheet_name}' from {file_path}: {e}")
+                raise
+    
+    if not sheet_dfs:
+        return sheet_name, None
+    
+    # Merge the DataFrames for this sheet
+    if mode == 'strict':
+        return sheet_name, _merge_sheets_strict(sheet_dfs, sheet_name)
+    return sheet_name, _merge_sheets_lenient(sheet_dfs, sheet_name)
+
+
 def _merge_sheets_strict(
     sheet_dfs: List[tuple],
     sheet_name: str
@@ -119,26 +166,29 @@ def _merge_sheets_strict(
         ValueError: If columns don't match
     """
     reference_file, reference_df = sheet_dfs[0]
-    reference_columns = list(reference_df.columns)
+    reference_columns = reference_df.columns
     
-    logger.debug(f"  Strict mode: reference columns from {Path(reference_file).name}: {reference_columns}")
+    logger.debug(f"  Strict mode: reference columns from {Path(reference_file).name}: {list(reference_columns)}")
     
     dfs_to_concat = [reference_df]
     
     for file_path, df in sheet_dfs[1:]:
-        current_columns = list(df.columns)
-        
-        if current_columns != reference_columns:
+        # Index.equals compares the column labels without building lists
+        if not df.columns.equals(reference_columns):
             raise ValueError(
                 f"Column mismatch in strict mode for sheet '{sheet_name}'.\n"
-                f"  Reference ({Path(reference_file).name}): {reference_columns}\n"
-                f"  Current ({Path(file_path).name}): {current_columns}"
+                f"  Reference ({Path(reference_file).name}): {list(reference_columns)}\n"
+                f"  Current ({Path(file_path).name}): {list(df.columns)}"
             )
         
         dfs_to_concat.append(df)
     
+    # A single sheet needs no concatenation
+    if len(dfs_to_concat) == 1:
+        return reference_df.reset_index(drop=True)
+    
     # Concatenate all DataFrames
-    merged = pd.concat(dfs_to_concat, ignore_index=True)
+    merged = pd.concat(dfs_to_concat, ignore_index=True, copy=False)
     return merged
 
 
@@ -166,22 +216,39 @@ def _merge_sheets_lenient(
     all_columns = sorted(all_columns)
     logger.debug(f"  Lenient mode: union of columns: {all_columns}")
     
-    # Reindex each DataFrame to have all columns, filling missing with NaN
-    dfs_to_concat = []
-    
     for file_path, df in sheet_dfs:
-        df_reindexed = df.reindex(columns=all_columns)
-        dfs_to_concat.append(df_reindexed)
-        
-        missing_cols = set(all_columns) - set(df.columns)
+        missing_cols = len(all_columns) - len(set(df.columns) & set(all_columns))
         if missing_cols:
-            logger.debug(f"    {Path(file_path).name}: added {len(missing_cols)} missing columns")
-    
-    # Concatenate all DataFrames
-    merged = pd.concat(dfs_to_concat, ignore_index=True)
+            logger.debug(f"    {Path(file_path).name}: added {missing_cols} missing columns")
+    
+    # Concatenate column by column instead of reindexing every sheet into a
+    # wide intermediate frame first
+    merged = pd.DataFrame(
+        {col: _concat_column(sheet_dfs, col) for col in all_columns},
+        columns=all_columns,
+    )
     return merged
 
 
+def _concat_column(sheet_dfs: List[tuple], col: str) -> pd.Series:
+    """
+    Stack one column across sheets, filling sheets that lack it with NaN.
+    
+    The filler is an all-missing slice of the column's own dtype, so e.g. a
+    datetime column stays datetime (and an int column becomes float), the
+    same result as concatenating reindexed frames.
+    """
+    template = next(df[col] for _, df in sheet_dfs if col in df.columns)
+    parts = [
+        df[col] if col in df.columns else template.iloc[:0].reindex(range(len(df)))
+        for _, df in sheet_dfs
+    ]
+    
+    # Empty parts carry no rows; leaving them out keeps them from affecting the dtype
+    parts = [part for part in parts if len(part)] or [template.iloc[:0]]
+    return pd.concat(parts, ignore_index=True, copy=False)
+
+
 def merge_excel_sheets_by_name(
     excel_files: List[Union[str, Path]],
     sheet_name: str,
@@ -205,8 +272,6 @@ def merge_excel_sheets_by_name(
     sheet_dfs = []
     
     for file_path in excel_files:
-        validate_file_exists(file_path)
-        
         sheet_names = get_excel_sheet_names(file_path)
         
         if sheet_name not in sheet_names:
@@ -274,20 +339,22 @@ def merge_excel_common_sheets_only(
     
     logger.info(f"Found {len(common_sheets)} common sheets: {common_sheets}")
     
+    # Read every common sheet of a workbook in one pass over that workbook
+    file_frames = [(file_path, _read_excel_sheets(file_path, common_sheets)) for file_path in excel_files]
+    
     merged_sheets = {}
     
     for sheet_name in common_sheets:
-        sheet_dfs = []
-        
-        for file_path in excel_files:
-            df = read_excel_sheet(file_path, sheet_name)
-            sheet_dfs.append((file_path, df))
+        # Take the inputs out of file_frames so each sheet's source frames
+        # are freed once merged, instead of living on beside the outputs
+        sheet_dfs = [(file_path, frames.pop(sheet_name)) for file_path, frames in file_frames]
         
         if mode == 'strict':
             merged_df = _merge_sheets_strict(sheet_dfs, sheet_name)
         else:
             merged_df = _merge_sheets_lenient(sheet_dfs, sheet_name)
         
+        del sheet_dfs
         merged_sheets[sheet_name] = merged_df
         logger.info(f"Merged '{sheet_name}': {len(merged_df)} rows")
     
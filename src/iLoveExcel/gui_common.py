@@ -5,13 +5,173 @@ Shared utilities for GUI implementations (PySimpleGUI, Tkinter, etc.)
 Provides worker thread management, progress queue handling, and common widgets.
 """
 
+import atexit
+import collections
+import copy
+import functools
+import importlib
+import itertools
+import json
 import logging
+import multiprocessing
 import queue
 import threading
-from typing import Any, Callable, Dict, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from logging.handlers import QueueHandler
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of log records buffered for the GUI; when a worker logs
+# faster than the GUI drains, the oldest records are dropped
+LOG_QUEUE_MAXLEN = 10000
+
+# Shared single-worker process pool (created on first use)
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_log_queue = None
+
+# Every task submitted to the pool gets a job id; the worker process tags its
+# log records with it so each GUI window only receives its own job's records
+_job_ids = itertools.count(1)
+_active_jobs: Dict[int, 'WorkerProcess'] = {}
+_active_jobs_lock = threading.Lock()
+
+# Job id of the task the (single-threaded) pool worker is running
+_current_job_id: Optional[int] = None
+
+# Modules imported by each pool worker at startup, so the first operation
+# doesn't pay the pandas/openpyxl import cost
+_WORKER_PRELOAD_MODULES = (
+    'iLoveExcel.io',
+    'iLoveExcel.unions',
+    'iLoveExcel.joins',
+    'iLoveExcel.excel_merge',
+    'iLoveExcel.diffs',
+)
+
+
+def _init_worker_process(log_queue) -> None:
+    """
+    Initialize a pool worker process.
+    
+    Configures logging and forwards all package log records to the
+    parent process through the shared multiprocessing queue.
+    
+    Args:
+        log_queue: multiprocessing.Queue shared with the GUI process
+    """
+    from .utils import setup_logging
+    
+    setup_logging(level='INFO')
+    handler = QueueHandler(log_queue)
+    handler.addFilter(_tag_job_id)
+    package_logger = logging.getLogger('iLoveExcel')
+    package_logger.addHandler(handler)
+    
+    for module_name in _WORKER_PRELOAD_MODULES:
+        importlib.import_module(module_name)
+
+
+def _tag_job_id(record: logging.LogRecord) -> bool:
+    """Logging filter (worker process): tag the record with the running job's id."""
+    record.job_id = _current_job_id
+    return True
+
+
+def _run_job(job_id: int, task_func: Callable, args: Tuple, kwargs: Dict) -> Any:
+    """Run a task in the pool worker with its log records tagged by job_id."""
+    global _current_job_id
+    
+    _current_job_id = job_id
+    try:
+        return task_func(*args, **kwargs)
+    finally:
+        _current_job_id = None
+
+
+def process_pool_busy() -> bool:
+    """Return True if a task is running in (or queued for) the shared process pool."""
+    with _active_jobs_lock:
+        return bool(_active_jobs)
+
+
+class _WorkerLogHandler(QueueHandler):
+    """
+    QueueHandler that appends to a deque and wakes the GUI after each record.
+    
+    The worker thread is the only producer and the GUI the only consumer, so
+    the atomic deque.append/popleft pair replaces queue.Queue's lock round-trips.
+    """
+    
+    def __init__(self, log_queue: Deque[logging.LogRecord], notify: Callable[[], None]):
+        super().__init__(log_queue)
+        self.notify = notify
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Tracebacks stay on the console; the GUI pane shows the message only
+        record = copy.copy(record)
+        record.exc_info = None
+        record.exc_text = None
+        return super().prepare(record)
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.append(record)
+        self.notify()
+
+
+def _noop() -> None:
+    """Task submitted to start the pool worker ahead of the first operation."""
+
+
+def get_process_pool() -> Tuple[ProcessPoolExecutor, Any]:
+    """
+    Get the shared process pool used for CPU-bound GUI operations.
+    
+    Returns:
+        Tuple of (executor, log_queue) where log_queue receives LogRecords
+        emitted inside the worker process
+    """
+    global _process_pool, _process_log_queue
+    
+    if _process_pool is None:
+        _process_log_queue = multiprocessing.Queue()
+        _process_pool = ProcessPoolExecutor(
+            max_workers=1,
+            initializer=_init_worker_process,
+            initargs=(_process_log_queue,)
+        )
+        atexit.register(shutdown_process_pool)
+    return _process_pool, _process_log_queue
+
+
+def start_process_pool() -> None:
+    """
+    Create the shared process pool and start its worker in the background.
+    
+    Call once at GUI startup: the worker process spawns and pre-imports the
+    operation modules while the user is still filling in the form.
+    """
+    pool, _ = get_process_pool()
+    pool.submit(_noop)
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Shut down pool if it is still the shared one, so the next use creates a fresh pool."""
+    if pool is _process_pool:
+        shutdown_process_pool()
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared process pool, if it was started."""
+    global _process_pool, _process_log_queue
+    
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+        _process_log_queue = None
+
 
 class WorkerThread(threading.Thread):
     """
@@ -27,8 +187,11 @@ class WorkerThread(threading.Thread):
         args: Tuple = (),
         kwargs: Optional[Dict] = None,
         result_queue: Optional[queue.Queue] = None,
-        log_queue: Optional[queue.Queue] = None,
-        progress_queue: Optional[queue.Queue] = None
+        log_queue: Optional[Deque[logging.LogRecord]] = None,
+        progress_queue: Optional[queue.Queue] = None,
+        notify: Optional[Callable[[], None]] = None,
+        input_files: Optional[List[str]] = None,
+        notify_done: Optional[Callable[[], None]] = None
     ):
         """
         Initialize worker thread.
@@ -38,41 +201,156 @@ class WorkerThread(threading.Thread):
             args: Positional arguments for task_func
             kwargs: Keyword arguments for task_func
             result_queue: Queue for final result ('success'/'error', value)
-            log_queue: Queue for log messages (str)
+            log_queue: Deque receiving log messages (logging.LogRecord); give
+                       it a maxlen so a flood of records drops the oldest
             progress_queue: Queue for progress updates (0-100)
+            notify: Optional callback invoked (from the worker thread) after
+                    new log messages or progress updates were queued, so
+                    the GUI can wake up instead of polling
+            input_files: Optional input file paths, checked by the worker
+                         before the task runs so slow (e.g. network) paths
+                         never block the GUI thread
+            notify_done: Optional callback invoked (from the worker thread)
+                         once the task has finished and its result is queued
         """
         super().__init__(daemon=True)
         self.task_func = task_func
         self.args = args
         self.kwargs = kwargs or {}
         self.result_queue = result_queue or queue.Queue()
-        self.log_queue = log_queue or queue.Queue()
+        self.log_queue = log_queue if log_queue is not None else collections.deque(maxlen=LOG_QUEUE_MAXLEN)
         self.progress_queue = progress_queue or queue.Queue()
+        self.notify = notify
+        self.input_files = input_files or []
+        self.notify_done = notify_done
         self._stop_event = threading.Event()
     
     def run(self):
         """Execute the task and put result in queue."""
+        # Stream every package log record emitted by this thread to the GUI
+        handler = _WorkerLogHandler(self.log_queue, self._notify)
+        handler.addFilter(lambda record: record.thread == self.ident)
+        package_logger = logging.getLogger('iLoveExcel')
+        package_logger.addHandler(handler)
+        
         try:
-            self.log_queue.put("Starting operation...\n")
-            self.progress_queue.put(10)
+            logger.info("Starting operation...")
+            self._report_progress(10)
+            
+            self._check_input_files()
+            self._report_progress(20)
             
-            result = self.task_func(*self.args, **self.kwargs)
+            result = self._execute()
             
             if not self._stop_event.is_set():
-                self.progress_queue.put(100)
+                self._report_progress(100)
                 self.result_queue.put(('success', result))
-                self.log_queue.put("✓ Operation completed successfully!\n")
+                logger.info("✓ Operation completed successfully!")
         except Exception as e:
-            logger.error(f"Worker thread error: {e}", exc_info=True)
             if not self._stop_event.is_set():
                 self.result_queue.put(('error', str(e)))
-                self.log_queue.put(f"✗ Error: {e}\n")
+            logger.error(f"✗ Error: {e}", exc_info=True)
+        finally:
+            package_logger.removeHandler(handler)
+            # The GUI keeps the finished thread around; don't pin large inputs
+            self.args = ()
+            self.kwargs = {}
+            if self.notify_done is not None:
+                self.notify_done()
+    
+    def _check_input_files(self) -> None:
+        """Raise FileNotFoundError if any input file is missing or not a file."""
+        if not self.input_files:
+            return
+        
+        logger.info(f"Checking {len(self.input_files)} input file(s)...")
+        for path in self.input_files:
+            is_valid, error = validate_file_path(path)
+            if not is_valid:
+                raise FileNotFoundError(error)
+    
+    def _report_progress(self, percent: int) -> None:
+        """Queue a progress update and wake the GUI."""
+        self.progress_queue.put(percent)
+        self._notify()
+    
+    def _notify(self) -> None:
+        """Invoke the notify callback, if any."""
+        if self.notify is not None:
+            self.notify()
+    
+    def _execute(self) -> Any:
+        """Run the task function and return its result."""
+        return self.task_func(*self.args, **self.kwargs)
     
     def stop(self):
         """Signal the worker to stop (best effort)."""
         self._stop_event.set()
 
 
+class WorkerProcess(WorkerThread):
+    """
+    Background worker that runs the task in the shared process pool.
+    
+    pandas/openpyxl parsing holds the GIL for long stretches, so running it
+    in a thread still starves the GUI event loop. This worker submits the task
+    to a separate process and only waits on the result from a light thread,
+    which also forwards the worker process' log records to log_queue.
+    
+    The task function, its arguments and its result must be picklable.
+    """
+    
+    def _execute(self) -> Any:
+        """Submit the task to the process pool and wait for its result."""
+        pool, process_log_queue = get_process_pool()
+        job_id = next(_job_ids)
+        with _active_jobs_lock:
+            _active_jobs[job_id] = self
+        
+        try:
+            future = pool.submit(_run_job, job_id, self.task_func, self.args, self.kwargs)
+            while not future.done():
+                self._forward_logs(process_log_queue, timeout=0.1)
+            self._forward_logs(process_log_queue, timeout=0)
+            return future.result()
+        except BrokenProcessPool as e:
+            # The worker died (e.g. killed when out of memory); a broken pool
+            # rejects every later task, so replace it for the next operation
+            _discard_process_pool(pool)
+            raise RuntimeError(
+                "The worker process crashed (it may have run out of memory) and the "
+                "operation was aborted. The next operation will start a new worker."
+            ) from e
+        finally:
+            with _active_jobs_lock:
+                del _active_jobs[job_id]
+    
+    @staticmethod
+    def _forward_logs(process_log_queue, timeout: float) -> None:
+        """
+        Route pending worker-process log records to their jobs' log_queues.
+        
+        Every waiting WorkerProcess drains the same multiprocessing queue, so
+        records are delivered by job id rather than to whichever thread
+        happened to read them; records of finished jobs are dropped.
+        """
+        notified = set()
+        try:
+            record = process_log_queue.get(timeout=timeout) if timeout else process_log_queue.get_nowait()
+            while True:
+                with _active_jobs_lock:
+                    worker = _active_jobs.get(getattr(record, 'job_id', None))
+                if worker is not None:
+                    worker.log_queue.append(record)
+                    notified.add(worker)
+                record = process_log_queue.get_nowait()
+        except queue.Empty:
+            pass
+        
+        for worker in notified:
+            worker._notify()
+
+
 class ProgressReporter:
     """
     Helper class for reporting progress from worker functions.
@@ -132,6 +410,13 @@ def column_number_to_letter(n: int) -> str:
         >>> column_number_to_letter(26)
         'AA'
     """
+    if 0 <= n < EXCEL_MAX_COLUMNS:
+        return _column_letters()[n]
+    return _compute_column_letter(n)
+
+
+def _compute_column_letter(n: int) -> str:
+    """Convert a 0-indexed column number to its letters arithmetically."""
     result = ""
     n += 1  # Excel columns are 1-indexed
     while n > 0:
@@ -141,6 +426,16 @@ def column_number_to_letter(n: int) -> str:
     return result
 
 
+# Excel's column limit (A..XFD)
+EXCEL_MAX_COLUMNS = 16384
+
+
+@functools.lru_cache(maxsize=None)
+def _column_letters() -> Tuple[str, ...]:
+    """Letters of every Excel column, built on first use rather than at import."""
+    return tuple(_compute_column_letter(i) for i in range(EXCEL_MAX_COLUMNS))
+
+
 def validate_file_path(path: str, must_exist: bool = True) -> Tuple[bool, str]:
     """
     Validate a file path.
@@ -170,7 +465,7 @@ def validate_file_path(path: str, must_exist: bool = True) -> Tuple[bool, str]:
 
 def parse_file_list(file_string: str, separator: str = ';') -> list:
     """
-    Parse semicolon or pipe-separated file paths.
+    Parse a separator-delimited list (file paths, sheet names, key columns).
     
     Args:
         file_string: String with multiple file paths
@@ -179,11 +474,15 @@ def parse_file_list(file_string: str, separator: str = ';') -> list:
     Returns:
         List of file paths
     """
-    if not file_string or not file_string.strip():
+    if not file_string:
         return []
     
-    files = [f.strip() for f in file_string.split(separator) if f.strip()]
-    return files
+    # Single-entry fast path: no split needed
+    if separator not in file_string:
+        item = file_string.strip()
+        return [item] if item else []
+    
+    return [f for f in (part.strip() for part in file_string.split(separator)) if f]
 
 
 def format_bytes(bytes_val: int) -> str:
@@ -220,6 +519,28 @@ def safe_get_from_queue(q: queue.Queue, timeout: float = 0.01) -> Optional[Any]:
         return None
 
 
+def drain_queue(q: queue.Queue, max_items: int = 256) -> list:
+    """
+    Take up to max_items items from a queue without blocking.
+    
+    Lets a GUI poll handle a burst of messages with one widget update.
+    
+    Args:
+        q: Queue to read from
+        max_items: Maximum number of items to take
+    
+    Returns:
+        List of items in queue order (empty if the queue is empty)
+    """
+    items = []
+    try:
+        while len(items) < max_items:
+            items.append(q.get_nowait())
+    except queue.Empty:
+        pass
+    return items
+
+
 class GUIState:
     """
     Simple state manager for GUI applications.
@@ -236,6 +557,11 @@ class GUIState:
         self.settings = {}
         self.worker_thread = None
         self.is_running = False
+        self.last_dir = None  # Directory of the last file picked in a dialog
+    
+    def remember_dir(self, file_path: str) -> None:
+        """Record the directory of a file picked in a dialog."""
+        self.last_dir = str(Path(file_path).parent)
     
     def reset(self):
         """Reset state to initial values."""
@@ -279,3 +605,41 @@ def get_gui_config(overrides: Optional[Dict] = None) -> Dict:
     if overrides:
         config.update(overrides)
     return config
+
+
+# Per-user GUI state persisted across sessions
+GUI_STATE_FILE = Path.home() / '.iloveexcel' / 'state.json'
+
+
+def load_gui_state(state_file: Path = GUI_STATE_FILE) -> Dict:
+    """
+    Load persisted GUI state (e.g. the last used directory).
+    
+    Args:
+        state_file: Path of the JSON state file
+    
+    Returns:
+        State dictionary (empty if the file is missing or unreadable)
+    """
+    try:
+        with open(state_file, encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def save_gui_state(state: Dict, state_file: Path = GUI_STATE_FILE) -> None:
+    """
+    Persist GUI state; failures are logged and otherwise ignored.
+    
+    Args:
+        state: JSON-serializable state dictionary
+        state_file: Path of the JSON state file
+    """
+    try:
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(state_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+    except (OSError, TypeError) as e:
+        logger.warning(f"Could not save GUI state to {state_file}: {e}")
@@ -5,23 +5,199 @@ Modern Tkinter-based graphical interface for CSV and Excel operations.
 Provides an alternative to PySimpleGUI with full open-source stack.
 """
 
+import collections
 import logging
 import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Tuple, Union
 
-from .excel_merge import merge_excel_files
-from .io import csvs_to_excel
-from .joins import join_csvs, join_excel_sheets_to_file
-from .unions import union_csvs, union_multiple_csvs
 from .utils import setup_logging
-from .gui_common import WorkerThread, GUIState, validate_file_path, parse_file_list, format_bytes
-from .diffs import diff_csv_side_by_side, export_diff_to_excel
+from .gui_common import (
+    WorkerProcess, GUIState, start_process_pool, validate_file_path, parse_file_list, format_bytes, drain_queue,
+    load_gui_state, save_gui_state, process_pool_busy, LOG_QUEUE_MAXLEN
+)
+
+# Backends (pandas/openpyxl) are imported inside the methods that use them, so
+# the window appears without waiting for them; the pool worker preloads them.
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of queued log messages written to the log pane per flush
+LOG_BATCH_SIZE = 256
+
+# Maximum number of lines kept in a log pane; older lines are dropped so
+# long-running operations don't slow the Text widget down
+LOG_MAX_LINES = 5000
+
+# Virtual event generated by worker threads when log messages are queued
+LOG_EVENT = '<<LogMessage>>'
+
+# Virtual event generated by worker threads once the operation's result is queued
+OPERATION_DONE_EVENT = '<<OperationDone>>'
+
+# Virtual event generated when a background input file check has finished
+INPUTS_CHECKED_EVENT = '<<InputsChecked>>'
+
+# Shared formatter for worker log records shown in the log panes
+LOG_FORMATTER = logging.Formatter('%(message)s')
+
+# Input files are validated once typing has paused for this long (ms)
+VALIDATE_DELAY_MS = 250
+
+# Per-operation layout: (input group, multi-file label, parameter builders)
+OPERATION_LAYOUTS = {
+    'csv_to_excel': ('multi', "Select CSV Files:", ('_create_csv2excel_params',)),
+    'union': ('multi', "Select CSV Files to Union:", ('_create_union_params',)),
+    'join': ('dual', None, ('_create_join_params',)),
+    'join_excel': ('multi', "Select Excel File:", ('_create_join_params', '_create_excel_sheet_params')),
+    'merge_excel': ('multi', "Select Excel Files to Merge:", ('_create_merge_params',)),
+}
+
+# Per-operation run spec: (builder method, min input files, max input files,
+# input file type, output file type). Builders return (func, args, kwargs).
+OPERATION_RUNNERS = {
+    'csv_to_excel': ('_build_csv_to_excel', 1, None, "CSV", "Excel"),
+    'union': ('_build_union', 2, None, "CSV", "CSV"),
+    'join': ('_build_join', 2, 2, "CSV", "CSV"),
+    'join_excel': ('_build_join_excel', 1, 1, "Excel", "Excel"),
+    'merge_excel': ('_build_merge_excel', 2, None, "Excel", "Excel"),
+}
+
+# Display titles, computed once instead of on every run
+OPERATION_TITLES = {op: op.replace('_', ' ').title() for op in OPERATION_LAYOUTS}
+
+# File dialog filetypes, shared by every browse handler
+_FILETYPES_INPUTS = (
+    ("CSV and Excel files", "*.csv *.xlsx *.xls"),
+    ("CSV files", "*.csv"),
+    ("Excel files", "*.xlsx *.xls"),
+    ("All files", "*.*"),
+)
+_FILETYPES_INPUT = (("CSV and Excel files", "*.csv *.xlsx *.xls"), ("All files", "*.*"))
+_FILETYPES_EXCEL = (("Excel files", "*.xlsx"), ("All files", "*.*"))
+_FILETYPES_CSV = (("CSV files", "*.csv"), ("All files", "*.*"))
+
+# Shared grid options for parameter rows: label, input widget, help text
+_GRID_LABEL = {'column': 0, 'sticky': tk.W, 'padx': 5, 'pady': 2}
+_GRID_INPUT = {'column': 1, 'sticky': tk.W, 'padx': 5, 'pady': 2}
+_GRID_INPUT_STRETCH = {'column': 1, 'sticky': (tk.W, tk.E), 'padx': 5, 'pady': 2}
+_GRID_HELP = {'column': 2, 'sticky': tk.W, 'padx': 5}
+_HELP_FONT = ("TkDefaultFont", 8)
+
+# Preformatted log pane banners; each is written with a single Text insert
+_BAR = '═' * 51
+_START_BANNER = f"{_BAR}\nStarting: {{}}\n{_BAR}"
+_SUCCESS_BANNER = f"{_BAR}\n✓ OPERATION COMPLETED SUCCESSFULLY!\n{_BAR}"
+_FAILURE_BANNER = f"{_BAR}\n✗ OPERATION FAILED: {{}}\n{_BAR}"
+
+# Logged when a task has to wait for the other window's task in the shared
+# single-worker process pool
+_QUEUED_MESSAGE = "Another operation is still running; this one will start when it finishes."
+
+
+def _post_event(widget: tk.Misc, sequence: str) -> None:
+    """
+    Generate a virtual event on widget from a worker thread.
+    
+    Tkinter marshals the call to the Tk thread, whose event loop then wakes
+    up immediately instead of discovering the work on its next poll.
+    """
+    try:
+        widget.event_generate(sequence, when='tail')
+    except (tk.TclError, RuntimeError):
+        pass  # Window was closed while the worker was still running
+
+
+def _drain_log_queue(log_queue: Deque[logging.LogRecord], write) -> bool:
+    """
+    Move up to LOG_BATCH_SIZE pending messages from log_queue to the log pane.
+    
+    Messages are joined and written with a single call so a burst of log
+    lines costs one Text insert instead of one per line.
+    
+    Args:
+        log_queue: Deque of worker logging.LogRecord objects
+        write: Callable that appends a block of text to the log pane
+    
+    Returns:
+        True if the queue was fully drained, False if messages remain
+    """
+    messages = []
+    while log_queue and len(messages) < LOG_BATCH_SIZE:
+        messages.append(LOG_FORMATTER.format(log_queue.popleft()).rstrip())
+    
+    if messages:
+        write('\n'.join(messages))
+    return not log_queue
+
+
+# Keys a read-only log pane still accepts (navigation and selection)
+_LOG_NAVIGATION_KEYS = frozenset({
+    'Up', 'Down', 'Left', 'Right', 'Prior', 'Next', 'Home', 'End',
+    'Shift_L', 'Shift_R', 'Control_L', 'Control_R',
+})
+
+# Ctrl+<key> shortcuts a read-only log pane still accepts (copy, select all)
+_LOG_CONTROL_KEYS = frozenset({'c', 'a', 'slash'})
+
+# Event.state bit set while Control is held
+_CONTROL_MASK = 0x0004
+
+
+def _block_log_edit(event) -> Optional[str]:
+    """Key binding that keeps a log pane read-only while allowing copy and navigation."""
+    if event.keysym in _LOG_NAVIGATION_KEYS:
+        return None
+    if event.state & _CONTROL_MASK and event.keysym.lower() in _LOG_CONTROL_KEYS:
+        return None
+    return 'break'
+
+
+def _make_log_read_only(log_text: scrolledtext.ScrolledText) -> None:
+    """
+    Make a log pane read-only for the user through key bindings.
+    
+    The widget itself stays in the NORMAL state, so writing to it doesn't
+    need a state=NORMAL/DISABLED reconfigure around every insert.
+    """
+    log_text.bind('<Key>', _block_log_edit)
+    for sequence in ('<<Cut>>', '<<Paste>>', '<<PasteSelection>>', '<<Clear>>'):
+        log_text.bind(sequence, lambda event: 'break')
+
+
+def _append_log(log_text: scrolledtext.ScrolledText, message: str, tag=()) -> None:
+    """
+    Append message to a log pane, keeping at most LOG_MAX_LINES lines.
+    
+    The oldest lines are deleted once the cap is exceeded, so each insert
+    stays cheap however long the operation has been logging. The pane only
+    scrolls to the new text if it was already showing the end, so a user
+    reading earlier output isn't pulled away from it.
+    """
+    following = log_text.yview()[1] >= 1.0
+    log_text.insert(tk.END, message + '\n', tag)
+    
+    # 'end-1c' is on the empty line after the trailing newline
+    excess = int(log_text.index('end-1c').split('.')[0]) - 1 - LOG_MAX_LINES
+    if excess > 0:
+        log_text.delete('1.0', f'{excess + 1}.0')
+    
+    if following:
+        log_text.see(tk.END)
+
+
+def _is_digits(proposed: str) -> bool:
+    """Entry validatecommand: accept only an empty string or a non-negative integer."""
+    return proposed == '' or proposed.isdecimal()
+
+
+def _sheet_ref(value: str) -> Union[int, str]:
+    """Interpret a sheet field as a 0-based index if numeric, otherwise as a sheet name."""
+    return int(value) if value.lstrip('-').isdecimal() else value
+
 
 class iLoveExcelGUI:
     """Main Tkinter GUI application for iLoveExcel."""
@@ -34,9 +210,14 @@ class iLoveExcelGUI:
         
         # State management
         self.state = GUIState()
+        self.state.last_dir = load_gui_state().get('last_dir')
         self.worker_thread = None
-        self.log_queue = queue.Queue()
+        self.log_queue = collections.deque(maxlen=LOG_QUEUE_MAXLEN)
         self.result_queue = queue.Queue()
+        self.progress_queue = queue.Queue()
+        self._validate_after_id = None
+        self._validate_generation = 0
+        self._input_status = (0, "")  # (generation, status text)
         
         # Operation mapping
         self.operation = None  # 'csv_to_excel', 'union', 'join', 'join_excel', 'merge_excel', 'csv_diff'
@@ -45,8 +226,13 @@ class iLoveExcelGUI:
         self._create_widgets()
         self._create_menu()
         
-        # Start log polling
-        self._poll_log_queue()
+        # Save the last used directory when the window is closed
+        self.root.protocol('WM_DELETE_WINDOW', self._on_close)
+        
+        # Worker threads wake the event loop when log messages are queued
+        self.root.bind(LOG_EVENT, self._on_log_event)
+        self.root.bind(OPERATION_DONE_EVENT, self._on_operation_done)
+        self.root.bind(INPUTS_CHECKED_EVENT, self._on_inputs_checked)
         
         logger.info("Tkinter GUI initialized")
     
@@ -98,29 +284,59 @@ class iLoveExcelGUI:
         # File input section (multi-file or dual-file)
         self.input_frame = ttk.LabelFrame(main_frame, text="Input Files", padding="10")
         self.input_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=5)
-        self.input_frame.columnconfigure(1, weight=1)
+        self.input_frame.columnconfigure(0, weight=1)
+        
+        # Each input group lives in its own frame, so switching between them
+        # is a single geometry change instead of one per widget
+        multi_frame = ttk.Frame(self.input_frame)
+        multi_frame.columnconfigure(1, weight=1)
+        dual_frame = ttk.Frame(self.input_frame)
+        dual_frame.columnconfigure(1, weight=1)
+        self._input_frames = {'multi': multi_frame, 'dual': dual_frame}
+        self._visible_input = None  # 'multi' or 'dual'
         
         # Multi-file input widgets
-        self.multi_file_label = ttk.Label(self.input_frame, text="Select Files:")
-        self.multi_file_entry = ttk.Entry(self.input_frame, width=60)
-        self.multi_file_button = ttk.Button(self.input_frame, text="Browse...", command=self._browse_multi_files)
+        self.multi_file_label = ttk.Label(multi_frame, text="Select Files:")
+        self.multi_file_entry = ttk.Entry(multi_frame, width=60)
+        self.multi_file_button = ttk.Button(multi_frame, text="Browse...", command=self._browse_multi_files)
+        
+        self.multi_file_label.grid(row=0, column=0, sticky=tk.W, padx=5)
+        self.multi_file_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5, pady=2)
+        self.multi_file_button.grid(row=0, column=2, padx=5)
         
         # Dual-file input widgets
-        self.left_file_label = ttk.Label(self.input_frame, text="Left File:")
-        self.left_file_entry = ttk.Entry(self.input_frame, width=60)
-        self.left_file_button = ttk.Button(self.input_frame, text="Browse...", command=self._browse_left_file)
+        self.left_file_label = ttk.Label(dual_frame, text="Left File:")
+        self.left_file_entry = ttk.Entry(dual_frame, width=60)
+        self.left_file_button = ttk.Button(dual_frame, text="Browse...", command=self._browse_left_file)
+        
+        self.right_file_label = ttk.Label(dual_frame, text="Right File:")
+        self.right_file_entry = ttk.Entry(dual_frame, width=60)
+        self.right_file_button = ttk.Button(dual_frame, text="Browse...", command=self._browse_right_file)
+        
+        self.left_file_label.grid(row=0, column=0, sticky=tk.W, padx=5)
+        self.left_file_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5, pady=2)
+        self.left_file_button.grid(row=0, column=2, padx=5)
+        
+        self.right_file_label.grid(row=1, column=0, sticky=tk.W, padx=5)
+        self.right_file_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=5, pady=2)
+        self.right_file_button.grid(row=1, column=2, padx=5)
         
-        self.right_file_label = ttk.Label(self.input_frame, text="Right File:")
-        self.right_file_entry = ttk.Entry(self.input_frame, width=60)
-        self.right_file_button = ttk.Button(self.input_frame, text="Browse...", command=self._browse_right_file)
+        # Live input check, refreshed shortly after typing stops
+        self.input_status_label = ttk.Label(self.input_frame, text="")
+        self.input_status_label.grid(row=1, column=0, sticky=tk.W, padx=5)
+        for entry in (self.multi_file_entry, self.left_file_entry, self.right_file_entry):
+            entry.bind('<KeyRelease>', self._schedule_validate)
         
         # Parameters section (dynamic based on operation)
         self.params_frame = ttk.LabelFrame(main_frame, text="Parameters", padding="10")
         self.params_frame.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=5)
-        self.params_frame.columnconfigure(1, weight=1)
+        self.params_frame.columnconfigure(0, weight=1)
         
-        # We'll create parameter widgets dynamically
+        # Each operation's parameter widgets live in their own frame, built
+        # the first time the operation is selected and reused afterwards
         self.param_widgets = {}
+        self._param_frames = {}  # operation -> (frame, param_widgets)
+        self._visible_params = None
         
         # Output section
         output_frame = ttk.LabelFrame(main_frame, text="Output", padding="10")
@@ -155,12 +371,21 @@ class iLoveExcelGUI:
         
         ttk.Button(button_frame, text="Clear Log", command=self._clear_log).grid(row=0, column=2, padx=5)
         
+        # Completion popups block the event loop until dismissed; off by default
+        self.popup_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            button_frame,
+            text="Popup on completion",
+            variable=self.popup_var
+        ).grid(row=0, column=3, padx=5)
+        
         # Progress bar
         self.progress_var = tk.DoubleVar()
         self.progress_bar = ttk.Progressbar(
             main_frame,
             variable=self.progress_var,
-            mode='indeterminate',
+            mode='determinate',
+            maximum=100,
             length=300
         )
         self.progress_bar.grid(row=6, column=0, sticky=(tk.W, tk.E), pady=5)
@@ -175,10 +400,11 @@ class iLoveExcelGUI:
             log_frame,
             width=80,
             height=15,
-            wrap=tk.WORD,
-            state=tk.DISABLED
+            wrap=tk.WORD
         )
+        _make_log_read_only(self.log_text)
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.log_text.tag_configure('error', foreground='red')
         
         # Configure main_frame row weights for resizing
         main_frame.rowconfigure(7, weight=1)
@@ -214,230 +440,234 @@ class iLoveExcelGUI:
     def _on_operation_changed(self):
         """Handle operation radio button change."""
         operation = self.operation_var.get()
+        # Re-clicking the selected radio button also fires; nothing to update
+        if operation == self.operation:
+            return
         self._update_ui_for_operation(operation)
     
     def _update_ui_for_operation(self, operation: str):
         """Update UI visibility based on selected operation."""
         self.operation = operation
-        
-        # Hide all input widgets first
-        self._hide_all_input_widgets()
-        
-        # Clear parameter widgets
-        for widget in self.param_widgets.values():
-            if isinstance(widget, (list, tuple)):
-                for w in widget:
-                    w.grid_forget()
-            else:
-                widget.grid_forget()
-        self.param_widgets.clear()
+        input_kind, input_label, param_builders = OPERATION_LAYOUTS[operation]
         
         # Show appropriate inputs and parameters
-        if operation == 'csv_to_excel':
-            self._show_multi_file_input("Select CSV Files:")
-            self._create_csv2excel_params()
+        self._show_input_widgets(input_kind, input_label)
+        self._show_param_frame(operation, param_builders)
+        self._schedule_validate()
         
-        elif operation == 'union':
-            self._show_multi_file_input("Select CSV Files to Union:")
-            self._create_union_params()
-        
-        elif operation == 'join':
-            self._show_dual_file_input()
-            self._create_join_params()
+        self._log(f"Switched to operation: {operation}")
+    
+    def _show_input_widgets(self, input_kind: str, label_text: Optional[str]):
+        """Show the multi-file or dual-file input group, hiding the other one."""
+        if input_kind == 'multi':
+            self.multi_file_label.config(text=label_text)
         
-        elif operation == 'join_excel':
-            self._show_multi_file_input("Select Excel File:")
-            self._create_join_params()
-            self._create_excel_sheet_params()
+        # Only touch the geometry manager when the visible group changes
+        if input_kind == self._visible_input:
+            return
         
-        elif operation == 'merge_excel':
-            self._show_multi_file_input("Select Excel Files to Merge:")
-            self._create_merge_params()
+        # grid_remove keeps the frame's grid options, so showing it again
+        # later doesn't have to re-specify them
+        if self._visible_input is not None:
+            self._input_frames[self._visible_input].grid_remove()
         
-        self._log(f"Switched to operation: {operation}")
+        self._input_frames[input_kind].grid(row=0, column=0, sticky=(tk.W, tk.E))
+        self._visible_input = input_kind
     
-    def _hide_all_input_widgets(self):
-        """Hide all input widgets."""
-        self.multi_file_label.grid_forget()
-        self.multi_file_entry.grid_forget()
-        self.multi_file_button.grid_forget()
-        self.left_file_label.grid_forget()
-        self.left_file_entry.grid_forget()
-        self.left_file_button.grid_forget()
-        self.right_file_label.grid_forget()
-        self.right_file_entry.grid_forget()
-        self.right_file_button.grid_forget()
-    
-    def _show_multi_file_input(self, label_text: str):
-        """Show multi-file input widgets."""
-        self.multi_file_label.config(text=label_text)
-        self.multi_file_label.grid(row=0, column=0, sticky=tk.W, padx=5)
-        self.multi_file_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5, pady=2)
-        self.multi_file_button.grid(row=0, column=2, padx=5)
+    def _schedule_validate(self, event=None):
+        """Validate the input files once typing pauses for VALIDATE_DELAY_MS."""
+        # Only the latest edit matters: drop the check scheduled by the previous one
+        if self._validate_after_id is not None:
+            self.root.after_cancel(self._validate_after_id)
+        self._validate_after_id = self.root.after(VALIDATE_DELAY_MS, self._validate_inputs)
     
-    def _show_dual_file_input(self):
-        """Show dual-file input widgets."""
-        self.left_file_label.grid(row=0, column=0, sticky=tk.W, padx=5)
-        self.left_file_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5, pady=2)
-        self.left_file_button.grid(row=0, column=2, padx=5)
+    def _validate_inputs(self):
+        """Check the visible input files and show the result below them."""
+        self._validate_after_id = None
         
-        self.right_file_label.grid(row=1, column=0, sticky=tk.W, padx=5)
-        self.right_file_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=5, pady=2)
-        self.right_file_button.grid(row=1, column=2, padx=5)
+        if self._visible_input == 'dual':
+            files = [entry.get().strip() for entry in (self.left_file_entry, self.right_file_entry)]
+            files = [f for f in files if f]
+        else:
+            files = parse_file_list(self.multi_file_entry.get(), separator=';')
+        
+        # stat() can take seconds on network paths, so check on a helper thread
+        self._validate_generation += 1
+        threading.Thread(
+            target=self._check_input_files,
+            args=(files, self._validate_generation),
+            daemon=True
+        ).start()
+    
+    def _check_input_files(self, files: List[str], generation: int):
+        """Check that files exist (helper thread) and post the status text."""
+        status = f"✓ {len(files)} file(s) found" if files else ""
+        for path in files:
+            is_valid, error = validate_file_path(path)
+            if not is_valid:
+                status = f"✗ {error}"
+                break
+        
+        self._input_status = (generation, status)
+        _post_event(self.root, INPUTS_CHECKED_EVENT)
     
-    def _create_csv2excel_params(self):
+    def _on_inputs_checked(self, event=None):
+        """Show the latest input file check; results of superseded checks are dropped."""
+        generation, status = self._input_status
+        if generation == self._validate_generation:
+            self.input_status_label.config(text=status)
+    
+    def _show_param_frame(self, operation: str, param_builders: Tuple[str, ...]):
+        """Show the operation's parameter frame, building it on first use."""
+        if self._visible_params is not None:
+            self._param_frames[self._visible_params][0].grid_remove()
+        
+        if operation not in self._param_frames:
+            frame = ttk.Frame(self.params_frame)
+            frame.columnconfigure(1, weight=1)
+            self.param_widgets = {}
+            for builder in param_builders:
+                getattr(self, builder)(frame)
+            self._param_frames[operation] = (frame, self.param_widgets)
+        
+        frame, self.param_widgets = self._param_frames[operation]
+        frame.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        self._visible_params = operation
+    
+    def _create_csv2excel_params(self, parent: ttk.Frame):
         """Create parameters for CSV to Excel operation."""
         row = 0
         
         # Sheet names
-        label = ttk.Label(self.params_frame, text="Sheet Names:")
-        label.grid(row=row, column=0, sticky=tk.W, padx=5, pady=2)
+        label = ttk.Label(parent, text="Sheet Names:")
+        label.grid(row=row, **_GRID_LABEL)
         
-        entry = ttk.Entry(self.params_frame, width=50)
-        entry.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=5, pady=2)
+        entry = ttk.Entry(parent, width=50)
+        entry.grid(row=row, **_GRID_INPUT_STRETCH)
         
-        help_label = ttk.Label(
-            self.params_frame,
-            text="(Optional: comma-separated sheet names)",
-            font=("TkDefaultFont", 8)
-        )
-        help_label.grid(row=row, column=2, sticky=tk.W, padx=5)
+        help_label = ttk.Label(parent, text="(Optional: comma-separated sheet names)", font=_HELP_FONT)
+        help_label.grid(row=row, **_GRID_HELP)
         
         self.param_widgets['sheet_names'] = (label, entry, help_label)
     
-    def _create_union_params(self):
+    def _create_union_params(self, parent: ttk.Frame):
         """Create parameters for Union operation."""
         row = 0
         
         # Deduplication checkbox
         dedupe_var = tk.BooleanVar(value=False)
-        cb = ttk.Checkbutton(self.params_frame, text="Remove duplicate rows", variable=dedupe_var)
+        cb = ttk.Checkbutton(parent, text="Remove duplicate rows", variable=dedupe_var)
         cb.grid(row=row, column=0, columnspan=2, sticky=tk.W, padx=5, pady=2)
         self.param_widgets['dedupe_var'] = dedupe_var
         self.param_widgets['dedupe_cb'] = cb
         row += 1
         
         # Dedupe columns
-        label = ttk.Label(self.params_frame, text="Dedupe Columns:")
-        label.grid(row=row, column=0, sticky=tk.W, padx=5, pady=2)
+        label = ttk.Label(parent, text="Dedupe Columns:")
+        label.grid(row=row, **_GRID_LABEL)
         
-        entry = ttk.Entry(self.params_frame, width=50)
-        entry.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=5, pady=2)
+        entry = ttk.Entry(parent, width=50)
+        entry.grid(row=row, **_GRID_INPUT_STRETCH)
         
-        help_label = ttk.Label(
-            self.params_frame,
-            text="(Optional: comma-separated column names)",
-            font=("TkDefaultFont", 8)
-        )
-        help_label.grid(row=row, column=2, sticky=tk.W, padx=5)
+        help_label = ttk.Label(parent, text="(Optional: comma-separated column names)", font=_HELP_FONT)
+        help_label.grid(row=row, **_GRID_HELP)
         
         self.param_widgets['dedupe_cols'] = (label, entry, help_label)
         row += 1
         
         # Chunk size
-        label = ttk.Label(self.params_frame, text="Chunk Size:")
-        label.grid(row=row, column=0, sticky=tk.W, padx=5, pady=2)
-        
-        entry = ttk.Entry(self.params_frame, width=20)
-        entry.grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
-        
-        help_label = ttk.Label(
-            self.params_frame,
-            text="(Optional: for large files, e.g., 10000)",
-            font=("TkDefaultFont", 8)
+        label = ttk.Label(parent, text="Chunk Size:")
+        label.grid(row=row, **_GRID_LABEL)
+        
+        entry = ttk.Entry(
+            parent,
+            width=20,
+            validate='key',
+            validatecommand=(self.root.register(_is_digits), '%P')
         )
-        help_label.grid(row=row, column=2, sticky=tk.W, padx=5)
+        entry.grid(row=row, **_GRID_INPUT)
+        
+        help_label = ttk.Label(parent, text="(Optional: for large files, e.g., 10000)", font=_HELP_FONT)
+        help_label.grid(row=row, **_GRID_HELP)
         
         self.param_widgets['chunksize'] = (label, entry, help_label)
     
-    def _create_join_params(self):
+    def _create_join_params(self, parent: ttk.Frame):
         """Create parameters for Join operations."""
         row = 0
         
         # Join keys
-        label = ttk.Label(self.params_frame, text="Join Keys:")
-        label.grid(row=row, column=0, sticky=tk.W, padx=5, pady=2)
+        label = ttk.Label(parent, text="Join Keys:")
+        label.grid(row=row, **_GRID_LABEL)
         
-        entry = ttk.Entry(self.params_frame, width=50)
-        entry.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=5, pady=2)
+        entry = ttk.Entry(parent, width=50)
+        entry.grid(row=row, **_GRID_INPUT_STRETCH)
         
-        help_label = ttk.Label(
-            self.params_frame,
-            text="(Comma-separated column names)",
-            font=("TkDefaultFont", 8)
-        )
-        help_label.grid(row=row, column=2, sticky=tk.W, padx=5)
+        help_label = ttk.Label(parent, text="(Comma-separated column names)", font=_HELP_FONT)
+        help_label.grid(row=row, **_GRID_HELP)
         
         self.param_widgets['join_keys'] = (label, entry, help_label)
         row += 1
         
         # Join type
-        label = ttk.Label(self.params_frame, text="Join Type:")
-        label.grid(row=row, column=0, sticky=tk.W, padx=5, pady=2)
+        label = ttk.Label(parent, text="Join Type:")
+        label.grid(row=row, **_GRID_LABEL)
         
         join_type_var = tk.StringVar(value='inner')
         combo = ttk.Combobox(
-            self.params_frame,
+            parent,
             textvariable=join_type_var,
             values=['inner', 'left', 'right', 'outer', 'cross'],
             state='readonly',
             width=15
         )
-        combo.grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
+        combo.grid(row=row, **_GRID_INPUT)
         
         self.param_widgets['join_type_var'] = join_type_var
         self.param_widgets['join_type'] = (label, combo)
     
-    def _create_excel_sheet_params(self):
+    def _create_excel_sheet_params(self, parent: ttk.Frame):
         """Create parameters for Excel sheet selection."""
         # Get current row count
         row = len([w for w in self.param_widgets.values() if isinstance(w, tuple)]) + 1
         
         # Left sheet
-        label = ttk.Label(self.params_frame, text="Left Sheet:")
-        label.grid(row=row, column=0, sticky=tk.W, padx=5, pady=2)
+        label = ttk.Label(parent, text="Left Sheet:")
+        label.grid(row=row, **_GRID_LABEL)
         
-        entry = ttk.Entry(self.params_frame, width=30)
-        entry.grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
+        entry = ttk.Entry(parent, width=30)
+        entry.grid(row=row, **_GRID_INPUT)
         
-        help_label = ttk.Label(
-            self.params_frame,
-            text="(Sheet name or 0-based index)",
-            font=("TkDefaultFont", 8)
-        )
-        help_label.grid(row=row, column=2, sticky=tk.W, padx=5)
+        help_label = ttk.Label(parent, text="(Sheet name or 0-based index)", font=_HELP_FONT)
+        help_label.grid(row=row, **_GRID_HELP)
         
         self.param_widgets['left_sheet'] = (label, entry, help_label)
         row += 1
         
         # Right sheet
-        label = ttk.Label(self.params_frame, text="Right Sheet:")
-        label.grid(row=row, column=0, sticky=tk.W, padx=5, pady=2)
+        label = ttk.Label(parent, text="Right Sheet:")
+        label.grid(row=row, **_GRID_LABEL)
         
-        entry = ttk.Entry(self.params_frame, width=30)
-        entry.grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
+        entry = ttk.Entry(parent, width=30)
+        entry.grid(row=row, **_GRID_INPUT)
         
-        help_label = ttk.Label(
-            self.params_frame,
-            text="(Sheet name or 0-based index)",
-            font=("TkDefaultFont", 8)
-        )
-        help_label.grid(row=row, column=2, sticky=tk.W, padx=5)
+        help_label = ttk.Label(parent, text="(Sheet name or 0-based index)", font=_HELP_FONT)
+        help_label.grid(row=row, **_GRID_HELP)
         
         self.param_widgets['right_sheet'] = (label, entry, help_label)
     
-    def _create_merge_params(self):
+    def _create_merge_params(self, parent: ttk.Frame):
         """Create parameters for Merge Excel operation."""
         row = 0
         
         # Mode selection
-        label = ttk.Label(self.params_frame, text="Merge Mode:")
-        label.grid(row=row, column=0, sticky=tk.W, padx=5, pady=2)
+        label = ttk.Label(parent, text="Merge Mode:")
+        label.grid(row=row, **_GRID_LABEL)
         
         mode_var = tk.StringVar(value='lenient')
         
-        frame = ttk.Frame(self.params_frame)
-        frame.grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
+        frame = ttk.Frame(parent)
+        frame.grid(row=row, **_GRID_INPUT)
         
         ttk.Radiobutton(frame, text="Lenient (unions all columns)", variable=mode_var, value='lenient').pack(side=tk.LEFT, padx=5)
         ttk.Radiobutton(frame, text="Strict (requires identical columns)", variable=mode_var, value='strict').pack(side=tk.LEFT, padx=5)
@@ -449,225 +679,201 @@ class iLoveExcelGUI:
     
     def _browse_multi_files(self):
         """Browse for multiple files."""
-        filetypes = [
-            ("CSV and Excel files", "*.csv *.xlsx *.xls"),
-            ("CSV files", "*.csv"),
-            ("Excel files", "*.xlsx *.xls"),
-            ("All files", "*.*")
-        ]
-        files = filedialog.askopenfilenames(title="Select Files", filetypes=filetypes)
+        files = filedialog.askopenfilenames(
+            title="Select Files", filetypes=_FILETYPES_INPUTS, initialdir=self.state.last_dir
+        )
         if files:
+            self.state.remember_dir(files[0])
             self.multi_file_entry.delete(0, tk.END)
             self.multi_file_entry.insert(0, ";".join(files))
+            self._schedule_validate()
     
     def _browse_left_file(self):
         """Browse for left file."""
-        filetypes = [
-            ("CSV and Excel files", "*.csv *.xlsx *.xls"),
-            ("All files", "*.*")
-        ]
-        file = filedialog.askopenfilename(title="Select Left File", filetypes=filetypes)
+        file = filedialog.askopenfilename(
+            title="Select Left File", filetypes=_FILETYPES_INPUT, initialdir=self.state.last_dir
+        )
         if file:
+            self.state.remember_dir(file)
             self.left_file_entry.delete(0, tk.END)
             self.left_file_entry.insert(0, file)
+            self._schedule_validate()
     
     def _browse_right_file(self):
         """Browse for right file."""
-        filetypes = [
-            ("CSV and Excel files", "*.csv *.xlsx *.xls"),
-            ("All files", "*.*")
-        ]
-        file = filedialog.askopenfilename(title="Select Right File", filetypes=filetypes)
+        file = filedialog.askopenfilename(
+            title="Select Right File", filetypes=_FILETYPES_INPUT, initialdir=self.state.last_dir
+        )
         if file:
+            self.state.remember_dir(file)
             self.right_file_entry.delete(0, tk.END)
             self.right_file_entry.insert(0, file)
+            self._schedule_validate()
     
     def _browse_output(self):
         """Browse for output file."""
         if self.operation in ['csv_to_excel', 'join_excel', 'merge_excel']:
-            filetypes = [("Excel files", "*.xlsx"), ("All files", "*.*")]
+            filetypes = _FILETYPES_EXCEL
             defaultextension = ".xlsx"
         else:
-            filetypes = [("CSV files", "*.csv"), ("All files", "*.*")]
+            filetypes = _FILETYPES_CSV
             defaultextension = ".csv"
         
         file = filedialog.asksaveasfilename(
             title="Select Output File",
             filetypes=filetypes,
-            defaultextension=defaultextension
+            defaultextension=defaultextension,
+            initialdir=self.state.last_dir
         )
         if file:
+            self.state.remember_dir(file)
             self.output_entry.delete(0, tk.END)
             self.output_entry.insert(0, file)
     
     # Operation execution
     
     def _start_operation(self):
-        """Start the selected operation in a background thread."""
+        """Start the selected operation in a background worker process."""
         if self.state.is_running:
             messagebox.showwarning("Operation Running", "An operation is already running!")
             return
         
         try:
             # Validate and prepare operation
-            operation_func, args, kwargs = self._prepare_operation()
+            operation_func, args, kwargs, files = self._prepare_operation()
             
-            # Clear queues
-            while not self.log_queue.empty():
-                self.log_queue.get()
-            while not self.result_queue.empty():
-                self.result_queue.get()
+            # Fresh queues for this run; a previous worker keeps its own, so
+            # nothing it still sends can leak into this operation
+            self.log_queue = collections.deque(maxlen=LOG_QUEUE_MAXLEN)
+            self.result_queue = queue.Queue()
+            self.progress_queue = queue.Queue()
             
-            # Start worker thread
-            self.worker_thread = WorkerThread(
+            # Start worker (task runs in the shared process pool)
+            pool_busy = process_pool_busy()
+            self.worker_thread = WorkerProcess(
                 operation_func,
                 args,
                 kwargs,
                 self.result_queue,
-                self.log_queue
+                self.log_queue,
+                progress_queue=self.progress_queue,
+                notify=self._notify_log,
+                input_files=files,
+                notify_done=self._notify_done
             )
             self.worker_thread.start()
+            self._log(_START_BANNER.format(OPERATION_TITLES[self.operation]))
+            if pool_busy:
+                self._log(_QUEUED_MESSAGE)
             
             # Update UI state
             self.state.is_running = True
             self.start_button.config(state=tk.DISABLED)
             self.stop_button.config(state=tk.NORMAL)
-            self.progress_bar.start()
-            
-            # Start result polling
-            self._poll_result_queue()
+            self.progress_var.set(0)
             
         except Exception as e:
             logger.error(f"Failed to start operation: {e}", exc_info=True)
             messagebox.showerror("Error", f"Failed to start operation:\n{e}")
     
     def _prepare_operation(self) -> Tuple:
-        """Prepare operation function and arguments based on current settings."""
-        operation = self.operation
+        """
+        Prepare operation function and arguments based on current settings.
         
-        if operation == 'csv_to_excel':
-            files_str = self.multi_file_entry.get()
-            files = parse_file_list(files_str, separator=';')
-            if not files:
-                raise ValueError("No input CSV files selected")
-            
-            output = self.output_entry.get().strip()
-            if not output:
-                raise ValueError("No output Excel file specified")
-            
-            sheet_names_str = self.param_widgets['sheet_names'][1].get().strip()
-            sheet_names = [s.strip() for s in sheet_names_str.split(',') if s.strip()] if sheet_names_str else None
-            
-            return csvs_to_excel, (files, output), {'sheet_names': sheet_names}
+        Only the entry strings are checked here; the input files themselves
+        are checked by the worker, off the GUI thread.
         
-        elif operation == 'union':
-            files_str = self.multi_file_entry.get()
-            files = parse_file_list(files_str, separator=';')
-            if len(files) < 2:
-                raise ValueError("Need at least 2 CSV files for union")
-            
-            output = self.output_entry.get().strip()
-            if not output:
-                raise ValueError("No output CSV file specified")
-            
-            dedupe = self.param_widgets['dedupe_var'].get()
-            
-            dedupe_cols_str = self.param_widgets['dedupe_cols'][1].get().strip()
-            dedupe_cols = [c.strip() for c in dedupe_cols_str.split(',') if c.strip()] if dedupe_cols_str else None
-            
-            chunksize_str = self.param_widgets['chunksize'][1].get().strip()
-            chunksize = int(chunksize_str) if chunksize_str else None
-            
-            return (
-                union_multiple_csvs,
-                (files, output),
-                {'dedupe': dedupe, 'dedupe_columns': dedupe_cols, 'chunksize': chunksize, 'progress': False}
-            )
+        Returns:
+            Tuple of (func, args, kwargs, input files)
+        """
+        if self.operation not in OPERATION_RUNNERS:
+            raise ValueError(f"Unknown operation: {self.operation}")
         
-        elif operation == 'join':
-            left_file = self.left_file_entry.get().strip()
-            right_file = self.right_file_entry.get().strip()
-            
-            if not left_file or not right_file:
+        builder, min_files, max_files, input_type, output_type = OPERATION_RUNNERS[self.operation]
+        
+        # Common validation: input files and output path
+        if OPERATION_LAYOUTS[self.operation][0] == 'dual':
+            files = [self.left_file_entry.get().strip(), self.right_file_entry.get().strip()]
+            if not all(files):
                 raise ValueError("Both left and right files must be specified")
-            
-            output = self.output_entry.get().strip()
-            if not output:
-                raise ValueError("No output CSV file specified")
-            
-            join_keys_str = self.param_widgets['join_keys'][1].get().strip()
-            if not join_keys_str:
-                raise ValueError("Join keys must be specified")
-            join_keys = [k.strip() for k in join_keys_str.split(',')]
-            
-            join_type = self.param_widgets['join_type_var'].get()
-            
-            return (
-                join_csvs,
-                (left_file, right_file, join_keys, output),
-                {'how': join_type}
-            )
+        else:
+            files = parse_file_list(self.multi_file_entry.get(), separator=';')
+            if max_files == 1 and len(files) != 1:
+                raise ValueError(f"Please select exactly one {input_type} file")
+            if not files:
+                raise ValueError(f"No input {input_type} files selected")
+            if len(files) < min_files:
+                raise ValueError(f"Need at least {min_files} {input_type} files")
         
-        elif operation == 'join_excel':
-            excel_file = self.multi_file_entry.get().strip()
-            if not excel_file or ';' in excel_file:
-                raise ValueError("Please select exactly one Excel file")
-            
-            output = self.output_entry.get().strip()
-            if not output:
-                raise ValueError("No output Excel file specified")
-            
-            left_sheet = self.param_widgets['left_sheet'][1].get().strip()
-            right_sheet = self.param_widgets['right_sheet'][1].get().strip()
-            
-            if not left_sheet or not right_sheet:
-                raise ValueError("Both left and right sheet must be specified")
-            
-            # Try to convert to int if possible (for index-based selection)
-            try:
-                left_sheet = int(left_sheet)
-            except ValueError:
-                pass  # Use as string (sheet name)
-            
-            try:
-                right_sheet = int(right_sheet)
-            except ValueError:
-                pass
-            
-            join_keys_str = self.param_widgets['join_keys'][1].get().strip()
-            if not join_keys_str:
-                raise ValueError("Join keys must be specified")
-            join_keys = [k.strip() for k in join_keys_str.split(',')]
-            
-            join_type = self.param_widgets['join_type_var'].get()
-            
-            return (
-                join_excel_sheets_to_file,
-                (excel_file, left_sheet, right_sheet, join_keys, output),
-                {'how': join_type}
-            )
+        output = self.output_entry.get().strip()
+        if not output:
+            raise ValueError(f"No output {output_type} file specified")
         
-        elif operation == 'merge_excel':
-            files_str = self.multi_file_entry.get()
-            files = parse_file_list(files_str, separator=';')
-            if len(files) < 2:
-                raise ValueError("Need at least 2 Excel files for merge")
-            
-            output = self.output_entry.get().strip()
-            if not output:
-                raise ValueError("No output Excel file specified")
-            
-            mode = self.param_widgets['mode_var'].get()
-            strict_mode = (mode == 'strict')
-            
-            return (
-                merge_excel_files,
-                (files, output),
-                {'strict_mode': strict_mode}
-            )
+        return (*getattr(self, builder)(files, output), files)
+    
+    def _join_params(self) -> Tuple[List[str], str]:
+        """Read join keys and join type from the join parameter widgets."""
+        join_keys = parse_file_list(self.param_widgets['join_keys'][1].get(), separator=',')
+        if not join_keys:
+            raise ValueError("Join keys must be specified")
+        return join_keys, self.param_widgets['join_type_var'].get()
+    
+    def _build_csv_to_excel(self, files: List[str], output: str) -> Tuple:
+        """Build the csvs_to_excel call."""
+        from .io import csvs_to_excel
         
-        else:
-            raise ValueError(f"Unknown operation: {operation}")
+        sheet_names = parse_file_list(self.param_widgets['sheet_names'][1].get(), separator=',') or None
+        return csvs_to_excel, (files, output), {'sheet_names': sheet_names}
+    
+    def _build_union(self, files: List[str], output: str) -> Tuple:
+        """Build the union_multiple_csvs call."""
+        from .unions import union_multiple_csvs
+        
+        dedupe = self.param_widgets['dedupe_var'].get()
+        dedupe_cols = parse_file_list(self.param_widgets['dedupe_cols'][1].get(), separator=',') or None
+        
+        chunksize_str = self.param_widgets['chunksize'][1].get().strip()
+        chunksize = int(chunksize_str) if chunksize_str.isdecimal() else None
+        
+        return (
+            union_multiple_csvs,
+            (files, output),
+            {'dedupe': dedupe, 'dedupe_columns': dedupe_cols, 'chunksize': chunksize, 'progress': False}
+        )
+    
+    def _build_join(self, files: List[str], output: str) -> Tuple:
+        """Build the join_csvs call."""
+        from .joins import join_csvs
+        
+        join_keys, join_type = self._join_params()
+        left_file, right_file = files
+        return join_csvs, (left_file, right_file, join_keys), {'how': join_type, 'output_file': output}
+    
+    def _build_join_excel(self, files: List[str], output: str) -> Tuple:
+        """Build the join_excel_sheets_to_file call."""
+        from .joins import join_excel_sheets_to_file
+        
+        left_sheet = self.param_widgets['left_sheet'][1].get().strip()
+        right_sheet = self.param_widgets['right_sheet'][1].get().strip()
+        
+        if not left_sheet or not right_sheet:
+            raise ValueError("Both left and right sheet must be specified")
+        
+        join_keys, join_type = self._join_params()
+        
+        # Numeric values select sheets by index
+        return (
+            join_excel_sheets_to_file,
+            (files[0], output, _sheet_ref(left_sheet), _sheet_ref(right_sheet), join_keys),
+            {'how': join_type}
+        )
+    
+    def _build_merge_excel(self, files: List[str], output: str) -> Tuple:
+        """Build the merge_excel_files call."""
+        from .excel_merge import merge_excel_files
+        
+        mode = self.param_widgets['mode_var'].get()
+        return merge_excel_files, (files, output), {'mode': mode, 'progress': False}
     
     def _stop_operation(self):
         """Stop the running operation (if possible)."""
@@ -676,59 +882,73 @@ class iLoveExcelGUI:
             self._log("⚠ Operation stop requested (thread will finish current task)...")
             messagebox.showinfo("Stop", "Stop requested. The operation will finish its current task.")
     
-    def _poll_result_queue(self):
-        """Poll the result queue for operation completion."""
+    def _update_progress(self):
+        """Show the latest queued progress value; earlier ones are skipped."""
+        progress = drain_queue(self.progress_queue)
+        if progress:
+            self.progress_var.set(progress[-1])
+    
+    def _notify_done(self):
+        """Signal the Tk event loop that the operation finished (worker thread)."""
+        _post_event(self.root, OPERATION_DONE_EVENT)
+    
+    def _on_operation_done(self, event=None):
+        """Handle operation completion once the worker has queued its result."""
+        # Flush log records still queued before writing the final banner
+        self._on_log_event()
+        
         try:
             status, result = self.result_queue.get_nowait()
             
             # Operation completed
+            self.worker_thread = None
             self.state.is_running = False
             self.start_button.config(state=tk.NORMAL)
             self.stop_button.config(state=tk.DISABLED)
-            self.progress_bar.stop()
             
             if status == 'success':
-                self._log(f"✓ Operation completed successfully!")
-                messagebox.showinfo("Success", "Operation completed successfully!")
+                self.progress_var.set(100)
+                self._log(_SUCCESS_BANNER)
+                if self.popup_var.get():
+                    messagebox.showinfo("Success", "Operation completed successfully!")
             else:  # error
-                self._log(f"✗ Error: {result}")
-                messagebox.showerror("Error", f"Operation failed:\n{result}")
+                self.progress_var.set(0)
+                self._log(_FAILURE_BANNER.format(result), tag='error')
+                if self.popup_var.get():
+                    messagebox.showerror("Error", f"Operation failed:\n{result}")
         
         except queue.Empty:
-            # Keep polling if operation still running
-            if self.state.is_running:
-                self.root.after(100, self._poll_result_queue)
+            pass  # Stale event from a stopped worker that queued no result
     
-    def _poll_log_queue(self):
-        """Poll the log queue for messages."""
-        try:
-            while True:
-                message = self.log_queue.get_nowait()
-                self._log(message.rstrip())
-        except queue.Empty:
-            pass
-        
-        # Continue polling
-        self.root.after(100, self._poll_log_queue)
+    def _notify_log(self):
+        """Signal the Tk event loop that log messages are queued (worker thread)."""
+        _post_event(self.root, LOG_EVENT)
     
-    def _log(self, message: str):
-        """Add message to log output."""
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message + '\n')
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+    def _on_log_event(self, event=None):
+        """Flush queued log messages to the log pane and update the progress bar."""
+        self._update_progress()
+        if not _drain_log_queue(self.log_queue, self._log):
+            # More messages than one batch: continue once Tk is idle again
+            self.root.after_idle(self._on_log_event)
+    
+    def _log(self, message: str, tag: Optional[str] = None):
+        """Add message to log output, optionally styled with a text tag."""
+        _append_log(self.log_text, message, tag or ())
+    
+    def _on_close(self):
+        """Persist GUI state and close the main window."""
+        save_gui_state({'last_dir': self.state.last_dir})
+        self.root.destroy()
     
     def _clear_log(self):
         """Clear the log output."""
-        self.log_text.config(state=tk.NORMAL)
         self.log_text.delete('1.0', tk.END)
-        self.log_text.config(state=tk.DISABLED)
     
     # Diff window
     
     def _open_diff_window(self):
         """Open the CSV diff comparison window."""
-        DiffWindow(self.root)
+        DiffWindow(self.root, self.state)
     
     # Help dialogs
     
@@ -813,18 +1033,20 @@ GUI Backend: Tkinter (Open Source)
 class DiffWindow:
     """CSV Side-by-Side Diff window."""
     
-    def __init__(self, parent):
-        """Initialize diff window."""
+    def __init__(self, parent, state: Optional[GUIState] = None):
+        """Initialize diff window; state is shared with the main window."""
         self.window = tk.Toplevel(parent)
         self.window.title("CSV Side-by-Side Diff Comparison")
         self.window.geometry("1100x700")
         
+        self.state = state or GUIState()
         self.worker_thread = None
-        self.log_queue = queue.Queue()
+        self.log_queue = collections.deque(maxlen=LOG_QUEUE_MAXLEN)
         self.result_queue = queue.Queue()
         
         self._create_widgets()
-        self._poll_log_queue()
+        self.window.bind(LOG_EVENT, self._on_log_event)
+        self.window.bind(OPERATION_DONE_EVENT, self._on_compare_done)
     
     def _create_widgets(self):
         """Create diff window widgets."""
@@ -886,7 +1108,12 @@ class DiffWindow:
         max_rows_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(max_rows_frame, text="Max Rows to Display:").pack(side=tk.LEFT, padx=5)
-        self.max_rows_entry = ttk.Entry(max_rows_frame, width=10)
+        self.max_rows_entry = ttk.Entry(
+            max_rows_frame,
+            width=10,
+            validate='key',
+            validatecommand=(self.window.register(_is_digits), '%P')
+        )
         self.max_rows_entry.insert(0, "1000")
         self.max_rows_entry.pack(side=tk.LEFT, padx=5)
         ttk.Label(max_rows_frame, text="(0 = unlimited)", font=("TkDefaultFont", 8)).pack(side=tk.LEFT)
@@ -910,7 +1137,8 @@ class DiffWindow:
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(pady=10)
         
-        ttk.Button(button_frame, text="Compare", command=self._compare).pack(side=tk.LEFT, padx=5)
+        self.compare_button = ttk.Button(button_frame, text="Compare", command=self._compare)
+        self.compare_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Export to Excel", command=self._export).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Clear", command=self._clear).pack(side=tk.LEFT, padx=5)
         
@@ -922,7 +1150,8 @@ class DiffWindow:
         log_frame = ttk.LabelFrame(main_frame, text="Log", padding="5")
         log_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
-        self.log_text = scrolledtext.ScrolledText(log_frame, height=10, wrap=tk.WORD, state=tk.DISABLED)
+        self.log_text = scrolledtext.ScrolledText(log_frame, height=10, wrap=tk.WORD)
+        _make_log_read_only(self.log_text)
         self.log_text.pack(fill=tk.BOTH, expand=True)
         
         # Store diff results
@@ -933,9 +1162,11 @@ class DiffWindow:
         """Browse for file A."""
         file = filedialog.askopenfilename(
             title="Select File A",
-            filetypes=[("CSV and Excel files", "*.csv *.xlsx *.xls"), ("All files", "*.*")]
+            filetypes=_FILETYPES_INPUT,
+            initialdir=self.state.last_dir
         )
         if file:
+            self.state.remember_dir(file)
             self.file_a_entry.delete(0, tk.END)
             self.file_a_entry.insert(0, file)
     
@@ -943,9 +1174,11 @@ class DiffWindow:
         """Browse for file B."""
         file = filedialog.askopenfilename(
             title="Select File B",
-            filetypes=[("CSV and Excel files", "*.csv *.xlsx *.xls"), ("All files", "*.*")]
+            filetypes=_FILETYPES_INPUT,
+            initialdir=self.state.last_dir
         )
         if file:
+            self.state.remember_dir(file)
             self.file_b_entry.delete(0, tk.END)
             self.file_b_entry.insert(0, file)
     
@@ -953,15 +1186,19 @@ class DiffWindow:
         """Browse for output file."""
         file = filedialog.asksaveasfilename(
             title="Select Output File",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
-            defaultextension=".xlsx"
+            filetypes=_FILETYPES_EXCEL,
+            defaultextension=".xlsx",
+            initialdir=self.state.last_dir
         )
         if file:
+            self.state.remember_dir(file)
             self.output_entry.delete(0, tk.END)
             self.output_entry.insert(0, file)
     
     def _compare(self):
-        """Run comparison."""
+        """Start the comparison in the background worker process."""
+        from .diffs import diff_csv_side_by_side
+        
         try:
             file_a = self.file_a_entry.get().strip()
             file_b = self.file_b_entry.get().strip()
@@ -974,56 +1211,98 @@ class DiffWindow:
             
             key_columns = None
             if not compare_by_index:
-                key_cols_str = self.key_cols_entry.get().strip()
-                if not key_cols_str:
+                key_columns = parse_file_list(self.key_cols_entry.get(), separator=',')
+                if not key_columns:
                     messagebox.showerror("Error", "Key column(s) must be specified for key-based comparison")
                     return
-                key_columns = [k.strip() for k in key_cols_str.split(',')]
             
             max_rows_str = self.max_rows_entry.get().strip()
-            max_rows = int(max_rows_str) if max_rows_str and max_rows_str != '0' else None
+            max_rows = (int(max_rows_str) or None) if max_rows_str.isdecimal() else None
             
-            # Run comparison
+            # Run comparison off the Tk thread; _on_compare_done picks up the result
             self._log("Starting comparison...")
+            if process_pool_busy():
+                self._log(_QUEUED_MESSAGE)
+            self.compare_button.config(state=tk.DISABLED)
             
-            self.diff_df, self.stats = diff_csv_side_by_side(
-                file_a,
-                file_b,
-                key_columns=key_columns,
-                compare_by_index=compare_by_index,
-                ignore_whitespace=self.ignore_whitespace_var.get(),
-                case_insensitive=self.case_insensitive_var.get(),
-                ignore_column_order=False,
-                show_only_diffs=self.show_only_diffs_var.get(),
-                max_rows=max_rows
-            )
-            
-            # Update summary
-            summary = (
-                f"Summary: {self.stats['total']} total rows compared • "
-                f"{self.stats['different']} differences found • "
-                f"{self.stats['matching']} matching • "
-                f"{self.stats['only_a']} only in A • "
-                f"{self.stats['only_b']} only in B"
+            self.log_queue = collections.deque(maxlen=LOG_QUEUE_MAXLEN)
+            self.result_queue = queue.Queue()
+            self.worker_thread = WorkerProcess(
+                diff_csv_side_by_side,
+                (file_a, file_b),
+                {
+                    'key_columns': key_columns,
+                    'compare_by_index': compare_by_index,
+                    'ignore_whitespace': self.ignore_whitespace_var.get(),
+                    'case_insensitive': self.case_insensitive_var.get(),
+                    'ignore_column_order': False,
+                    'show_only_diffs': self.show_only_diffs_var.get(),
+                    'max_rows': max_rows,
+                    # The worker process keeps the parsed files, so comparing
+                    # again with other options skips reading them
+                    'use_cache': True,
+                },
+                self.result_queue,
+                self.log_queue,
+                notify=self._notify_log,
+                input_files=[file_a, file_b],
+                notify_done=self._notify_done
             )
-            self.summary_label.config(text=summary)
-            
-            self._log(f"✓ Comparison complete: {self.stats}")
-            self._log(f"  Total rows: {self.stats['total']}")
-            self._log(f"  Differences: {self.stats['different']}")
-            self._log(f"  Matches: {self.stats['matching']}")
-            self._log(f"  Only in A: {self.stats['only_a']}")
-            self._log(f"  Only in B: {self.stats['only_b']}")
-            
-            messagebox.showinfo("Success", "Comparison completed! See log for details.\nUse 'Export to Excel' to save results.")
+            self.worker_thread.start()
         
         except Exception as e:
             logger.error(f"Diff comparison error: {e}", exc_info=True)
             self._log(f"✗ Error: {e}")
             messagebox.showerror("Error", f"Comparison failed:\n{e}")
     
+    def _notify_done(self):
+        """Signal the Tk event loop that the comparison finished (worker thread)."""
+        _post_event(self.window, OPERATION_DONE_EVENT)
+    
+    def _on_compare_done(self, event=None):
+        """Show the comparison result once the worker has queued it."""
+        self._on_log_event()
+        
+        try:
+            status, result = self.result_queue.get_nowait()
+        except queue.Empty:
+            return
+        
+        self.worker_thread = None
+        self.compare_button.config(state=tk.NORMAL)
+        
+        if status != 'success':
+            self._log(f"✗ Error: {result}")
+            messagebox.showerror("Error", f"Comparison failed:\n{result}")
+            return
+        
+        self.diff_df, self.stats = result
+        
+        # Update summary
+        summary = (
+            f"Summary: {self.stats['total']} total rows compared • "
+            f"{self.stats['different']} differences found • "
+            f"{self.stats['matching']} matching • "
+            f"{self.stats['only_a']} only in A • "
+            f"{self.stats['only_b']} only in B"
+        )
+        self.summary_label.config(text=summary)
+        
+        self._log(
+            f"✓ Comparison complete: {self.stats}\n"
+            f"  Total rows: {self.stats['total']}\n"
+            f"  Differences: {self.stats['different']}\n"
+            f"  Matches: {self.stats['matching']}\n"
+            f"  Only in A: {self.stats['only_a']}\n"
+            f"  Only in B: {self.stats['only_b']}"
+        )
+        
+        messagebox.showinfo("Success", "Comparison completed! See log for details.\nUse 'Export to Excel' to save results.")
+    
     def _export(self):
         """Export diff results to Excel."""
+        from .diffs import export_diff_to_excel
+        
         if self.diff_df is None or self.stats is None:
             messagebox.showwarning("Warning", "Please run comparison first!")
             return
@@ -1069,34 +1348,30 @@ class DiffWindow:
     
     def _log(self, message: str):
         """Add message to log."""
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message + '\n')
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        _append_log(self.log_text, message)
     
     def _clear_log(self):
         """Clear log."""
-        self.log_text.config(state=tk.NORMAL)
         self.log_text.delete('1.0', tk.END)
-        self.log_text.config(state=tk.DISABLED)
     
-    def _poll_log_queue(self):
-        """Poll log queue."""
-        try:
-            while True:
-                message = self.log_queue.get_nowait()
-                self._log(message.rstrip())
-        except queue.Empty:
-            pass
-        
-        self.window.after(100, self._poll_log_queue)
+    def _notify_log(self):
+        """Signal the Tk event loop that log messages are queued (worker thread)."""
+        _post_event(self.window, LOG_EVENT)
+    
+    def _on_log_event(self, event=None):
+        """Flush queued log messages to the log pane."""
+        if not _drain_log_queue(self.log_queue, self._log):
+            self.window.after_idle(self._on_log_event)
 
 
 def main_gui():
     """Launch the Tkinter GUI."""
-    # Set up logging
+    # Logging is only configured when running as the GUI, never on import
     setup_logging()
     
+    # Warm up the worker process while the window is being built
+    start_process_pool()
+    
     # Create root window
     root = tk.Tk()
     
@@ -5,14 +5,56 @@ This module provides utility functions for reading and writing CSV and Excel fil
 with support for chunked processing for large files.
 """
 
+import functools
+import importlib.util
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+
+from .io_helpers import get_column_widths_from_dataframe
+from .utils import safe_sheet_name
 
 logger = logging.getLogger(__name__)
 
+# pyarrow's multithreaded CSV parser (pandas engine='pyarrow') is used for
+# whole-file reads when available; it returns NumPy-backed columns like the
+# default C engine
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+# python-calamine (Rust) parses Excel files several times faster than
+# openpyxl and is used for sheet reads and sheet listings when installed;
+# pd.read_excel only accepts engine='calamine' from pandas 2.2
+_HAS_CALAMINE = importlib.util.find_spec('python_calamine') is not None
+_PANDAS_CALAMINE = _HAS_CALAMINE and tuple(map(int, pd.__version__.split('.')[:2])) >= (2, 2)
+
+# Options for plain whole-file CSV reads. low_memory=False makes the C engine
+# infer each column's type once over the whole file instead of per internal
+# block (no mixed-type columns, no re-unification copies); it is not set when
+# callers pass their own options, since the python-engine fallback (e.g. for
+# regex separators) rejects it
+_FAST_CSV_READ_OPTIONS = (
+    {'engine': 'pyarrow'} if _HAS_PYARROW
+    else {'engine': 'c', 'low_memory': False, 'memory_map': True}
+)
+
+# Header cell style of pandas' ExcelWriter (bold, thin border, centered),
+# reproduced for sheets streamed through openpyxl's write-only mode
+_HEADER_FONT = Font(bold=True)
+_HEADER_BORDER = Border(*(Side(style='thin'),) * 4)
+_HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='top')
+
+# Rows read per chunk when csvs_to_excel streams a CSV into its sheet
+CSV_TO_EXCEL_CHUNKSIZE = 100_000
+
 
 def read_csv_chunked(
     file_path: Union[str, Path],
@@ -22,6 +64,12 @@ def read_csv_chunked(
     """
     Read a CSV file with optional chunking for large files.
     
+    Whole-file reads without extra pd.read_csv options use the pyarrow
+    engine when pyarrow is installed, otherwise the C engine with
+    memory-mapped input and single-pass type inference (low_memory=False).
+    Chunked reads and reads with caller options use pandas' defaults
+    overridden only by those options.
+    
     Args:
         file_path: Path to the CSV file
         chunksize: Number of rows per chunk (None = read all at once)
@@ -36,19 +84,21 @@ def read_csv_chunked(
     """
     file_path = Path(file_path)
     
-    if not file_path.exists():
-        raise FileNotFoundError(f"CSV file not found: {file_path}")
-    
     logger.info(f"Reading CSV: {file_path} (chunksize={chunksize})")
     
     try:
         if chunksize is None:
+            if not kwargs:
+                kwargs = _FAST_CSV_READ_OPTIONS
             df = pd.read_csv(file_path, **kwargs)
             logger.info(f"Loaded {len(df)} rows from {file_path}")
             return df
         else:
             # Return iterator for chunked processing
             return pd.read_csv(file_path, chunksize=chunksize, **kwargs)
+    except FileNotFoundError as e:
+        # Let the open itself detect a missing file (no separate stat call)
+        raise FileNotFoundError(f"CSV file not found: {file_path}") from e
     except pd.errors.EmptyDataError:
         raise ValueError(f"CSV file is empty: {file_path}")
     except Exception as e:
@@ -102,20 +152,134 @@ def read_excel_sheet(
         FileNotFoundError: If the file doesn't exist
         ValueError: If the sheet doesn't exist
     """
-    file_path = Path(file_path)
+    return _read_excel_sheets(file_path, [sheet_name], **kwargs)[sheet_name]
+
+
+def _read_excel_sheets(
+    file_path: Union[str, Path],
+    sheet_names: List[Union[str, int]],
+    **kwargs
+) -> Dict[Union[str, int], pd.DataFrame]:
+    """
+    Read several sheets of an Excel file, opening the workbook only once.
     
-    if not file_path.exists():
-        raise FileNotFoundError(f"Excel file not found: {file_path}")
+    Same readers and error handling as read_excel_sheet(); returns the
+    DataFrames keyed by the requested sheet names.
+    """
+    file_path = Path(file_path)
+    label = ', '.join(f"'{name}'" for name in sheet_names)
     
-    logger.info(f"Reading Excel sheet '{sheet_name}' from {file_path}")
+    logger.info(f"Reading Excel sheet {label} from {file_path}")
     
     try:
-        df = pd.read_excel(file_path, sheet_name=sheet_name, **kwargs)
-        logger.info(f"Loaded {len(df)} rows from sheet '{sheet_name}'")
-        return df
+        # calamine is the fastest reader for every format when installed;
+        # otherwise plain xlsx reads stream through openpyxl's read-only mode
+        # and anything needing pd.read_excel options (or a legacy format)
+        # goes through pandas
+        if _PANDAS_CALAMINE and 'engine' not in kwargs:
+            frames = pd.read_excel(file_path, sheet_name=list(sheet_names), engine='calamine', **kwargs)
+        elif not kwargs and file_path.suffix.lower() in ('.xlsx', '.xlsm'):
+            frames = _read_xlsx_sheets(file_path, sheet_names)
+        else:
+            frames = pd.read_excel(file_path, sheet_name=list(sheet_names), **kwargs)
+        for name, df in frames.items():
+            logger.info(f"Loaded {len(df)} rows from sheet '{name}'")
+        return frames
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Excel file not found: {file_path}") from e
     except Exception as e:
-        logger.error(f"Error reading Excel sheet '{sheet_name}' from {file_path}: {e}")
-        raise ValueError(f"Could not read sheet '{sheet_name}': {e}")
+        logger.error(f"Error reading Excel sheet {label} from {file_path}: {e}")
+        raise ValueError(f"Could not read sheet {label}: {e}")
+
+
+def _read_xlsx(
+    file_path: Path,
+    sheet_name: Union[str, int] = 0,
+    max_rows: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Read one worksheet of an xlsx file into a DataFrame.
+    
+    Streams cell values through openpyxl's read-only mode instead of letting
+    pandas build the full workbook, which is much faster and lighter for
+    large sheets. At most max_rows + 1 data rows are read, so truncation is
+    still detected and reported by the caller.
+    
+    Raises:
+        KeyError: If the sheet name doesn't exist
+        IndexError: If the sheet index doesn't exist
+    """
+    return _read_xlsx_sheets(file_path, [sheet_name], max_rows)[sheet_name]
+
+
+def _read_xlsx_sheets(
+    file_path: Path,
+    sheet_names: List[Union[str, int]],
+    max_rows: Optional[int] = None
+) -> Dict[Union[str, int], pd.DataFrame]:
+    """Read several worksheets like _read_xlsx, opening the workbook only once."""
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        return {
+            name: _worksheet_to_dataframe(
+                wb.worksheets[name] if isinstance(name, int) else wb[name], max_rows
+            )
+            for name in sheet_names
+        }
+    finally:
+        wb.close()
+
+
+def _worksheet_to_dataframe(ws, max_rows: Optional[int] = None) -> pd.DataFrame:
+    """Build a DataFrame from a read-only worksheet, using its first row as header."""
+    rows = ws.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        return pd.DataFrame()
+    
+    limit = max_rows + 1 if max_rows is not None else None
+    data = list(islice(rows, limit))
+    
+    # Match pandas' handling of trailing blank rows and unnamed/duplicate headers
+    while data and all(value is None for value in data[-1]):
+        data.pop()
+    
+    # Read-only rows span the sheet's full dimension, which includes styled
+    # but empty cells; like pandas, drop trailing columns with no values
+    width = max(_row_width(row) for row in [header, *data])
+    if width < len(header):
+        header = header[:width]
+        data = [row[:width] for row in data]
+    
+    columns = []
+    for idx, name in enumerate(header):
+        name = f"Unnamed: {idx}" if name is None else name
+        base, dup = name, 0
+        while name in columns:
+            dup += 1
+            name = f"{base}.{dup}"
+        columns.append(name)
+    
+    df = pd.DataFrame(data, columns=columns)
+    
+    # Empty cells arrive as None; use NaN like pandas' own readers
+    obj_cols = df.select_dtypes(include='object').columns
+    df[obj_cols] = df[obj_cols].where(df[obj_cols].notna(), np.nan)
+    
+    # pandas parses all-empty columns as float64 (NaN), not object
+    if len(df):
+        empty_cols = [col for col in obj_cols if df[col].isna().all()]
+        if empty_cols:
+            df[empty_cols] = df[empty_cols].astype('float64')
+    return df
+
+
+def _row_width(row: tuple) -> int:
+    """Return the position after the last non-empty value of a row."""
+    for idx in range(len(row) - 1, -1, -1):
+        if row[idx] is not None:
+            return idx + 1
+    return 0
 
 
 def get_excel_sheet_names(file_path: Union[str, Path]) -> List[str]:
@@ -130,26 +294,58 @@ def get_excel_sheet_names(file_path: Union[str, Path]) -> List[str]:
     """
     file_path = Path(file_path)
     
-    if not file_path.exists():
-        raise FileNotFoundError(f"Excel file not found: {file_path}")
-    
-    excel_file = pd.ExcelFile(file_path)
-    return excel_file.sheet_names
+    # Cached per file version, so merges listing the same workbooks repeatedly
+    # open each one only once
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Excel file not found: {file_path}") from e
+    return list(_cached_sheet_names(str(file_path.resolve()), stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_sheet_names(resolved_path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Return the sheet names of a workbook; mtime_ns and size key the cache."""
+    if _HAS_CALAMINE:
+        # Reads only the workbook index, no sheet bodies
+        from python_calamine import CalamineWorkbook
+        return tuple(CalamineWorkbook.from_path(resolved_path).sheet_names)
+    
+    with pd.ExcelFile(resolved_path) as excel_file:
+        return tuple(excel_file.sheet_names)
 
 
 def csvs_to_excel(
     csv_files: List[Union[str, Path]],
     output_path: Union[str, Path],
     sheet_names: Optional[List[str]] = None,
+    dataframes: Optional[Dict[Union[str, Path], pd.DataFrame]] = None,
+    chunksize: Optional[int] = CSV_TO_EXCEL_CHUNKSIZE,
+    max_workers: Optional[int] = 1,
+    auto_width: bool = False,
     **kwargs
 ) -> None:
     """
     Convert multiple CSV files into a single Excel workbook with multiple sheets.
     
+    Each CSV is read in chunks and its rows streamed into the sheet with
+    openpyxl's write-only mode, so neither a whole CSV nor the workbook is
+    held in memory.
+    
     Args:
         csv_files: List of CSV file paths
         output_path: Path to output Excel file
         sheet_names: Optional list of sheet names (defaults to CSV filenames)
+        dataframes: Optional already-loaded DataFrames keyed by CSV path;
+                    these files are not read from disk again
+        chunksize: Rows read per CSV chunk (None = read each file at once)
+        max_workers: Worker processes used to parse the CSVs (None = one per
+                     CPU, 1 = stream serially). With more than one worker each
+                     CSV is parsed whole in parallel, so chunksize is ignored
+                     and the parsed files are held in memory until written.
+        auto_width: Size columns to their content while writing (no reload
+                    through apply_auto_column_width); a CSV streamed in
+                    chunks is sized from its first chunk
         **kwargs: Additional arguments passed to pd.read_csv
     
     Raises:
@@ -164,29 +360,128 @@ def csvs_to_excel(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Generate default sheet names if not provided
+    # Default to the CSV filenames; either way make the names valid and unique
     if sheet_names is None:
-        sheet_names = [Path(f).stem[:31] for f in csv_files]  # Excel sheet name limit is 31 chars
+        sheet_names = [Path(f).stem for f in csv_files]
+    used = set()
+    sheet_names = [safe_sheet_name(name, used=used) for name in sheet_names]
+    
+    preloaded = {Path(f): df for f, df in (dataframes or {}).items()}
     
     logger.info(f"Converting {len(csv_files)} CSV files to Excel: {output_path}")
     
-    with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
-        for csv_file, sheet_name in zip(csv_files, sheet_names):
-            try:
-                df = read_csv_chunked(csv_file, chunksize=None, **kwargs)
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-                logger.info(f"  Added sheet '{sheet_name}' with {len(df)} rows")
-            except Exception as e:
-                logger.error(f"  Error processing {csv_file}: {e}")
-                raise
+    pending = [f for f in csv_files if Path(f) not in preloaded]
+    workers = min(max_workers or os.cpu_count() or 1, len(pending))
+    if workers > 1:
+        # Parse in parallel; the workbook itself is still written serially,
+        # in the given sheet order
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                Path(f): executor.submit(read_csv_chunked, f, chunksize=None, **kwargs)
+                for f in pending
+            }
+            for path, future in futures.items():
+                preloaded[path] = future.result()
+    
+    wb = Workbook(write_only=True)
+    for csv_file, sheet_name in zip(csv_files, sheet_names):
+        try:
+            ws = wb.create_sheet(sheet_name)
+            df = preloaded.get(Path(csv_file))
+            if df is not None:
+                if auto_width:
+                    _set_sheet_column_widths(ws, df)
+                _append_dataframe_rows(ws, df)
+                n_rows = len(df)
+            else:
+                n_rows = _append_csv_rows(ws, csv_file, chunksize, auto_width, **kwargs)
+            logger.info(f"  Added sheet '{sheet_name}' with {n_rows} rows")
+        except Exception as e:
+            logger.error(f"  Error processing {csv_file}: {e}")
+            raise
+    wb.save(output_path)
     
     logger.info(f"Successfully created Excel file: {output_path}")
 
 
+def _append_csv_rows(
+    ws,
+    csv_file: Union[str, Path],
+    chunksize: Optional[int],
+    auto_width: bool = False,
+    **kwargs
+) -> int:
+    """
+    Stream a CSV file's rows into a (write-only) openpyxl worksheet.
+    
+    Column widths must be set before the first row is written, so with
+    auto_width a chunked read is sized from its first chunk.
+    
+    Returns:
+        Number of data rows written
+    """
+    if chunksize is None:
+        df = read_csv_chunked(csv_file, chunksize=None, **kwargs)
+        if auto_width:
+            _set_sheet_column_widths(ws, df)
+        _append_dataframe_rows(ws, df)
+        return len(df)
+    
+    n_rows = 0
+    with read_csv_chunked(csv_file, chunksize=chunksize, **kwargs) as reader:
+        for i, chunk in enumerate(reader):
+            if auto_width and i == 0:
+                _set_sheet_column_widths(ws, chunk)
+            _append_dataframe_rows(ws, chunk, header=(i == 0))
+            n_rows += len(chunk)
+    return n_rows
+
+
+def _append_dataframe_rows(ws, df: pd.DataFrame, header: bool = True) -> None:
+    """
+    Append a DataFrame's rows to a (write-only) openpyxl worksheet.
+    
+    Missing values (NaN/NaT) are written as empty cells.
+    """
+    if header:
+        ws.append([_header_cell(ws, col) for col in df.columns])
+    
+    # One vectorized pass swaps missing values for None instead of a
+    # pd.isna() call per cell
+    rows = df.astype(object).where(df.notna(), None)
+    for row in rows.itertuples(index=False, name=None):
+        ws.append(row)
+
+
+def _set_sheet_column_widths(ws, df: pd.DataFrame) -> None:
+    """
+    Size a worksheet's columns to a DataFrame's content.
+    
+    Works on openpyxl worksheets (including write-only ones, before any row
+    is appended) and on xlsxwriter worksheets.
+    """
+    for col_letter, width in get_column_widths_from_dataframe(df).items():
+        if hasattr(ws, 'set_column'):  # xlsxwriter
+            ws.set_column(f'{col_letter}:{col_letter}', width)
+        else:
+            ws.column_dimensions[col_letter].width = width
+
+
+def _header_cell(ws, value) -> WriteOnlyCell:
+    """Build a header cell styled like pandas' ExcelWriter header."""
+    cell = WriteOnlyCell(ws, value=str(value))
+    cell.font = _HEADER_FONT
+    cell.border = _HEADER_BORDER
+    cell.alignment = _HEADER_ALIGNMENT
+    return cell
+
+
 def write_dataframes_to_excel(
     dataframes: Dict[str, pd.DataFrame],
     output_path: Union[str, Path],
-    engine: str = 'xlsxwriter'
+    engine: str = 'xlsxwriter',
+    streaming: bool = False,
+    auto_width: bool = False
 ) -> None:
     """
     Write multiple DataFrames to an Excel file with named sheets.
@@ -195,6 +490,10 @@ def write_dataframes_to_excel(
         dataframes: Dictionary mapping sheet names to DataFrames
         output_path: Path to output Excel file
         engine: Excel writer engine ('xlsxwriter' or 'openpyxl')
+        streaming: If True, ignore engine and stream rows through openpyxl's
+                   write-only mode, keeping memory flat for large sheets
+        auto_width: Size columns to their content while writing, instead of
+                    reloading the file with apply_auto_column_width
     """
     if not dataframes:
         raise ValueError("dataframes dictionary cannot be empty")
@@ -204,12 +503,26 @@ def write_dataframes_to_excel(
     
     logger.info(f"Writing {len(dataframes)} sheets to Excel: {output_path}")
     
-    with pd.ExcelWriter(output_path, engine=engine) as writer:
-        for sheet_name, df in dataframes.items():
-            # Ensure sheet name is valid (max 31 chars, no special chars)
-            safe_sheet_name = sheet_name[:31].replace('/', '_').replace('\\', '_')
-            df.to_excel(writer, sheet_name=safe_sheet_name, index=False)
-            logger.info(f"  Wrote sheet '{safe_sheet_name}' with {len(df)} rows")
+    # Ensure sheet names are valid (max 31 chars, no special chars) and unique
+    used = set()
+    sheets = [(safe_sheet_name(name, used=used), df) for name, df in dataframes.items()]
+    
+    if streaming:
+        wb = Workbook(write_only=True)
+        for sheet_name, df in sheets:
+            ws = wb.create_sheet(sheet_name)
+            if auto_width:
+                _set_sheet_column_widths(ws, df)
+            _append_dataframe_rows(ws, df)
+            logger.info(f"  Wrote sheet '{sheet_name}' with {len(df)} rows")
+        wb.save(output_path)
+    else:
+        with pd.ExcelWriter(output_path, engine=engine) as writer:
+            for sheet_name, df in sheets:
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
+                if auto_width:
+                    _set_sheet_column_widths(writer.sheets[sheet_name], df)
+                logger.info(f"  Wrote sheet '{sheet_name}' with {len(df)} rows")
     
     logger.info(f"Successfully created Excel file: {output_path}")
 
@@ -8,6 +8,7 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
+import pandas as pd
 from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
 
@@ -36,6 +37,10 @@ def apply_auto_column_width(
     Adjusts column widths based on content length, respecting min/max bounds.
     Modifies the Excel file in-place.
     
+    For a file that is being written from DataFrames, pass auto_width=True
+    to write_dataframes_to_excel() or csvs_to_excel() instead; that sizes the
+    columns during the write and skips reloading and re-saving the file.
+    
     Args:
         excel_path: Path to Excel file
         sheet_name: Name of sheet to adjust (None = all sheets)
@@ -50,9 +55,6 @@ def apply_auto_column_width(
     """
     excel_path = Path(excel_path)
     
-    if not excel_path.exists():
-        raise FileNotFoundError(f"Excel file not found: {excel_path}")
-    
     # Use defaults if not provided
     config = DEFAULT_AUTO_WIDTH_CONFIG.copy()
     if min_width is not None:
@@ -66,20 +68,15 @@ def apply_auto_column_width(
     
     logger.info(f"Applying auto-width to {excel_path} with config: {config}")
     
-    wb = load_workbook(excel_path)
-    
-    # Determine which sheets to process
-    if sheet_name is not None:
-        if sheet_name not in wb.sheetnames:
-            raise ValueError(f"Sheet '{sheet_name}' not found in {excel_path}")
-        sheets_to_process = [wb[sheet_name]]
-    else:
-        sheets_to_process = wb.worksheets
+    # Pass 1: measure values with a streaming read-only scan, so no styled
+    # cell objects are built just to read their contents
+    sheet_widths = get_optimal_column_widths(excel_path, sheet_name, **config)
     
-    # Process each sheet
-    for ws in sheets_to_process:
-        _adjust_sheet_column_widths(ws, config)
-        logger.info(f"Adjusted column widths for sheet: {ws.title}")
+    # Pass 2: load the workbook normally only to store the widths
+    wb = load_workbook(excel_path)
+    for title, widths in sheet_widths.items():
+        _set_column_widths(wb[title], widths)
+        logger.info(f"Adjusted column widths for sheet: {title}")
     
     wb.save(excel_path)
     logger.info(f"Saved auto-width changes to {excel_path}")
@@ -111,9 +108,6 @@ def get_optimal_column_widths(
     """
     excel_path = Path(excel_path)
     
-    if not excel_path.exists():
-        raise FileNotFoundError(f"Excel file not found: {excel_path}")
-    
     config = DEFAULT_AUTO_WIDTH_CONFIG.copy()
     if min_width is not None:
         config['min_width'] = min_width
@@ -124,23 +118,24 @@ def get_optimal_column_widths(
     if header_factor is not None:
         config['header_factor'] = header_factor
     
-    wb = load_workbook(excel_path, read_only=True)
-    
-    # Determine which sheets to process
-    if sheet_name is not None:
-        if sheet_name not in wb.sheetnames:
-            raise ValueError(f"Sheet '{sheet_name}' not found in {excel_path}")
-        sheets_to_process = [wb[sheet_name]]
-    else:
-        sheets_to_process = wb.worksheets
-    
-    result = {}
-    for ws in sheets_to_process:
-        widths = _calculate_column_widths(ws, config)
-        result[ws.title] = widths
-    
-    wb.close()
-    return result
+    # Formulas are measured by their text: workbooks openpyxl has just
+    # written carry no cached results to measure instead
+    try:
+        wb = load_workbook(excel_path, read_only=True)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Excel file not found: {excel_path}") from e
+    try:
+        # Determine which sheets to process
+        if sheet_name is not None:
+            if sheet_name not in wb.sheetnames:
+                raise ValueError(f"Sheet '{sheet_name}' not found in {excel_path}")
+            sheets_to_process = [wb[sheet_name]]
+        else:
+            sheets_to_process = wb.worksheets
+        
+        return {ws.title: _calculate_column_widths(ws, config) for ws in sheets_to_process}
+    finally:
+        wb.close()
 
 
 # ============================================================================
@@ -149,45 +144,60 @@ def get_optimal_column_widths(
 
 def _adjust_sheet_column_widths(ws, config: Dict) -> None:
     """Adjust column widths for a single worksheet."""
-    widths = _calculate_column_widths(ws, config)
-    
+    _set_column_widths(ws, _calculate_column_widths(ws, config))
+
+
+def _set_column_widths(ws, widths: Dict[str, float]) -> None:
+    """Store column widths (keyed by column letter) on a worksheet."""
     for col_letter, width in widths.items():
         ws.column_dimensions[col_letter].width = width
 
 
 def _calculate_column_widths(ws, config: Dict) -> Dict[str, float]:
-    """Calculate optimal widths for all columns in a worksheet."""
-    min_width = config['min_width']
-    max_width = config['max_width']
-    padding = config['padding']
-    header_factor = config['header_factor']
-    
-    column_widths = {}
+    """
+    Calculate optimal widths for all columns in a worksheet.
     
-    # Iterate through columns
-    for col_idx, column in enumerate(ws.iter_cols(), start=1):
-        col_letter = get_column_letter(col_idx)
-        max_length = 0
-        
-        for idx, cell in enumerate(column):
-            if cell.value is not None:
-                cell_value = str(cell.value)
-                cell_length = len(cell_value)
-                
-                # Apply header factor to first row
-                if idx == 0:
-                    cell_length = int(cell_length * header_factor)
-                
-                max_length = max(max_length, cell_length)
-        
-        # Apply padding and bounds
-        optimal_width = max_length + padding
-        optimal_width = max(optimal_width, min_width)
-        optimal_width = min(optimal_width, max_width)
-        
-        column_widths[col_letter] = optimal_width
+    Cell values are read row by row (which also works on read-only
+    worksheets) and only a running maximum per column is kept, so memory
+    stays at one row regardless of the sheet size.
+    """
+    rows = ws.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        return {}
     
-    return column_widths
+    header_factor = config['header_factor']
+    max_lengths = [0 if value is None else int(len(str(value)) * header_factor) for value in header]
+    
+    for row in rows:
+        if len(row) > len(max_lengths):
+            max_lengths += [0] * (len(row) - len(max_lengths))
+        for col_idx, value in enumerate(row):
+            if value is not None:
+                length = len(str(value))
+                if length > max_lengths[col_idx]:
+                    max_lengths[col_idx] = length
+    
+    return {
+        get_column_letter(col_idx): _bounded_width(max_length, config)
+        for col_idx, max_length in enumerate(max_lengths, start=1)
+    }
+
+
+def _max_text_lengths(df: pd.DataFrame) -> List[int]:
+    """Return the length of the longest str() value in each column (missing values skipped)."""
+    lengths = []
+    for _, values in df.items():
+        values = values.dropna()
+        lengths.append(int(values.astype(str).str.len().max()) if len(values) else 0)
+    return lengths
+
+
+def _bounded_width(max_length: int, config: Dict) -> int:
+    """Apply padding and the min/max bounds to a content length."""
+    optimal_width = max_length + config['padding']
+    optimal_width = max(optimal_width, config['min_width'])
+    return min(optimal_width, config['max_width'])
 
 
 def apply_auto_width_to_writer(
@@ -267,30 +277,12 @@ def get_column_widths_from_dataframe(
     if header_factor is not None:
         config['header_factor'] = header_factor
     
-    min_width = config['min_width']
-    max_width = config['max_width']
-    padding = config['padding']
     header_factor = config['header_factor']
-    
-    column_widths = {}
-    
-    for col_idx, col_name in enumerate(df.columns, start=1):
-        col_letter = get_column_letter(col_idx)
-        
-        # Header length
-        max_length = int(len(str(col_name)) * header_factor)
-        
-        # Data lengths
-        if len(df) > 0:
-            col_data = df[col_name].astype(str)
-            max_data_length = col_data.str.len().max()
-            max_length = max(max_length, max_data_length)
-        
-        # Apply padding and bounds
-        optimal_width = max_length + padding
-        optimal_width = max(optimal_width, min_width)
-        optimal_width = min(optimal_width, max_width)
-        
-        column_widths[col_letter] = optimal_width
-    
-    return column_widths
+    data_lengths = _max_text_lengths(df)
+    
+    return {
+        get_column_letter(col_idx): _bounded_width(
+            max(int(len(str(col_name)) * header_factor), data_length), config
+        )
+        for col_idx, (col_name, data_length) in enumerate(zip(df.columns, data_lengths), start=1)
+    }
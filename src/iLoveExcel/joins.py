@@ -16,7 +16,6 @@ from .io import (
     read_excel_sheet,
     write_csv,
     write_dataframes_to_excel,
-    validate_file_exists,
     get_excel_sheet_names,
 )
 
@@ -30,6 +29,8 @@ def join_csvs(
     how: str = 'inner',
     output_file: Union[str, Path] = None,
     chunksize: Optional[int] = None,
+    df_left: Optional[pd.DataFrame] = None,
+    df_right: Optional[pd.DataFrame] = None,
     **kwargs
 ) -> pd.DataFrame:
     """
@@ -42,6 +43,8 @@ def join_csvs(
         how: Join type - 'inner', 'left', 'right', 'outer', or 'cross'
         output_file: Optional path to save result as CSV
         chunksize: Chunk size for reading (None = read all at once)
+        df_left: Optional already-loaded left DataFrame (file_left is not read)
+        df_right: Optional already-loaded right DataFrame (file_right is not read)
         **kwargs: Additional arguments passed to pd.merge
     
     Returns:
@@ -52,9 +55,6 @@ def join_csvs(
         FileNotFoundError: If input files don't exist
     """
     # Validate inputs
-    validate_file_exists(file_left)
-    validate_file_exists(file_right)
-    
     valid_how = ['inner', 'left', 'right', 'outer', 'cross']
     if how not in valid_how:
         raise ValueError(f"'how' must be one of {valid_how}, got '{how}'")
@@ -66,9 +66,11 @@ def join_csvs(
     if chunksize:
         logger.warning("chunksize parameter not fully implemented for joins - reading fully")
     
-    # Read both files
-    df_left = read_csv_chunked(file_left, chunksize=None)
-    df_right = read_csv_chunked(file_right, chunksize=None)
+    # Read both files (unless already loaded)
+    if df_left is None:
+        df_left = read_csv_chunked(file_left, chunksize=None)
+    if df_right is None:
+        df_right = read_csv_chunked(file_right, chunksize=None)
     
     # Validate join keys exist
     on_list = [on] if isinstance(on, str) else on
@@ -122,8 +124,6 @@ def join_excel_sheets(
     Returns:
         Joined DataFrame
     """
-    validate_file_exists(file_path)
-    
     logger.info(f"Joining sheets '{sheet_left}' and '{sheet_right}' from {file_path}")
     
     # Read both sheets
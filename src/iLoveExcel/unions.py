@@ -7,7 +7,7 @@ with optional deduplication and chunked processing for large files.
 
 import logging
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 import pandas as pd
 from tqdm import tqdm
@@ -38,9 +38,6 @@ def union_csvs(
         FileNotFoundError: If input files don't exist
         ValueError: If files have incompatible structures
     """
-    validate_file_exists(file_a)
-    validate_file_exists(file_b)
-    
     logger.info(f"Unioning {file_a} and {file_b} -> {output_file}")
     
     # Read both files
@@ -80,7 +77,8 @@ def union_multiple_csvs(
     dedupe: bool = False,
     dedupe_columns: Optional[List[str]] = None,
     chunksize: Optional[int] = None,
-    progress: bool = True
+    progress: bool = True,
+    dataframes: Optional[Dict[Union[str, Path], pd.DataFrame]] = None
 ) -> None:
     """
     Union multiple CSV files into a single output file with optional chunked processing.
@@ -88,10 +86,12 @@ def union_multiple_csvs(
     Args:
         files: List of CSV file paths to union
         output_csv: Path to output CSV file
-        dedupe: Whether to remove duplicate rows (applied at the end if chunksize is used)
+        dedupe: Whether to remove duplicate rows (streamed per chunk if chunksize is used)
         dedupe_columns: Columns to use for deduplication (None = all columns)
         chunksize: Number of rows per chunk for memory-efficient processing (None = load all)
         progress: Whether to show progress bar
+        dataframes: Optional already-loaded DataFrames keyed by CSV path;
+                    these files are not read from disk again
     
     Raises:
         ValueError: If files list is empty
@@ -108,6 +108,8 @@ def union_multiple_csvs(
     output_path = Path(output_csv)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
+    preloaded = {Path(f): df for f, df in (dataframes or {}).items()}
+    
     if chunksize is None:
         # Load all files into memory and concatenate
         dfs = []
@@ -115,7 +117,9 @@ def union_multiple_csvs(
         
         for file_path in iterator:
             try:
-                df = read_csv_chunked(file_path)
+                df = preloaded.get(Path(file_path))
+                if df is None:
+                    df = read_csv_chunked(file_path)
                 dfs.append(df)
             except Exception as e:
                 logger.error(f"Error reading {file_path}: {e}")
@@ -144,43 +148,75 @@ def union_multiple_csvs(
         logger.info(f"Using chunked processing with chunksize={chunksize}")
         first_file = True
         total_rows = 0
+        written_rows = 0
+        seen_hashes = set() if dedupe else None
         
         for file_idx, file_path in enumerate(files):
             logger.info(f"Processing file {file_idx + 1}/{len(files)}: {file_path}")
             
-            # Read file in chunks
-            chunk_iterator = read_csv_chunked(file_path, chunksize=chunksize)
+            # Read file in chunks (a preloaded DataFrame is written as one chunk)
+            df = preloaded.get(Path(file_path))
+            if df is None:
+                chunk_iterator = read_csv_chunked(file_path, chunksize=chunksize)
+            else:
+                chunk_iterator = [df]
             
             for chunk_idx, chunk in enumerate(chunk_iterator):
+                total_rows += len(chunk)
+                if dedupe:
+                    chunk = _drop_seen_rows(chunk, seen_hashes, dedupe_columns)
+                
                 mode = 'w' if first_file and chunk_idx == 0 else 'a'
                 write_csv(chunk, output_csv, mode=mode)
-                total_rows += len(chunk)
+                written_rows += len(chunk)
                 first_file = False
                 
                 if progress:
                     print(f"  Processed chunk {chunk_idx + 1} from {Path(file_path).name}: {len(chunk)} rows")
         
-        logger.info(f"Wrote {total_rows} total rows (before deduplication)")
-        
-        # If deduplication is requested, need to reload and dedupe
-        # (This is unavoidable - deduplication requires seeing all rows)
         if dedupe:
-            logger.info("Performing deduplication (requires reloading data)...")
-            df = read_csv_chunked(output_csv)
-            original_count = len(df)
-            
-            if dedupe_columns:
-                df = df.drop_duplicates(subset=dedupe_columns, keep='first')
-            else:
-                df = df.drop_duplicates(keep='first')
-            
-            removed = original_count - len(df)
-            logger.info(f"Removed {removed} duplicate rows")
-            write_csv(df, output_csv)
+            logger.info(f"Removed {total_rows - written_rows} duplicate rows")
+        logger.info(f"Wrote {written_rows} of {total_rows} total rows")
         
         logger.info(f"Successfully created union file: {output_csv}")
 
 
+def _drop_seen_rows(
+    chunk: pd.DataFrame,
+    seen_hashes: set,
+    dedupe_columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Drop rows of chunk whose 64-bit row hash was already seen, recording new hashes.
+    
+    Rows are hashed in vectorized form by pandas, so streaming deduplication
+    only keeps one integer per distinct row in memory instead of reloading
+    the whole output file.
+    
+    Args:
+        chunk: DataFrame chunk to filter
+        seen_hashes: Set of row hashes from earlier chunks (updated in place)
+        dedupe_columns: Columns to use for deduplication (None = all columns)
+    
+    Returns:
+        Chunk without rows that duplicate an earlier row (first occurrence kept)
+    """
+    key = chunk[dedupe_columns] if dedupe_columns else chunk
+    
+    # Each chunk infers its own dtypes, so the same value can be int64 in one
+    # chunk and float64 in another (e.g. when that chunk has a blank); hash
+    # all numbers as float64 so 1 and 1.0 match, as drop_duplicates would
+    numeric = {col: 'float64' for col, dtype in key.dtypes.items() if pd.api.types.is_numeric_dtype(dtype)}
+    hashes = pd.util.hash_pandas_object(key.astype(numeric), index=False).tolist()
+    
+    keep = []
+    for row_hash in hashes:
+        keep.append(row_hash not in seen_hashes)
+        seen_hashes.add(row_hash)
+    
+    return chunk[keep]
+
+
 def union_csvs_with_validation(
     files: List[Union[str, Path]],
     output_csv: Union[str, Path],
@@ -211,9 +247,8 @@ def union_csvs_with_validation(
     reference_columns = None
     
     for file_path in files:
-        validate_file_exists(file_path)
         # Read just the first row to get columns
-        df_sample = pd.read_csv(file_path, nrows=0)
+        df_sample = read_csv_chunked(file_path, nrows=0)
         
         if reference_columns is None:
             reference_columns = list(df_sample.columns)
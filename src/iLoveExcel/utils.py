@@ -8,7 +8,7 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional, Set, Union
 
 
 def setup_logging(
@@ -168,37 +168,49 @@ def truncate_string(s: str, max_length: int = 50, suffix: str = "...") -> str:
     return s[:max_length - len(suffix)] + suffix
 
 
-def safe_sheet_name(name: str, max_length: int = 31) -> str:
+# Characters Excel does not allow in sheet names
+_INVALID_SHEET_CHARS = str.maketrans({char: '_' for char in '/\\?*[]:'})
+
+
+def safe_sheet_name(name: str, max_length: int = 31, used: Optional[Set[str]] = None) -> str:
     """
     Convert a string to a valid Excel sheet name.
     
     Excel sheet names have restrictions:
     - Max 31 characters
-    - Cannot contain: / \\ ? * [ ]
+    - Cannot contain: / \\ ? * [ ] :
     - Cannot be empty
+    - Must be unique within a workbook (case-insensitively)
     
     Args:
         name: Proposed sheet name
         max_length: Maximum length (default 31 for Excel)
+        used: Optional set of names already taken in the workbook. A name
+              that collides gets a numeric suffix (_2, _3, ...) and the
+              result is added to the set.
     
     Returns:
         Valid sheet name
     """
-    if not name:
-        return "Sheet1"
-    
     # Replace invalid characters
-    invalid_chars = ['/', '\\', '?', '*', '[', ']']
-    for char in invalid_chars:
-        name = name.replace(char, '_')
+    name = (name or '').translate(_INVALID_SHEET_CHARS)
     
     # Truncate to max length
     name = name[:max_length]
     
     # Ensure not empty after processing
     if not name.strip():
-        return "Sheet1"
+        name = "Sheet1"
+    
+    if used is None:
+        return name
     
+    base, n = name, 1
+    while name.casefold() in used:
+        n += 1
+        suffix = f"_{n}"
+        name = base[:max_length - len(suffix)] + suffix
+    used.add(name.casefold())
     return name
 
 
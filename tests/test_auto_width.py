@@ -14,6 +14,7 @@ from iLoveExcel.io_helpers import (
     get_optimal_column_widths,
     get_column_widths_from_dataframe,
     apply_auto_width_to_writer,
+    DEFAULT_AUTO_WIDTH_CONFIG,
 )
 
 
@@ -174,6 +175,39 @@ def test_apply_auto_width_to_writer(tmp_path):
     assert len(df_read) == len(df)
 
 
+def test_auto_width_while_writing(sample_excel, tmp_path):
+    """Test that auto_width on write matches apply_auto_column_width on the file."""
+    from openpyxl import load_workbook
+    from iLoveExcel.io import write_dataframes_to_excel
+    
+    file_path, df = sample_excel
+    apply_auto_column_width(file_path)
+    expected = load_workbook(file_path)['TestSheet'].column_dimensions
+    
+    for kwargs in [{'engine': 'openpyxl'}, {'streaming': True}]:
+        output = tmp_path / "auto.xlsx"
+        write_dataframes_to_excel({'TestSheet': df}, output, auto_width=True, **kwargs)
+        dims = load_workbook(output)['TestSheet'].column_dimensions
+        for letter in 'ABCD':
+            assert dims[letter].width == expected[letter].width
+
+
+def test_formula_cells_measured_in_new_workbook(tmp_path):
+    """Test that formulas in a workbook openpyxl just wrote (no cached results) are sized."""
+    from openpyxl import Workbook
+    
+    file_path = tmp_path / "formulas.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = 'Sheet'
+    ws.append(['id', 'total'])
+    ws.append([1, '=SUM(A2:A2)+SUM(A2:A2)+SUM(A2:A2)'])
+    wb.save(file_path)
+    
+    widths = get_optimal_column_widths(file_path)['Sheet']
+    assert widths['B'] > DEFAULT_AUTO_WIDTH_CONFIG['min_width']
+
+
 def test_missing_file():
     """Test error handling for missing file."""
     with pytest.raises(FileNotFoundError):
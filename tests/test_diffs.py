@@ -11,6 +11,8 @@ import tempfile
 
 from iLoveExcel.diffs import (
     diff_csv_side_by_side,
+    diff_csv_to_excel_streaming,
+    diff_dataframes,
     export_diff_to_excel,
 )
 
@@ -84,6 +86,150 @@ def test_diff_by_key(sample_files):
     assert stats['matching'] > 0 or stats['different'] > 0
 
 
+def test_diff_status_per_row(tmp_path):
+    """Test per-row status assignment and side-by-side columns."""
+    file_a = tmp_path / "a.csv"
+    file_b = tmp_path / "b.csv"
+    
+    file_a.write_text("id,value\n1,x\n2,y\n3,\n")
+    file_b.write_text("id,value\n1,x\n2,z\n3,\n4,w\n")
+    
+    diff_df, stats = diff_csv_side_by_side(file_a, file_b, compare_by_index=True)
+    
+    assert diff_df['Status'].tolist() == ['MATCH', 'DIFF', 'MATCH', 'ONLY_B']
+    assert isinstance(diff_df['Status'].dtype, pd.CategoricalDtype)
+    assert list(diff_df.columns) == ['Row_Index', 'Status', 'id_A', 'id_B', 'value_A', 'value_B']
+    assert stats == {'total': 4, 'matching': 2, 'different': 1, 'only_a': 0, 'only_b': 1}
+
+
+def test_diff_parallel_matches_serial(tmp_path, monkeypatch):
+    """Test that slab-parallel comparison gives the same result as serial."""
+    from iLoveExcel import diffs
+    
+    file_a = tmp_path / "a.csv"
+    file_b = tmp_path / "b.csv"
+    file_a.write_text("id,value\n" + "".join(f"{i},{i}\n" for i in range(50)))
+    file_b.write_text("id,value\n" + "".join(f"{i},{i if i % 7 else -i}\n" for i in range(60)))
+    
+    serial = diff_csv_side_by_side(file_a, file_b)
+    monkeypatch.setattr(diffs, 'PARALLEL_COMPARE_CELLS', 0)
+    parallel = diff_csv_side_by_side(file_a, file_b)
+    
+    pd.testing.assert_frame_equal(serial[0], parallel[0])
+    assert serial[1] == parallel[1]
+
+
+def test_diff_text_values_compared_as_text(tmp_path):
+    """Test that text values are compared as text (e.g. "A01" differs from "A1")."""
+    file_a = tmp_path / "a.csv"
+    file_b = tmp_path / "b.csv"
+    file_a.write_text("id,code,city\n1,A01,NY\n2,B2,NY\n3,C3,LA\n4,D4,NY\n")
+    file_b.write_text("id,code,city\n1,A1,NY\n2,B2,NY\n3,C3,SF\n4,D4,NY\n")
+    
+    diff_df, stats = diff_csv_side_by_side(file_a, file_b)
+    
+    assert diff_df['Status'].tolist() == ['DIFF', 'MATCH', 'DIFF', 'MATCH']
+    assert diff_df['city_B'].tolist() == ['NY', 'NY', 'SF', 'NY']
+
+
+def test_diff_identical_files(tmp_path):
+    """Test that identical files (including blanks) match on every row."""
+    file_a = tmp_path / "a.csv"
+    file_a.write_text("id,value\n1,x\n2,\n3,z\n")
+    
+    diff_df, stats = diff_csv_side_by_side(file_a, file_a)
+    
+    assert diff_df['Status'].tolist() == ['MATCH'] * 3
+    assert stats == {'total': 3, 'matching': 3, 'different': 0, 'only_a': 0, 'only_b': 0}
+
+
+def test_cached_reads_match_and_are_not_modified(sample_files):
+    """Test that cached inputs give the same result under other options and stay unchanged."""
+    file_a, file_b = sample_files
+    
+    first, _ = diff_csv_side_by_side(file_a, file_b, key_columns=['id'], compare_by_index=False, use_cache=True)
+    cached, _ = diff_csv_side_by_side(
+        file_a, file_b, key_columns=['id'], compare_by_index=False, case_insensitive=True, use_cache=True
+    )
+    again, _ = diff_csv_side_by_side(file_a, file_b, key_columns=['id'], compare_by_index=False, use_cache=True)
+    
+    uncached, _ = diff_csv_side_by_side(
+        file_a, file_b, key_columns=['id'], compare_by_index=False, case_insensitive=True
+    )
+    pd.testing.assert_frame_equal(cached, uncached)
+    pd.testing.assert_frame_equal(again, first)
+
+
+def test_diff_dataframes_matches_files(sample_files):
+    """Test that comparing loaded DataFrames matches comparing the files."""
+    file_a, file_b = sample_files
+    
+    expected = diff_csv_side_by_side(file_a, file_b, key_columns=['id'], compare_by_index=False)
+    df_a = pd.read_csv(file_a)
+    df_a_before = df_a.copy()
+    result = diff_dataframes(df_a, pd.read_csv(file_b), key_columns=['id'], compare_by_index=False)
+    
+    pd.testing.assert_frame_equal(result[0], expected[0])
+    assert result[1] == expected[1]
+    pd.testing.assert_frame_equal(df_a, df_a_before)
+
+
+def test_loaded_files_released_before_compare(sample_files, monkeypatch):
+    """Test that the parsed inputs are freed before the comparison runs."""
+    import weakref
+    from iLoveExcel import diffs
+    
+    refs = []
+    read_file = diffs._read_file
+    
+    def tracking_read(*args, **kwargs):
+        df = read_file(*args, **kwargs)
+        refs.append(weakref.ref(df))
+        return df
+    
+    alive = []
+    status_codes = diffs._status_codes
+    
+    def tracking_status_codes(df_a, df_b):
+        alive.extend(ref() is not None for ref in refs)
+        return status_codes(df_a, df_b)
+    
+    monkeypatch.setattr(diffs, '_read_file', tracking_read)
+    monkeypatch.setattr(diffs, '_status_codes', tracking_status_codes)
+    diff_csv_side_by_side(*sample_files, key_columns=['id'], compare_by_index=False)
+    
+    assert alive == [False, False]
+
+
+def test_diff_by_key_statuses(sample_files):
+    """Test that key alignment reports rows missing from one side."""
+    file_a, file_b = sample_files
+    
+    diff_df, stats = diff_csv_side_by_side(
+        file_a,
+        file_b,
+        key_columns=['id'],
+        compare_by_index=False
+    )
+    
+    assert stats == {'total': 7, 'matching': 1, 'different': 2, 'only_a': 2, 'only_b': 2}
+    status_by_id = dict(zip(diff_df['id_A'].fillna(diff_df['id_B']), diff_df['Status']))
+    assert status_by_id == {1: 'MATCH', 2: 'DIFF', 3: 'DIFF', 4: 'ONLY_A', 5: 'ONLY_A', 6: 'ONLY_B', 7: 'ONLY_B'}
+
+
+def test_diff_by_key_suffix_like_columns(tmp_path):
+    """Test key alignment with column names that look like merge suffixes."""
+    file_a = tmp_path / "a.csv"
+    file_b = tmp_path / "b.csv"
+    file_a.write_text("id,x,x_A\n1,a,b\n2,c,d\n")
+    file_b.write_text("id,x,x_A\n2,c,e\n3,f,g\n")
+    
+    diff_df, stats = diff_csv_side_by_side(file_a, file_b, key_columns=['id'], compare_by_index=False)
+    
+    assert list(diff_df.columns) == ['Row_Index', 'Status', 'id_A', 'id_B', 'x_A', 'x_B', 'x_A_A', 'x_A_B']
+    assert diff_df['Status'].tolist() == ['ONLY_A', 'DIFF', 'ONLY_B']
+
+
 def test_show_only_diffs(sample_files):
     """Test filtering to show only differences."""
     file_a, file_b = sample_files
@@ -137,6 +283,25 @@ def test_ignore_whitespace(tmp_path):
     assert stats['matching'] > 0
 
 
+def test_ignore_whitespace_keeps_blanks(tmp_path):
+    """Test that normalization leaves missing values missing, not "nan"."""
+    file_a = tmp_path / "a.csv"
+    file_b = tmp_path / "b.csv"
+    
+    file_a.write_text("name,note\nAlice,\nBob,x\n")
+    file_b.write_text("name,note\n Alice ,\nBob, X \n")
+    
+    diff_df, stats = diff_csv_side_by_side(
+        file_a,
+        file_b,
+        ignore_whitespace=True,
+        case_insensitive=True
+    )
+    
+    assert diff_df['Status'].tolist() == ['MATCH', 'MATCH']
+    assert diff_df['note_A'].isna().tolist() == [True, False]
+
+
 def test_case_insensitive(tmp_path):
     """Test case-insensitive comparison."""
     file_a = tmp_path / "a.csv"
@@ -164,6 +329,19 @@ def test_case_insensitive(tmp_path):
     assert stats['matching'] > 0
 
 
+def test_diff_excel_input_matches_csv(sample_files, tmp_path):
+    """Test that an xlsx input is read like the equivalent CSV."""
+    file_a, file_b = sample_files
+    _, stats_csv = diff_csv_side_by_side(file_a, file_b, key_columns=['id'], compare_by_index=False)
+    
+    # Only the last suffix (or a compression suffix after .csv) selects the CSV reader
+    for name in ["sample_a.xlsx", "sample_a.csv.xlsx"]:
+        excel_a = tmp_path / name
+        pd.read_csv(file_a).to_excel(excel_a, index=False)
+        _, stats_xlsx = diff_csv_side_by_side(excel_a, file_b, key_columns=['id'], compare_by_index=False)
+        assert stats_xlsx == stats_csv
+
+
 def test_max_rows(sample_files):
     """Test max_rows parameter."""
     file_a, file_b = sample_files
@@ -207,6 +385,53 @@ def test_export_to_excel(sample_files, tmp_path):
     xls = pd.ExcelFile(output_file)
     assert 'Comparison' in xls.sheet_names
     assert 'Summary' in xls.sheet_names
+    
+    # Highlighting is stored as one conditional formatting rule per status
+    from openpyxl import load_workbook
+    ws = load_workbook(output_file)['Comparison']
+    rules = [rule for cf in ws.conditional_formatting for rule in cf.rules]
+    assert sorted(rule.formula[0] for rule in rules) == sorted(
+        f'$B2="{status}"' for status in ['MATCH', 'DIFF', 'ONLY_A', 'ONLY_B']
+    )
+
+
+def test_export_spills_large_only_sheets(tmp_path, monkeypatch):
+    """Test that oversized "only in" sheets go to a linked separate workbook."""
+    from iLoveExcel import diffs
+    
+    file_a = tmp_path / "a.csv"
+    file_b = tmp_path / "b.csv"
+    file_a.write_text("id,value\n1,x\n")
+    file_b.write_text("id,value\n1,x\n2,y\n3,z\n")
+    diff_df, stats = diff_csv_side_by_side(file_a, file_b)
+    
+    monkeypatch.setattr(diffs, 'SPILL_SHEET_ROWS', 1)
+    output_file = tmp_path / "diff.xlsx"
+    export_diff_to_excel(diff_df, stats, output_file)
+    
+    spilled = pd.read_excel(tmp_path / "diff_only_b.xlsx")
+    assert spilled['value_B'].tolist() == ['y', 'z']
+    assert not (tmp_path / "diff_only_a.xlsx").exists()
+    
+    sheets = pd.read_excel(output_file, sheet_name=None, header=None)
+    assert sheets['Only in File B'].iloc[0, 0] == "2 rows written to a separate workbook:"
+
+
+def test_streaming_export_matches_in_memory(sample_files, tmp_path):
+    """Test that the chunked CSV diff writes the same workbook as the in-memory path."""
+    file_a, file_b = sample_files
+    
+    diff_df, stats = diff_csv_side_by_side(file_a, file_b, compare_by_index=True)
+    export_diff_to_excel(diff_df, stats, tmp_path / "full.xlsx")
+    
+    streamed_stats = diff_csv_to_excel_streaming(file_a, file_b, tmp_path / "streamed.xlsx", chunksize=2)
+    
+    assert streamed_stats == stats
+    full = pd.read_excel(tmp_path / "full.xlsx", sheet_name=None)
+    streamed = pd.read_excel(tmp_path / "streamed.xlsx", sheet_name=None)
+    assert list(streamed) == list(full)
+    for sheet in full:
+        pd.testing.assert_frame_equal(streamed[sheet], full[sheet])
 
 
 def test_invalid_key_column(sample_files):
@@ -15,6 +15,7 @@ from iLoveExcel.io import (
     csvs_to_excel,
     get_excel_sheet_names,
     validate_file_exists,
+    write_dataframes_to_excel,
 )
 
 
@@ -105,6 +106,137 @@ class TestExcelOperations:
         sheet_names = get_excel_sheet_names(output_excel)
         assert 'Sheet1' in sheet_names
         assert 'Sheet2' in sheet_names
+    
+    def test_csvs_to_excel_streams_chunks(self, temp_dir):
+        """Test that a CSV read in several chunks is written as one sheet."""
+        csv1 = temp_dir / "file1.csv"
+        df = pd.DataFrame({'a': [1, 2, None, 4, 5], 'b': ['v', 'w', 'x', 'y', 'z']})
+        df.to_csv(csv1, index=False)
+        
+        output_excel = temp_dir / "output.xlsx"
+        csvs_to_excel([csv1], output_excel, chunksize=2)
+        
+        result = pd.read_excel(output_excel, sheet_name='file1')
+        pd.testing.assert_frame_equal(result, df)
+    
+    def test_csvs_to_excel_parallel_parse(self, temp_dir):
+        """Test that parsing CSVs in worker processes keeps sheet order and data."""
+        frames = {
+            'first': pd.DataFrame({'a': [1, 2, 3]}),
+            'second': pd.DataFrame({'b': ['x', 'y', 'z']}),
+            'third': pd.DataFrame({'c': [1.5, 2.5]}),
+        }
+        csv_files = []
+        for name, df in frames.items():
+            df.to_csv(temp_dir / f"{name}.csv", index=False)
+            csv_files.append(temp_dir / f"{name}.csv")
+        
+        output_excel = temp_dir / "output.xlsx"
+        csvs_to_excel(csv_files, output_excel, max_workers=2)
+        
+        assert get_excel_sheet_names(output_excel) == list(frames)
+        for name, df in frames.items():
+            pd.testing.assert_frame_equal(pd.read_excel(output_excel, sheet_name=name), df)
+    
+    def test_csvs_to_excel_deduplicates_sheet_names(self, temp_dir):
+        """Test that colliding or invalid default sheet names are made unique and valid."""
+        long_name = "x" * 40
+        csv_files = []
+        for sub in ['one', 'two']:
+            (temp_dir / sub).mkdir()
+            csv_files.append(temp_dir / sub / f"{long_name}.csv")
+            pd.DataFrame({'a': [1]}).to_csv(csv_files[-1], index=False)
+        
+        output_excel = temp_dir / "output.xlsx"
+        csvs_to_excel(csv_files, output_excel, sheet_names=None)
+        csvs_to_excel(csv_files[:1], temp_dir / "renamed.xlsx", sheet_names=['a:b?'])
+        
+        assert get_excel_sheet_names(output_excel) == ["x" * 31, "x" * 29 + "_2"]
+        assert get_excel_sheet_names(temp_dir / "renamed.xlsx") == ['a_b_']
+    
+    def test_csvs_to_excel_header_style_matches_pandas(self, temp_dir):
+        """Test that streamed sheets keep pandas' bold, bordered header row."""
+        from openpyxl import load_workbook
+        
+        csv1 = temp_dir / "file1.csv"
+        df = pd.DataFrame({'a': [1], 'b': ['x']})
+        df.to_csv(csv1, index=False)
+        
+        output_excel = temp_dir / "output.xlsx"
+        pandas_excel = temp_dir / "pandas.xlsx"
+        csvs_to_excel([csv1], output_excel)
+        df.to_excel(pandas_excel, sheet_name='file1', index=False)
+        
+        cell = load_workbook(output_excel)['file1']['A1']
+        expected = load_workbook(pandas_excel)['file1']['A1']
+        assert cell.font.b and cell.font.b == expected.font.b
+        assert cell.border.left.style == expected.border.left.style == 'thin'
+        assert cell.alignment.horizontal == expected.alignment.horizontal
+    
+    def test_csvs_to_excel_preloaded_dataframes(self, temp_dir):
+        """Test that preloaded DataFrames are written instead of re-reading."""
+        csv1 = temp_dir / "file1.csv"
+        pd.DataFrame({'a': [1, 2]}).to_csv(csv1, index=False)
+        
+        preloaded = pd.DataFrame({'a': [10, None], 'b': ['x', 'y']})
+        output_excel = temp_dir / "output.xlsx"
+        csvs_to_excel([csv1], output_excel, dataframes={str(csv1): preloaded})
+        
+        result = pd.read_excel(output_excel, sheet_name='file1')
+        assert list(result.columns) == ['a', 'b']
+        assert result['a'].iloc[0] == 10
+        assert pd.isna(result['a'].iloc[1])
+    
+    def test_read_excel_sheet_matches_pandas(self, temp_dir):
+        """Test that the read-only xlsx reader matches pd.read_excel."""
+        df = pd.DataFrame({'a': [1, None, 3], 'b': ['x', None, 'z']})
+        excel_file = temp_dir / "book.xlsx"
+        with pd.ExcelWriter(excel_file) as writer:
+            df.to_excel(writer, sheet_name='First', index=False)
+            df.to_excel(writer, sheet_name='Second', index=False)
+        
+        for sheet in ['Second', 1, 0]:
+            expected = pd.read_excel(excel_file, sheet_name=sheet)
+            pd.testing.assert_frame_equal(read_excel_sheet(excel_file, sheet), expected)
+        
+        with pytest.raises(ValueError):
+            read_excel_sheet(excel_file, 'Missing')
+    
+    def test_read_excel_sheet_ignores_styled_empty_cells(self, temp_dir):
+        """Test that styled empty cells and all-empty columns read like pd.read_excel."""
+        from openpyxl import load_workbook
+        from openpyxl.styles import Font
+        
+        df = pd.DataFrame({'a': [1, 2], 'empty': [None, None], 'b': ['x', 'y']})
+        excel_file = temp_dir / "styled.xlsx"
+        df.to_excel(excel_file, index=False)
+        wb = load_workbook(excel_file)
+        for cell in ('D1', 'E1', 'F1', 'F3'):
+            wb.active[cell].font = Font(bold=True)
+        wb.save(excel_file)
+        
+        expected = pd.read_excel(excel_file)
+        assert list(expected.columns) == ['a', 'empty', 'b']
+        pd.testing.assert_frame_equal(read_excel_sheet(excel_file), expected)
+
+    
+    def test_write_dataframes_to_excel_streaming(self, temp_dir):
+        """Test that streaming output matches the ExcelWriter output."""
+        dataframes = {
+            'Data': pd.DataFrame({'a': [1, None, 3], 'b': ['x', 'y', 'z']}),
+            'a/b': pd.DataFrame({'c': [1.5, 2.5]}),
+        }
+        buffered = temp_dir / "buffered.xlsx"
+        streamed = temp_dir / "streamed.xlsx"
+        write_dataframes_to_excel(dataframes, buffered)
+        write_dataframes_to_excel(dataframes, streamed, streaming=True)
+        
+        assert get_excel_sheet_names(streamed) == ['Data', 'a_b']
+        for sheet in ['Data', 'a_b']:
+            pd.testing.assert_frame_equal(
+                pd.read_excel(streamed, sheet_name=sheet),
+                pd.read_excel(buffered, sheet_name=sheet),
+            )
 
 
 class TestValidation:
@@ -69,6 +69,16 @@ class TestJoinCSVs:
         
         assert len(result) == 4  # All rows from left
     
+    def test_join_preloaded_dataframes(self, join_csv_files):
+        """Test that preloaded DataFrames are used instead of reading files."""
+        left, right = join_csv_files
+        df_right = pd.DataFrame({'id': [1], 'dept': ['Ops']})
+        
+        result = join_csvs(left, right, on='id', how='inner', df_right=df_right)
+        
+        assert result['dept'].tolist() == ['Ops']
+        assert result['name'].tolist() == ['Alice']
+    
     def test_invalid_join_type(self, join_csv_files, temp_dir):
         """Test that invalid join type raises error."""
         left, right = join_csv_files
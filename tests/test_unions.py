@@ -83,6 +83,40 @@ class TestUnionMultipleCSVs:
         df = pd.read_csv(output)
         assert len(df) == 6
     
+    def test_union_chunked_dedupe(self, temp_dir):
+        """Test streaming deduplication across chunks and files."""
+        csv1 = temp_dir / "chunk1.csv"
+        csv2 = temp_dir / "chunk2.csv"
+        pd.DataFrame({'id': [1, 2, 2, 3], 'v': ['a', 'b', 'b', 'c']}).to_csv(csv1, index=False)
+        pd.DataFrame({'id': [3, 4, 1], 'v': ['c', 'd', 'x']}).to_csv(csv2, index=False)
+        
+        output = temp_dir / "chunked_dedupe.csv"
+        union_multiple_csvs([csv1, csv2], output, dedupe=True, chunksize=2, progress=False)
+        df = pd.read_csv(output)
+        assert df['id'].tolist() == [1, 2, 3, 4, 1]
+        
+        output_keyed = temp_dir / "chunked_dedupe_keyed.csv"
+        union_multiple_csvs(
+            [csv1, csv2], output_keyed, dedupe=True, dedupe_columns=['id'], chunksize=2, progress=False
+        )
+        df = pd.read_csv(output_keyed)
+        assert df['id'].tolist() == [1, 2, 3, 4]
+    
+    def test_union_chunked_dedupe_mixed_numeric_dtypes(self, temp_dir):
+        """Test that a value read as int in one chunk and float in another is still a duplicate."""
+        csv1 = temp_dir / "ints.csv"
+        csv2 = temp_dir / "floats.csv"
+        csv1.write_text("id,v\n1,x\n")
+        csv2.write_text("id,v\n1,x\n,z\n")
+        
+        chunked = temp_dir / "chunked.csv"
+        in_memory = temp_dir / "in_memory.csv"
+        union_multiple_csvs([csv1, csv2], chunked, dedupe=True, chunksize=10, progress=False)
+        union_multiple_csvs([csv1, csv2], in_memory, dedupe=True, progress=False)
+        
+        assert pd.read_csv(chunked)['v'].tolist() == ['x', 'z']
+        assert pd.read_csv(in_memory)['v'].tolist() == ['x', 'z']
+    
     def test_union_empty_list_raises_error(self, temp_dir):
         """Test that empty file list raises error."""
         with pytest.raises(ValueError):